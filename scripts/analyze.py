@@ -138,6 +138,8 @@ Examples:
                        help='Print summary statistics')
     parser.add_argument('--charts', action='store_true',
                        help='Generate all visualization charts')
+    parser.add_argument('--dpi', type=int, default=150,
+                       help='Chart resolution; use 300 for final exports (default: 150)')
     parser.add_argument('--highlights', action='store_true',
                        help='Find and display interesting moments')
     parser.add_argument('--export-report', action='store_true',
@@ -166,7 +168,7 @@ Examples:
         # Do everything
         print_summary(games)
         print("\n📈 Generating all visualizations...")
-        generate_all_visualizations(games, f"{args.output_dir}/charts")
+        generate_all_visualizations(games, f"{args.output_dir}/charts", dpi=args.dpi)
         print("\n📝 Generating summary report...")
         export_summary_report(games, f"{args.output_dir}/summary_report.md")
         print("\n🎯 Generating highlights report...")
@@ -180,7 +182,7 @@ Examples:
 
         if args.charts:
             print("\n📈 Generating all visualizations...")
-            generate_all_visualizations(games, f"{args.output_dir}/charts")
+            generate_all_visualizations(games, f"{args.output_dir}/charts", dpi=args.dpi)
 
         if args.highlights:
             print_highlights(games)
@@ -79,6 +79,8 @@ def run_comparison_games(
                     print(f"    Error: {e}")
                     continue
 
+            runner.close()
+
         except Exception as e:
             print(f"Error initializing {mode} mode runner: {e}")
             continue
@@ -130,6 +132,8 @@ def run_format_comparison_games(
                     print(f"    Error: {e}")
                     continue
 
+            runner.close()
+
         except Exception as e:
             print(f"Error initializing runner with {fmt} format: {e}")
             continue
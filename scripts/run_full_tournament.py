@@ -313,6 +313,7 @@ def run_phase(phase_config: Dict, output_dir: Path) -> List[Dict]:
                 except Exception as e:
                     print(f"ERROR: {e}")
                     continue
+            runner.close()
 
             results.extend(exp_results)
 
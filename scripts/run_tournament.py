@@ -31,7 +31,7 @@ from src.elo import EloRating
 load_dotenv()
 
 
-def run_tournament(num_games: int = None, config_path: str = "config.yaml", mode: str = "text", prompt_format: str = "json", parallel: int = 1):
+def run_tournament(num_games: int = None, config_path: str = "config.yaml", mode: str = "text", prompt_format: str = "json", parallel: int = 1, use_cache: bool = True):
     """
     Run a full tournament using configuration file.
 
@@ -41,6 +41,7 @@ def run_tournament(num_games: int = None, config_path: str = "config.yaml", mode
         mode: Player mode ("text" or "mcp")
         prompt_format: Prompt format - "json", "json-minified", or "toon"
         parallel: Number of parallel games to run
+        use_cache: Reuse cached MCP-mode decisions from previous runs
     """
     print("=" * 60)
     print(f"LLM CATAN ARENA - TOURNAMENT MODE ({mode.upper()}, format={prompt_format})")
@@ -48,8 +49,11 @@ def run_tournament(num_games: int = None, config_path: str = "config.yaml", mode
         print(f"Running {parallel} games in parallel")
     print("=" * 60)
 
-    runner = CatanGameRunner(config_path, mode=mode, prompt_format=prompt_format)
-    results = runner.run_tournament(num_games=num_games, parallel=parallel)
+    runner = CatanGameRunner(config_path, mode=mode, prompt_format=prompt_format, use_response_cache=use_cache)
+    try:
+        results = runner.run_tournament(num_games=num_games, parallel=parallel)
+    finally:
+        runner.close()
 
     print("\n" + "=" * 60)
     print(f"Tournament Complete: {len(results)} games played")
@@ -66,7 +70,7 @@ def run_tournament(num_games: int = None, config_path: str = "config.yaml", mode
     print(elo.format_leaderboard())
 
 
-def run_single_game(players: list, config_path: str = "config.yaml", mode: str = "text", prompt_format: str = "json"):
+def run_single_game(players: list, config_path: str = "config.yaml", mode: str = "text", prompt_format: str = "json", use_cache: bool = True):
     """
     Run a single game with specified players.
 
@@ -76,6 +80,7 @@ def run_single_game(players: list, config_path: str = "config.yaml", mode: str =
         config_path: Path to configuration file
         mode: Default player mode ("text" or "mcp"), overridden by suffixes
         prompt_format: Prompt format - "json", "json-minified", or "toon"
+        use_cache: Reuse cached MCP-mode decisions from previous runs
     """
     if len(players) != 4:
         print("Error: Exactly 4 players required!")
@@ -91,8 +96,11 @@ def run_single_game(players: list, config_path: str = "config.yaml", mode: str =
     print("=" * 60)
     print(f"Players: {players}\n")
 
-    runner = CatanGameRunner(config_path, mode=mode, prompt_format=prompt_format)
-    result = runner.run_game(players)
+    runner = CatanGameRunner(config_path, mode=mode, prompt_format=prompt_format, use_response_cache=use_cache)
+    try:
+        result = runner.run_game(players)
+    finally:
+        runner.close()
 
     print("\n" + "=" * 60)
     print("GAME RESULTS")
@@ -188,17 +196,23 @@ def main():
         help='Number of games to run in parallel (default: 1). Recommended: 2-4 to avoid rate limits.'
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the persistent LLM response cache (always query the model in MCP mode)'
+    )
+
     args = parser.parse_args()
 
     # Determine mode
     if args.analyze:
         run_analysis()
     elif args.single_game:
-        run_single_game(args.single_game, args.config, args.mode, args.format)
+        run_single_game(args.single_game, args.config, args.mode, args.format, not args.no_cache)
     else:
         # Tournament mode
         num_games = args.games
-        run_tournament(num_games, args.config, args.mode, args.format, args.parallel)
+        run_tournament(num_games, args.config, args.mode, args.format, args.parallel, not args.no_cache)
 
 
 if __name__ == "__main__":
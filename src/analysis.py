@@ -234,7 +234,7 @@ def calculate_game_stats(games: List[Dict[str, Any]]) -> Dict[str, Any]:
                 end = datetime.fromisoformat(end_time)
                 duration = (end - start).total_seconds()
                 durations.append(duration)
-            except:
+            except (TypeError, ValueError):
                 pass
 
         # Scores
@@ -17,6 +17,7 @@ from llm_game_utils import OpenRouterClient, GameResultLogger
 from .players.text_based import ClaudePlayer, GPTPlayer, GeminiPlayer
 from .players import RandomPlayer
 from .elo import EloRating
+from .move_log_queue import QueuedMoveLogger
 
 # Define available colors (strings in Catanatron 3.x)
 COLORS = ["RED", "BLUE", "WHITE", "ORANGE"]
@@ -58,7 +59,13 @@ class CatanGameRunner:
     - Statistics tracking
     """
 
-    def __init__(self, config_path: str = "config.yaml", mode: str = "text", prompt_format: str = "json"):
+    def __init__(
+        self,
+        config_path: str = "config.yaml",
+        mode: str = "text",
+        prompt_format: str = "json",
+        use_response_cache: bool = True
+    ):
         """
         Initialize game runner.
 
@@ -67,13 +74,18 @@ class CatanGameRunner:
             mode: Default mode - "text" for text-based players, "mcp" for MCP-based players.
                   Can be overridden per-player using mode suffixes (e.g., "claude-mcp")
             prompt_format: Prompt format - "json", "json-minified", or "toon"
+            use_response_cache: Reuse cached MCP-mode decisions across runs
+                (only for models configured with temperature 0)
         """
         self.default_mode = mode
         self.prompt_format = prompt_format
+        self.use_response_cache = use_response_cache
         self.config = self._load_config(config_path)
-        self.logger = GameResultLogger(
+        # Players call log_move() on every decision; queue those writes so
+        # disk I/O stays off the decision path
+        self.logger = QueuedMoveLogger(GameResultLogger(
             output_dir=self.config["logging"]["output_dir"]
-        )
+        ))
 
         # Set up logging first
         logging.basicConfig(
@@ -83,7 +95,9 @@ class CatanGameRunner:
         self.log = logging.getLogger(__name__)
         self.log.info(f"Initializing game runner with default mode={mode}, format={prompt_format}")
 
-        # Initialize OpenRouter client (for text mode)
+        # Initialize OpenRouter client (for text mode). One client is shared by
+        # every text player and every parallel game, so its connection pool
+        # is reused across turns; don't create per-player clients.
         self.client = OpenRouterClient(
             app_name=self.config["openrouter"]["app_name"],
             site_url=self.config["openrouter"]["site_url"]
@@ -100,8 +114,9 @@ class CatanGameRunner:
         # Register model configurations
         self._register_models()
 
-        # MCP server initialized lazily when needed
+        # MCP server and response cache initialized lazily when needed
         self._mcp_server = None
+        self._response_cache = None
 
         # Initialize Elo rating system
         self.elo = EloRating(
@@ -119,6 +134,28 @@ class CatanGameRunner:
             self.log.info("MCP server initialized (lazy)")
         return self._mcp_server
 
+    @property
+    def response_cache(self):
+        """Lazily open the persistent response cache (None when disabled)."""
+        if not self.use_response_cache:
+            return None
+        if self._response_cache is None:
+            from .players.mcp_based import ResponseCache
+            cache_config = self.config.get("cache", {})
+            self._response_cache = ResponseCache(
+                path=cache_config.get("path", "data/cache/llm_responses.sqlite"),
+                ttl_days=cache_config.get("ttl_days", 30)
+            )
+            self.log.info(f"Response cache opened at {self._response_cache.path}")
+        return self._response_cache
+
+    def close(self):
+        """Flush and stop the move logger and close the response cache if opened."""
+        self.logger.close()
+        if self._response_cache is not None:
+            self._response_cache.close()
+            self._response_cache = None
+
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         with open(config_path, 'r') as f:
@@ -258,7 +295,8 @@ class CatanGameRunner:
             model_config=model_config,
             session_id=session_id,
             logger=self.logger,
-            mcp_server=self.mcp_server
+            mcp_server=self.mcp_server,
+            response_cache=self.response_cache
         )
 
     def run_game(self, player_specs: List[str], game_id: str = None) -> Dict[str, Any]:
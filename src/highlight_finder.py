@@ -187,7 +187,7 @@ def analyze_model_patterns(games: List[Dict[str, Any]]) -> Dict[str, Dict[str, A
                             duration = (current - prev).total_seconds()
                             if 0 < duration < 60:
                                 model_patterns[full_model]["avg_response_time"].append(duration)
-                        except:
+                        except (KeyError, TypeError, ValueError):
                             pass
 
                     prev_timestamp = move["timestamp"]
@@ -245,7 +245,7 @@ def get_game_details(games: List[Dict[str, Any]], session_id: str) -> Dict[str,
                     start_dt = datetime.fromisoformat(start)
                     end_dt = datetime.fromisoformat(end)
                     duration_minutes = (end_dt - start_dt).total_seconds() / 60
-                except:
+                except (TypeError, ValueError):
                     pass
 
             # Winner details
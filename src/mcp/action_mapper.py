@@ -5,7 +5,7 @@ Generates stable, human-readable action IDs for MCP tools
 and maintains bidirectional mapping to Catanatron Action objects.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import logging
 
 
@@ -33,6 +33,10 @@ class ActionMapper:
         self.actions: List[Any] = []
         self.id_to_action: Dict[str, Any] = {}
         self.action_to_id: Dict[int, str] = {}  # Using id() for hash
+        # Per-action string conversions, keyed by id() like action_to_id and
+        # cleared with each new action list
+        self._type_cache: Dict[int, Tuple[Any, str]] = {}
+        self._str_cache: Dict[int, Tuple[Any, str]] = {}
         self.log = logging.getLogger("ActionMapper")
 
     def set_actions(self, actions: List[Any]):
@@ -45,13 +49,15 @@ class ActionMapper:
         self.actions = actions
         self.id_to_action = {}
         self.action_to_id = {}
+        self._type_cache = {}
+        self._str_cache = {}
 
         for i, action in enumerate(actions):
             action_id = self._generate_action_id(action, i)
             self.id_to_action[action_id] = action
             self.action_to_id[id(action)] = action_id
 
-        self.log.debug(f"Mapped {len(actions)} actions")
+        self.log.debug("Mapped %d actions", len(actions))
 
     def _generate_action_id(self, action: Any, index: int) -> str:
         """
@@ -80,16 +86,7 @@ class ActionMapper:
         - "end_turn"
         """
         try:
-            # Get action type
-            if hasattr(action, 'action_type'):
-                action_type = str(action.action_type)
-                # Remove "ActionType." prefix if present
-                if "." in action_type:
-                    action_type = action_type.split(".")[-1]
-            else:
-                action_type = type(action).__name__
-
-            action_type_clean = action_type.lower()
+            action_type_clean = self._get_action_type(action).lower()
 
             # Build ID parts
             parts = [action_type_clean]
@@ -167,8 +164,29 @@ class ActionMapper:
             })
         return result
 
+    @staticmethod
+    def _memoized(cache: Dict[int, Tuple[Any, str]], action: Any,
+                  compute: Callable[[Any], str]) -> str:
+        """
+        Look up or compute a per-action string.
+
+        Entries keep a reference to their action and are checked with `is`,
+        so a recycled id() can never return another object's result.
+        """
+        entry = cache.get(id(action))
+        if entry is not None and entry[0] is action:
+            return entry[1]
+        result = compute(action)
+        cache[id(action)] = (action, result)
+        return result
+
     def _safe_action_str(self, action: Any) -> str:
-        """Safely convert action to string."""
+        """Safely convert action to string (memoized per action)."""
+        return self._memoized(self._str_cache, action, self._action_str_uncached)
+
+    @staticmethod
+    def _action_str_uncached(action: Any) -> str:
+        """Convert action to string, falling back to its class name."""
         try:
             # Try standard string conversion
             return str(action)
@@ -180,7 +198,12 @@ class ActionMapper:
                 return "Action"
 
     def _get_action_type(self, action: Any) -> str:
-        """Get action type as string."""
+        """Get action type as string (memoized per action)."""
+        return self._memoized(self._type_cache, action, self._action_type_uncached)
+
+    @staticmethod
+    def _action_type_uncached(action: Any) -> str:
+        """Get action type name without enum prefix, or the class name."""
         if hasattr(action, 'action_type'):
             action_type = str(action.action_type)
             # Remove enum prefix
@@ -9,6 +9,16 @@ from typing import Dict, Any, List
 import logging
 
 
+def _color_name(color) -> str:
+    """
+    Plain name ("RED") of a Catanatron Color enum or color string.
+
+    Tool results must not carry Color members: encoders disagree on enums
+    (orjson writes the value, json.dumps(default=str) writes "Color.RED").
+    """
+    return str(getattr(color, "value", color))
+
+
 class CatanatronGameWrapper:
     """
     Wraps Catanatron game state for JSON serialization.
@@ -52,7 +62,7 @@ class CatanatronGameWrapper:
         state = {
             "game_id": getattr(self.game, 'id', 'unknown'),
             "turn_number": len(self.game.state.actions),
-            "your_color": self.player_color,
+            "your_color": _color_name(self.player_color),
             "your_state": self._get_player_state(self.player_index),
             "opponents": self._get_opponents_state(),
             "development_cards_remaining": self._get_dev_cards_remaining(),
@@ -129,7 +139,7 @@ class CatanatronGameWrapper:
                 ps = self.game.state.player_state
 
                 opponents.append({
-                    "color": color,
+                    "color": _color_name(color),
                     "victory_points": ps.get(f"{prefix}VICTORY_POINTS", 0),
                     "resource_count": sum([
                         ps.get(f"{prefix}WOOD_IN_HAND", 0),
@@ -186,7 +196,7 @@ class CatanatronGameWrapper:
         for node_id, color in building_dict.items():
             buildings.append({
                 "node_id": str(node_id),
-                "color": color
+                "color": _color_name(color)
             })
         return buildings
 
@@ -198,7 +208,7 @@ class CatanatronGameWrapper:
         for edge_id, color in road_dict.items():
             roads.append({
                 "edge_id": str(edge_id),
-                "color": color
+                "color": _color_name(color)
             })
         return roads
 
@@ -5,14 +5,41 @@ Provides tool-based query interface to game state via function calls.
 Server lifecycle is per-decision: context is set before each decide() call.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+import asyncio
 import json
 import logging
 
+from . import toon
 from .game_wrapper import CatanatronGameWrapper
 from .action_mapper import ActionMapper
 from .tools import get_all_tools
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Result formats accepted by handle_tool_call()
+RESULT_FORMATS = ("json", "toon")
+
+# Tools whose (list/record-shaped) results are worth TOON-encoding
+TOON_TOOLS = frozenset({"get_game_state", "get_valid_actions"})
+
+# Tools that are pure functions of the decision context, safe to cache
+CACHEABLE_TOOLS = frozenset({"get_game_state", "get_valid_actions"})
+
+# Encoder for successful JSON results is picked once at import
+if ORJSON_AVAILABLE:
+    def _dumps_result(result: Dict[str, Any]) -> str:
+        """Serialize a tool result to compact JSON (orjson)."""
+        return orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+else:
+    def _dumps_result(result: Dict[str, Any]) -> str:
+        """Serialize a tool result to compact JSON (stdlib fallback)."""
+        return json.dumps(result, separators=(",", ":"), default=str)
+
 
 class CatanatronMCPServer:
     """
@@ -36,8 +63,32 @@ class CatanatronMCPServer:
         self.game_wrapper: Optional[CatanatronGameWrapper] = None
         self.action_mapper = ActionMapper(use_descriptive_ids=True)
         self.selected_action_id: Optional[str] = None
+        self._result_cache: Dict[tuple, str] = {}
         self.log = logging.getLogger(f"MCPServer:{game_id}")
 
+        # Tool schemas are static for the server's lifetime; build each
+        # provider format once so every request sends identical tool blocks
+        self._tools: Tuple[Dict[str, Any], ...] = tuple(get_all_tools())
+        self._anthropic_tools: Tuple[Dict[str, Any], ...] = tuple(
+            {
+                "name": tool["name"],
+                "description": tool["description"],
+                "input_schema": tool["input_schema"]
+            }
+            for tool in self._tools
+        )
+        self._openai_tools: Tuple[Dict[str, Any], ...] = tuple(
+            {
+                "type": "function",
+                "function": {
+                    "name": tool["name"],
+                    "description": tool["description"],
+                    "parameters": tool["input_schema"]
+                }
+            }
+            for tool in self._tools
+        )
+
     def set_game_context(self, game, player_color: str, playable_actions: list):
         """
         Set current game context for this decision.
@@ -51,9 +102,10 @@ class CatanatronMCPServer:
         self.game_wrapper = CatanatronGameWrapper(game, player_color)
         self.action_mapper.set_actions(playable_actions)
         self.selected_action_id = None
+        self._result_cache.clear()
         self.log.debug(
-            f"Context set for {player_color}: "
-            f"{len(playable_actions)} actions available"
+            "Context set for %s: %d actions available",
+            player_color, len(playable_actions)
         )
 
     def get_selected_action(self):
@@ -65,47 +117,160 @@ class CatanatronMCPServer:
         """
         if self.selected_action_id:
             action = self.action_mapper.get_action(self.selected_action_id)
-            self.log.debug(f"Retrieved selected action: {self.selected_action_id}")
+            self.log.debug("Retrieved selected action: %s", self.selected_action_id)
             return action
         else:
             self.log.warning("No action selected")
             return None
 
-    def get_tools(self) -> list:
-        """Get tool definitions for LLM."""
-        return get_all_tools()
+    def get_tools(self) -> Tuple[Dict[str, Any], ...]:
+        """Get tool definitions for LLM (shared, do not mutate)."""
+        return self._tools
+
+    def get_anthropic_tools(self) -> Tuple[Dict[str, Any], ...]:
+        """Get tool definitions in Anthropic Messages API format (shared, do not mutate)."""
+        return self._anthropic_tools
 
-    def handle_tool_call(self, tool_name: str, tool_input: dict) -> str:
+    def get_openai_tools(self) -> Tuple[Dict[str, Any], ...]:
+        """Get tool definitions in OpenAI function calling format (shared, do not mutate)."""
+        return self._openai_tools
+
+    def handle_tool_call(
+        self,
+        tool_name: str,
+        tool_input: dict,
+        result_format: str = "json"
+    ) -> str:
         """
         Handle a tool call from LLM.
 
         Args:
             tool_name: Name of tool being called
             tool_input: Input parameters as dict
+            result_format: "json" or "toon"; TOON only applies to
+                get_game_state / get_valid_actions results, errors stay JSON
+
+        Returns:
+            Serialized tool result
+        """
+        self.log.debug("Tool called: %s with input: %s", tool_name, tool_input)
+
+        if not self.game_wrapper:
+            return json.dumps(self._no_context_error())
+        return self._dispatch_tool_call(tool_name, tool_input, result_format)
+
+    def handle_tool_call_dict(self, tool_name: str, tool_input: dict) -> Dict[str, Any]:
+        """
+        Handle a tool call in-process, returning the result unserialized.
+
+        For callers that would only parse handle_tool_call()'s JSON back
+        (tests, local agents). Results are built fresh rather than read from
+        the serialized result cache, so the caller may mutate them.
+
+        Args:
+            tool_name: Name of tool being called
+            tool_input: Input parameters as dict
+
+        Returns:
+            Tool result dict (contains "error" on failure)
+        """
+        self.log.debug("Tool called: %s with input: %s", tool_name, tool_input)
+
+        if not self.game_wrapper:
+            return self._no_context_error()
+        return self._tool_result(tool_name, tool_input)
+
+    def handle_tool_calls(
+        self,
+        calls: List[Tuple[str, dict]],
+        result_format: str = "json"
+    ) -> List[str]:
+        """
+        Handle several tool calls from one LLM turn, in order.
+
+        The game context is checked once for the whole batch; results are
+        the same as calling handle_tool_call() for each entry.
+
+        Args:
+            calls: List of (tool_name, tool_input) pairs
+            result_format: "json" or "toon" (see handle_tool_call())
 
         Returns:
-            JSON string with tool result
+            Serialized tool results, one per call
         """
-        self.log.debug(f"Tool called: {tool_name} with input: {tool_input}")
+        self.log.debug("Batched tool calls: %s", [name for name, _ in calls])
 
         if not self.game_wrapper:
-            return json.dumps({
-                "error": "No game context set. Server not initialized for this decision."
-            })
+            return [json.dumps(self._no_context_error())] * len(calls)
+        return [
+            self._dispatch_tool_call(tool_name, tool_input, result_format)
+            for tool_name, tool_input in calls
+        ]
+
+    @staticmethod
+    def _no_context_error() -> Dict[str, Any]:
+        """Error result for tool calls made outside a decision."""
+        return {
+            "error": "No game context set. Server not initialized for this decision."
+        }
+
+    def _dispatch_tool_call(self, tool_name: str, tool_input: dict, result_format: str) -> str:
+        """Run one tool call against the current context (caller checks it is set)."""
+        cache_key = None
+        if tool_name in CACHEABLE_TOOLS:
+            cache_key = (tool_name, json.dumps(tool_input, sort_keys=True, default=str), result_format)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        result = self._tool_result(tool_name, tool_input)
+        if "error" in result:
+            return json.dumps(result)
+        if result_format == "toon" and tool_name in TOON_TOOLS:
+            serialized = toon.encode(result)
+        else:
+            serialized = _dumps_result(result)
 
+        if cache_key is not None:
+            self._result_cache[cache_key] = serialized
+        return serialized
+
+    def _tool_result(self, tool_name: str, tool_input: dict) -> Dict[str, Any]:
+        """Route one tool call to its handler (caller checks context is set)."""
         if tool_name == "get_game_state":
             return self._handle_get_game_state(tool_input)
-        elif tool_name == "get_valid_actions":
+        if tool_name == "get_valid_actions":
             return self._handle_get_valid_actions(tool_input)
-        elif tool_name == "select_action":
+        if tool_name == "select_action":
             return self._handle_select_action(tool_input)
-        else:
-            return json.dumps({
-                "error": f"Unknown tool: {tool_name}",
-                "available_tools": ["get_game_state", "get_valid_actions", "select_action"]
-            })
+        return {
+            "error": f"Unknown tool: {tool_name}",
+            "available_tools": ["get_game_state", "get_valid_actions", "select_action"]
+        }
+
+    async def ahandle_tool_call(
+        self,
+        tool_name: str,
+        tool_input: dict,
+        result_format: str = "json"
+    ) -> str:
+        """
+        Async variant of handle_tool_call().
+
+        Runs the handler in a worker thread so several tool calls from one
+        LLM turn can be awaited together without blocking the event loop.
+
+        Args:
+            tool_name: Name of tool being called
+            tool_input: Input parameters as dict
+            result_format: "json" or "toon"
+
+        Returns:
+            Serialized tool result
+        """
+        return await asyncio.to_thread(self.handle_tool_call, tool_name, tool_input, result_format)
 
-    def _handle_get_game_state(self, tool_input: dict) -> str:
+    def _handle_get_game_state(self, tool_input: dict) -> Dict[str, Any]:
         """Handle get_game_state tool call."""
         include_board = tool_input.get("include_board", False)
         include_history = tool_input.get("include_history", False)
@@ -115,42 +280,42 @@ class CatanatronMCPServer:
                 include_board=include_board,
                 include_history=include_history
             )
-            return json.dumps(state, indent=2)
+            return state
         except Exception as e:
             self.log.error(f"Error getting game state: {e}", exc_info=True)
-            return json.dumps({
+            return {
                 "error": f"Failed to get game state: {str(e)}"
-            })
+            }
 
-    def _handle_get_valid_actions(self, tool_input: dict) -> str:
+    def _handle_get_valid_actions(self, tool_input: dict) -> Dict[str, Any]:
         """Handle get_valid_actions tool call."""
         try:
             actions = self.action_mapper.get_all_actions_with_ids()
-            return json.dumps({
+            return {
                 "num_actions": len(actions),
                 "actions": actions
-            }, indent=2)
+            }
         except Exception as e:
             self.log.error(f"Error getting valid actions: {e}", exc_info=True)
-            return json.dumps({
+            return {
                 "error": f"Failed to get valid actions: {str(e)}"
-            })
+            }
 
-    def _handle_select_action(self, tool_input: dict) -> str:
+    def _handle_select_action(self, tool_input: dict) -> Dict[str, Any]:
         """Handle select_action tool call (marks selection, doesn't execute)."""
         action_id = tool_input.get("action_id")
 
         if not action_id:
-            return json.dumps({
+            return {
                 "error": "action_id is required",
                 "example": {"action_id": "build_settlement_42"}
-            })
+            }
 
         if not self.action_mapper.is_valid_action_id(action_id):
-            return json.dumps({
+            return {
                 "error": f"Invalid action_id: {action_id}",
                 "valid_action_ids": self.action_mapper.get_all_action_ids()
-            })
+            }
 
         # Mark action as selected
         self.selected_action_id = action_id
@@ -158,15 +323,16 @@ class CatanatronMCPServer:
 
         self.log.info(f"Action selected: {action_id}")
 
-        return json.dumps({
+        return {
             "success": True,
             "action_id": action_id,
             "action_description": self.action_mapper._safe_action_str(action),
             "message": "Action selected successfully. The game engine will execute it."
-        }, indent=2)
+        }
 
     def clear_context(self):
         """Clear game context after decision is complete."""
         self.game_wrapper = None
         self.selected_action_id = None
+        self._result_cache.clear()
         self.log.debug("Context cleared")
@@ -0,0 +1,131 @@
+"""
+TOON Encoder for MCP Tool Results
+
+Encodes JSON-compatible tool results in a compact, token-oriented notation.
+Field names are declared once in a header and values follow as
+pipe-delimited rows, which removes most of JSON's quoting and key repetition
+on the list/record-shaped data returned by get_game_state and
+get_valid_actions.
+
+Example:
+    num_actions: 2
+    actions[2]{action_id|action_type|details.value}:
+      build_road_1|BUILD_ROAD|(1, 2)
+      end_turn|END_TURN|
+    resources{wood|brick|sheep|wheat|ore}: 1|0|2|0|0
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+DELIMITER = "|"
+INDENT = "  "
+
+
+def encode(data: Any) -> str:
+    """
+    Encode a JSON-compatible value as TOON text.
+
+    Args:
+        data: Dict, list or scalar (as produced for json.dumps)
+
+    Returns:
+        TOON-formatted string
+    """
+    if isinstance(data, dict):
+        return "\n".join(_encode_dict(data, 0))
+    if isinstance(data, list):
+        return "\n".join(_encode_field("items", data, 0))
+    return _scalar(data)
+
+
+def _encode_dict(data: Dict[str, Any], depth: int) -> List[str]:
+    """Encode each key of a dict as one or more lines."""
+    lines = []
+    for key, value in data.items():
+        lines.extend(_encode_field(str(key), value, depth))
+    return lines
+
+
+def _encode_field(key: str, value: Any, depth: int) -> List[str]:
+    """Encode a single key/value pair at the given nesting depth."""
+    pad = INDENT * depth
+
+    if isinstance(value, dict):
+        if value and all(_is_scalar(v) for v in value.values()):
+            # Flat record: header with field names, single row of values
+            header = DELIMITER.join(str(k) for k in value)
+            row = DELIMITER.join(_scalar(v) for v in value.values())
+            return [f"{pad}{key}{{{header}}}: {row}"]
+        if not value:
+            return [f"{pad}{key}: {{}}"]
+        return [f"{pad}{key}:"] + _encode_dict(value, depth + 1)
+
+    if isinstance(value, list):
+        if not value:
+            return [f"{pad}{key}[0]:"]
+        if all(_is_scalar(v) for v in value):
+            return [f"{pad}{key}[{len(value)}]: {DELIMITER.join(_scalar(v) for v in value)}"]
+
+        columns = _table_columns(value)
+        if columns is not None:
+            lines = [f"{pad}{key}[{len(value)}]{{{DELIMITER.join(columns)}}}:"]
+            for item in value:
+                flat = _flatten(item)
+                lines.append(pad + INDENT + DELIMITER.join(_scalar(flat.get(c)) for c in columns))
+            return lines
+
+        # Irregular nested data stays JSON
+        return [f"{pad}{key}: {json.dumps(value, separators=(',', ':'), default=str)}"]
+
+    return [f"{pad}{key}: {_scalar(value)}"]
+
+
+def _table_columns(items: List[Any]) -> Optional[List[str]]:
+    """
+    Get column names for a list of records, or None if it isn't tabular.
+
+    Rows may contain one level of nested scalar dicts, which become dotted
+    columns (e.g. details.value). Keys missing from a row encode as empty.
+    """
+    columns: List[str] = []
+    seen = set()
+    for item in items:
+        if not isinstance(item, dict):
+            return None
+        for key, value in _flatten(item).items():
+            if not _is_scalar(value):
+                return None
+            if key not in seen:
+                seen.add(key)
+                columns.append(key)
+    return columns
+
+
+def _flatten(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten one level of nested dicts into dotted keys."""
+    flat = {}
+    for key, value in item.items():
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                flat[f"{key}.{sub_key}"] = sub_value
+        else:
+            flat[str(key)] = value
+    return flat
+
+
+def _is_scalar(value: Any) -> bool:
+    """Check whether a value encodes as a single cell."""
+    return not isinstance(value, (dict, list, tuple))
+
+
+def _scalar(value: Any) -> str:
+    """Encode a scalar cell value."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    text = str(value)
+    if DELIMITER in text or "\n" in text or text != text.strip():
+        return json.dumps(text)
+    return text
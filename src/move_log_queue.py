@@ -0,0 +1,101 @@
+"""
+Queued Move Logger for LLM Catan Arena.
+
+Wraps a GameResultLogger so per-move log_move() writes happen on a
+background thread instead of inside each player's decide() call.
+Session-level calls (start_session, end_session, ...) still run on the
+caller's thread, after all pending moves have been written.
+"""
+
+import atexit
+import functools
+import logging
+import queue
+import threading
+from typing import Any, Dict, Optional
+
+
+class QueuedMoveLogger:
+    """
+    Proxy around a GameResultLogger that queues log_move() calls.
+
+    A single daemon worker drains the queue in order. Any other attribute
+    is forwarded to the wrapped logger; method calls flush the queue first
+    so session summaries always include every move.
+    """
+
+    def __init__(self, logger):
+        """
+        Initialize proxy and start the writer thread.
+
+        Args:
+            logger: GameResultLogger (or compatible) instance to wrap
+        """
+        self._logger = logger
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self.log = logging.getLogger("QueuedMoveLogger")
+
+        self._worker = threading.Thread(
+            target=self._drain, name="move-logger", daemon=True
+        )
+        self._worker.start()
+        # Safety net for runners that are never closed; close() unregisters
+        # it so a closed logger isn't kept alive until interpreter exit
+        atexit.register(self.close)
+
+    def log_move(self, **kwargs):
+        """Queue a move for the writer thread (same kwargs as log_move)."""
+        # Checked and enqueued under the lock so no move lands behind the
+        # close() sentinel, where it would never be drained
+        with self._lock:
+            if not self._closed:
+                self._queue.put(kwargs)
+                return
+
+        # Closed: let queued moves finish first, then write directly
+        self.flush()
+        with self._lock:
+            self._logger.log_move(**kwargs)
+
+    def flush(self):
+        """Block until every queued move has been written."""
+        self._queue.join()
+
+    def close(self):
+        """Flush pending moves and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join()
+        atexit.unregister(self.close)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._logger, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def flushed_call(*args, **kwargs):
+            self.flush()
+            with self._lock:
+                return attr(*args, **kwargs)
+
+        return flushed_call
+
+    def _drain(self):
+        """Writer loop: write queued moves until the None sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                with self._lock:
+                    self._logger.log_move(**item)
+            except Exception as e:
+                self.log.error(f"Failed to log move: {e}")
+            finally:
+                self._queue.task_done()
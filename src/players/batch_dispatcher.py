@@ -0,0 +1,151 @@
+"""
+Anthropic Message Batches dispatcher.
+
+Collects Messages API requests from many players (e.g. parallel arena
+games) and submits them together through the Message Batches API, which
+is billed at half the standard price in exchange for batch-window latency.
+Callers block on a Future, so the sync decide() flow is unchanged.
+Shared by the text-based and MCP Claude players.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Any, Dict, List, Tuple
+
+# Cost multiplier for requests processed through the Message Batches API
+BATCH_COST_MULTIPLIER = 0.5
+
+
+class AnthropicBatchDispatcher:
+    """
+    Background dispatcher for the Anthropic Message Batches API.
+
+    Requests are flushed as one batch when max_batch_size requests are
+    pending or the oldest pending request has waited max_wait seconds.
+    Each batch is polled in its own thread so new requests keep queuing.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_batch_size: int = 50,
+        max_wait: float = 5.0,
+        poll_interval: float = 10.0
+    ):
+        """
+        Initialize dispatcher.
+
+        Args:
+            client: anthropic.Anthropic client
+            max_batch_size: Flush when this many requests are pending
+            max_wait: Flush when the oldest request has waited this long (seconds)
+            poll_interval: Seconds between batch status checks
+        """
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.poll_interval = poll_interval
+
+        self._pending: List[Tuple[str, Dict[str, Any], Future]] = []
+        self._oldest: float = 0.0
+        self._cond = threading.Condition()
+        self._closed = False
+        self.log = logging.getLogger("AnthropicBatchDispatcher")
+
+        self._thread = threading.Thread(target=self._run, name="batch-dispatcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, params: Dict[str, Any]) -> Future:
+        """
+        Queue a messages.create() request.
+
+        Args:
+            params: Keyword arguments for messages.create()
+
+        Returns:
+            Future resolving to the response Message
+        """
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Batch dispatcher is closed")
+            if not self._pending:
+                self._oldest = time.monotonic()
+            self._pending.append((uuid.uuid4().hex, params, future))
+            self._cond.notify()
+        return future
+
+    def close(self):
+        """Flush pending requests and stop accepting new ones."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self):
+        """Dispatcher loop: wait for a full batch or the wait deadline, then flush."""
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if len(self._pending) >= self.max_batch_size:
+                        break
+                    if self._pending:
+                        remaining = self._oldest + self.max_wait - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+
+                batch = self._pending[:self.max_batch_size]
+                self._pending = self._pending[self.max_batch_size:]
+                if self._pending:
+                    self._oldest = time.monotonic()
+                closed = self._closed
+
+            if batch:
+                threading.Thread(
+                    target=self._process_batch, args=(batch,), name="batch-poller", daemon=True
+                ).start()
+            if closed and not batch:
+                return
+
+    def _process_batch(self, batch: List[Tuple[str, Dict[str, Any], Future]]):
+        """Submit one batch, poll until it ends and resolve its futures."""
+        futures = {custom_id: future for custom_id, _, future in batch}
+        try:
+            message_batch = self.client.messages.batches.create(
+                requests=[
+                    {"custom_id": custom_id, "params": params}
+                    for custom_id, params, _ in batch
+                ]
+            )
+            self.log.info(f"Submitted batch {message_batch.id} with {len(batch)} requests")
+
+            while message_batch.processing_status != "ended":
+                time.sleep(self.poll_interval)
+                message_batch = self.client.messages.batches.retrieve(message_batch.id)
+
+            for entry in self.client.messages.batches.results(message_batch.id):
+                future = futures.pop(entry.custom_id, None)
+                if future is None:
+                    continue
+                if entry.result.type == "succeeded":
+                    future.set_result(entry.result.message)
+                else:
+                    future.set_exception(
+                        RuntimeError(f"Batch request {entry.result.type}: {entry.custom_id}")
+                    )
+
+        except Exception as e:
+            self.log.error(f"Batch processing failed: {e}", exc_info=True)
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for custom_id, future in futures.items():
+            future.set_exception(RuntimeError(f"No batch result for request {custom_id}"))
@@ -8,9 +8,11 @@ Supports any model with tool calling capability through OpenRouter.
 from .base_mcp_player import BaseMCPPlayer
 from .mcp_claude_player import MCPClaudePlayer
 from .openrouter_tools_player import OpenRouterToolsPlayer
+from .response_cache import ResponseCache
 
 __all__ = [
     "BaseMCPPlayer",
     "MCPClaudePlayer",
     "OpenRouterToolsPlayer",
+    "ResponseCache",
 ]
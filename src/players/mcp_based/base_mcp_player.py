@@ -5,15 +5,100 @@ Abstract base class for LLM players using MCP (Model Context Protocol)
 to query game state via structured tools.
 """
 
+import asyncio
+import functools
 import logging
 import random
 from abc import ABC, abstractmethod
-from typing import List, Any, Dict, Optional
+from collections import deque
+from itertools import islice
+from typing import List, Any, Dict, Optional, Tuple
 
 from catanatron.models.player import Player
 from llm_game_utils import GameResultLogger
 
 from ...mcp.server import CatanatronMCPServer
+from .response_cache import ResponseCache
+
+# Process-wide MCP servers shared by all MCP players, keyed by player color.
+# Converted tool schemas are cached on each server (see get_anthropic_tools()).
+_MCP_SERVER_CACHE: Dict[str, CatanatronMCPServer] = {}
+_CACHE_STATS = {"server_hits": 0, "server_misses": 0}
+
+# Longest action description stored per logged move
+MAX_LOGGED_ACTION_CHARS = 120
+
+
+@functools.lru_cache(maxsize=4096)
+def _action_str(action) -> str:
+    """String form of an action; Catanatron actions are hashable namedtuples."""
+    return str(action)
+
+
+@functools.lru_cache(maxsize=8)
+def _static_system_prompt(color, extra_instructions: str) -> str:
+    """
+    Build the static MCP system prompt for a color.
+
+    Args:
+        color: Catanatron color
+        extra_instructions: Subclass-specific instructions appended to the tips
+
+    Returns:
+        System prompt string
+    """
+    return f"""You are an expert Settlers of Catan player playing as {color}.
+
+Your goal is to win the game by reaching 10 victory points.
+
+You have access to MCP (Model Context Protocol) tools to explore the game state:
+1. **get_game_state** - View your resources, buildings, victory points, and opponent info
+2. **get_valid_actions** - See all actions you can take right now
+3. **select_action** - Choose an action by its action_id
+
+Process:
+1. Call get_game_state to understand the current situation
+2. Call get_valid_actions to see what you can do
+3. Analyze the options strategically
+4. Call select_action with your chosen action_id
+
+Strategy tips:
+- Focus on reaching 10 victory points efficiently
+- Manage resources carefully - build when you can
+- Consider opponent positions and threats
+- Longest road and largest army give bonus points
+- Settlements are worth 1 VP, cities 2 VP
+- Development cards can provide VPs and strategic advantages{extra_instructions}
+
+Make your decision now by using the MCP tools."""
+
+
+def _map_fingerprint(game) -> Optional[Dict[str, List[Tuple[str, ...]]]]:
+    """
+    Describe the board layout (land tiles and ports).
+
+    Args:
+        game: Catanatron game instance
+
+    Returns:
+        Dict with sorted "tiles" as (coordinate, resource, number) and sorted
+        "ports" as (resource, node ids), or None if unavailable. A None port
+        resource is a 3:1 port.
+    """
+    try:
+        catan_map = game.state.board.map
+        return {
+            "tiles": sorted(
+                (str(coordinate), str(tile.resource), str(tile.number))
+                for coordinate, tile in catan_map.land_tiles.items()
+            ),
+            "ports": sorted(
+                (str(resource), ",".join(map(str, sorted(nodes))))
+                for resource, nodes in catan_map.port_nodes.items()
+            ),
+        }
+    except (AttributeError, TypeError):
+        return None
 
 
 class BaseMCPPlayer(Player, ABC):
@@ -35,7 +120,8 @@ class BaseMCPPlayer(Player, ABC):
         session_id: str = None,
         logger: GameResultLogger = None,
         mcp_server: CatanatronMCPServer = None,
-        is_bot: bool = True
+        is_bot: bool = True,
+        response_cache: Optional[ResponseCache] = None
     ):
         """
         Initialize base MCP player.
@@ -47,19 +133,44 @@ class BaseMCPPlayer(Player, ABC):
             logger: GameResultLogger instance
             mcp_server: Shared MCP server instance (or None to create new)
             is_bot: Whether this is a bot player
+            response_cache: Persistent prompt -> action cache (or None to disable)
         """
         super().__init__(color, is_bot)
         self.model_name = model_name
         self.session_id = session_id
         self.logger = logger
-        self.mcp_server = mcp_server or CatanatronMCPServer(f"catan_{color}")
-        self.recent_moves = []
+        self.mcp_server = mcp_server or self._get_cached_server(color)
+        self.recent_moves = deque(maxlen=5)
         self.total_cost = 0.0
         self.total_tokens = 0
         self.move_count = 0
+        self.auto_moves = 0
+        self.response_cache = response_cache
+        self.cache_hits = 0
 
         self.log = logging.getLogger(f"{self.__class__.__name__}:{color}")
 
+    @staticmethod
+    def _get_cached_server(color) -> CatanatronMCPServer:
+        """Get the process-wide MCP server for a color, creating it on first use."""
+        key = str(color)
+        server = _MCP_SERVER_CACHE.get(key)
+        if server is None:
+            _CACHE_STATS["server_misses"] += 1
+            server = CatanatronMCPServer(f"catan_{color}")
+            _MCP_SERVER_CACHE[key] = server
+        else:
+            _CACHE_STATS["server_hits"] += 1
+        return server
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, int]:
+        """Get hit/miss counters and size of the shared server cache."""
+        return {
+            **_CACHE_STATS,
+            "servers_cached": len(_MCP_SERVER_CACHE),
+        }
+
     @abstractmethod
     def query_llm_with_mcp(
         self,
@@ -84,6 +195,26 @@ class BaseMCPPlayer(Player, ABC):
         """
         pass
 
+    async def aquery_llm_with_mcp(
+        self,
+        system_prompt: str,
+        mcp_server: CatanatronMCPServer
+    ) -> tuple[str, float, int]:
+        """
+        Async variant of query_llm_with_mcp().
+
+        Defaults to running the blocking implementation in a worker thread;
+        subclasses with a native async client override this.
+
+        Args:
+            system_prompt: Initial instructions for LLM
+            mcp_server: MCP server with tools
+
+        Returns:
+            Tuple of (response_text, cost, tokens_used)
+        """
+        return await asyncio.to_thread(self.query_llm_with_mcp, system_prompt, mcp_server)
+
     def decide(self, game, playable_actions):
         """
         Main decision method called by Catanatron.
@@ -95,101 +226,270 @@ class BaseMCPPlayer(Player, ABC):
         Returns:
             Selected action from playable_actions
         """
+        if len(playable_actions) == 1:
+            return self._auto_decision(playable_actions[0])
+
         try:
-            # Set game context in MCP server
-            self.mcp_server.set_game_context(game, self.color, playable_actions)
+            system_prompt = self._begin_decision(game, playable_actions)
 
-            # Build system prompt
-            system_prompt = self._build_system_prompt(game)
+            cache_key = self._response_cache_key(game, system_prompt, playable_actions)
+            if self._select_cached_action(cache_key, playable_actions):
+                return self._finish_decision(playable_actions, "Cached response", 0.0, 0)
 
             # Query LLM with MCP tools
             self.log.debug("Querying LLM with MCP tools")
             response, cost, tokens = self.query_llm_with_mcp(system_prompt, self.mcp_server)
+            self._store_cached_action(cache_key, playable_actions, tokens)
 
-            # Update stats
-            self.total_cost += cost
-            self.total_tokens += tokens
-            self.move_count += 1
-
-            # Get selected action from MCP server
-            selected_action = self.mcp_server.get_selected_action()
-
-            if not selected_action:
-                self.log.warning("LLM did not select action via MCP, falling back")
-                selected_action = self._fallback_action(playable_actions)
-
-            # Log the move
-            if self.logger and self.session_id:
-                self.logger.log_move(
-                    session_id=self.session_id,
-                    player=str(self.color),
-                    move_data={
-                        "action": self._safe_action_str(selected_action),
-                        "response": response[:200],  # First 200 chars
-                        "cost": cost,
-                        "tokens": tokens,
-                        "mode": "mcp"
-                    },
-                    turn_number=self.move_count
-                )
+            return self._finish_decision(playable_actions, response, cost, tokens)
 
-            # Track for context
-            self.recent_moves.append(self._safe_action_str(selected_action))
-            if len(self.recent_moves) > 5:
-                self.recent_moves = self.recent_moves[-5:]
+        except Exception as e:
+            self.log.error(f"Error in decide(): {e}", exc_info=True)
+            return self._fallback_action(playable_actions)
+
+    async def adecide(self, game, playable_actions):
+        """
+        Async variant of decide() for callers driving players from an event loop.
 
-            # Clear context for next decision
-            self.mcp_server.clear_context()
+        Players deciding concurrently must not share an MCP server, since the
+        server holds the context of a single decision.
 
-            return selected_action
+        Args:
+            game: Complete game state
+            playable_actions: List of valid actions
+
+        Returns:
+            Selected action from playable_actions
+        """
+        if len(playable_actions) == 1:
+            return self._auto_decision(playable_actions[0])
+
+        try:
+            system_prompt = self._begin_decision(game, playable_actions)
+
+            cache_key = self._response_cache_key(game, system_prompt, playable_actions)
+            if self._select_cached_action(cache_key, playable_actions):
+                return self._finish_decision(playable_actions, "Cached response", 0.0, 0)
+
+            self.log.debug("Querying LLM with MCP tools (async)")
+            response, cost, tokens = await self.aquery_llm_with_mcp(system_prompt, self.mcp_server)
+            self._store_cached_action(cache_key, playable_actions, tokens)
+
+            return self._finish_decision(playable_actions, response, cost, tokens)
 
         except Exception as e:
-            self.log.error(f"Error in decide(): {e}", exc_info=True)
+            self.log.error(f"Error in adecide(): {e}", exc_info=True)
             return self._fallback_action(playable_actions)
 
+    def _auto_decision(self, action):
+        """
+        Play the only legal action without querying the LLM.
+
+        Args:
+            action: The single playable action
+
+        Returns:
+            The action
+        """
+        self.move_count += 1
+        self.auto_moves += 1
+        self.recent_moves.append(self._safe_action_str(action))
+        return action
+
+    def _begin_decision(self, game, playable_actions) -> str:
+        """
+        Set game context in the MCP server and build the system prompt.
+
+        Args:
+            game: Complete game state
+            playable_actions: List of valid actions
+
+        Returns:
+            System prompt string
+        """
+        self.mcp_server.set_game_context(game, self.color, playable_actions)
+        return self._build_system_prompt(game)
+
+    def _response_cache_key(self, game, system_prompt: str, playable_actions) -> Optional[bytes]:
+        """
+        Build the response cache key for this decision.
+
+        The key covers the model, sampling parameters, full prompt, game
+        state, board layout and legal actions. Returns None (no caching) if
+        there is no cache, the player samples (temperature != 0), or the map
+        layout can't be fingerprinted: replaying one sampled decision for the
+        cache's whole TTL would skew benchmark results and cost stats.
+        """
+        if self.response_cache is None or getattr(self, "temperature", None) != 0:
+            return None
+
+        map_layout = _map_fingerprint(game)
+        if map_layout is None:
+            return None
+
+        state = self.mcp_server.game_wrapper.get_state(include_board=True)
+        state.pop("game_id", None)
+        state["map"] = map_layout
+
+        return ResponseCache.make_key(
+            getattr(self, "model_id", self.model_name),
+            f"{system_prompt}\n{self._build_user_message()}",
+            state,
+            [self._safe_action_str(action) for action in playable_actions],
+            sampling={
+                "temperature": self.temperature,
+                "max_tokens": getattr(self, "max_tokens", None),
+            }
+        )
+
+    def _select_cached_action(self, cache_key: Optional[bytes], playable_actions) -> bool:
+        """
+        Select the cached action via the MCP server on a valid cache hit.
+
+        Returns:
+            True if a cached action was selected
+        """
+        if cache_key is None:
+            return False
+
+        entry = self.response_cache.get(cache_key)
+        if entry is None:
+            return False
+
+        action_idx, action_str = entry
+        # The key sorts the action strings, so the same legal set may arrive
+        # in another order: the stored index is only a fast path
+        if action_idx < len(playable_actions) and \
+                self._safe_action_str(playable_actions[action_idx]) == action_str:
+            action = playable_actions[action_idx]
+        else:
+            action = next(
+                (a for a in playable_actions if self._safe_action_str(a) == action_str), None
+            )
+            if action is None:
+                return False
+
+        action_id = self.mcp_server.action_mapper.get_action_id(action)
+        if action_id is None:
+            return False
+
+        self.mcp_server.handle_tool_call("select_action", {"action_id": action_id})
+        self.cache_hits += 1
+        self.log.debug("Response cache hit: %s", action_str)
+        return True
+
+    def _store_cached_action(self, cache_key: Optional[bytes], playable_actions, tokens: int):
+        """Store the action the LLM selected (fallbacks are never cached)."""
+        if cache_key is None or not self.mcp_server.selected_action_id:
+            return
+
+        action = self.mcp_server.get_selected_action()
+        for action_idx, candidate in enumerate(playable_actions):
+            if candidate is action:
+                self.response_cache.put(
+                    cache_key,
+                    getattr(self, "model_id", self.model_name),
+                    action_idx,
+                    self._safe_action_str(action),
+                    tokens
+                )
+                return
+
+    def _finish_decision(self, playable_actions, response: str, cost: float, tokens: int):
+        """
+        Update stats, resolve the selected action, log it and clear the context.
+
+        Args:
+            playable_actions: List of valid actions
+            response: LLM response text
+            cost: Cost of the query
+            tokens: Tokens used by the query
+
+        Returns:
+            Selected action from playable_actions
+        """
+        # Update stats
+        self.total_cost += cost
+        self.total_tokens += tokens
+        self.move_count += 1
+
+        # Get selected action from MCP server
+        selected_action = self.mcp_server.get_selected_action()
+
+        if not selected_action:
+            self.log.warning("LLM did not select action via MCP, falling back")
+            selected_action = self._fallback_action(playable_actions)
+
+        action_str = self._safe_action_str(selected_action)
+
+        # Log the move
+        if self.logger and self.session_id:
+            self.logger.log_move(
+                session_id=self.session_id,
+                player=str(self.color),
+                move_data={
+                    "action": action_str[:MAX_LOGGED_ACTION_CHARS],
+                    "response": response[:200],  # First 200 chars
+                    "cost": cost,
+                    "tokens": tokens,
+                    "mode": "mcp"
+                },
+                turn_number=self.move_count
+            )
+
+        # Track for context
+        self.recent_moves.append(action_str)
+
+        # Clear context for next decision
+        self.mcp_server.clear_context()
+
+        return selected_action
+
     def _build_system_prompt(self, game) -> str:
         """
         Build system prompt for LLM.
 
+        The prompt only depends on the player's color and subclass
+        instructions, so it is byte-identical across a game's moves; recent
+        moves go into the first user message (see _build_user_message).
+
         Args:
             game: Catanatron game instance
 
         Returns:
             System prompt string
         """
-        recent_context = ""
-        if self.recent_moves:
-            recent_context = f"\n\nYour recent moves: {', '.join(self.recent_moves[-3:])}"
+        return _static_system_prompt(self.color, self._extra_prompt_instructions())
 
-        return f"""You are an expert Settlers of Catan player playing as {self.color}.
-
-Your goal is to win the game by reaching 10 victory points.
-
-You have access to MCP (Model Context Protocol) tools to explore the game state:
-1. **get_game_state** - View your resources, buildings, victory points, and opponent info
-2. **get_valid_actions** - See all actions you can take right now
-3. **select_action** - Choose an action by its action_id
+    def _build_user_message(self) -> str:
+        """
+        Build the first user message of a decision.
 
-Process:
-1. Call get_game_state to understand the current situation
-2. Call get_valid_actions to see what you can do
-3. Analyze the options strategically
-4. Call select_action with your chosen action_id
+        Returns:
+            User message with recent moves for context
+        """
+        if not self.recent_moves:
+            return "Make your move in the game."
+        last_three = islice(self.recent_moves, max(len(self.recent_moves) - 3, 0), None)
+        return f"Your recent moves: {', '.join(last_three)}\nMake your move in the game."
 
-Strategy tips:
-- Focus on reaching 10 victory points efficiently
-- Manage resources carefully - build when you can
-- Consider opponent positions and threats
-- Longest road and largest army give bonus points
-- Settlements are worth 1 VP, cities 2 VP
-- Development cards can provide VPs and strategic advantages{recent_context}
+    def _extra_prompt_instructions(self) -> str:
+        """
+        Extra system prompt instructions for subclasses (e.g. result format notes).
 
-Make your decision now by using the MCP tools."""
+        Returns:
+            Text appended to the system prompt, starting with a blank line, or ""
+        """
+        return ""
 
     def _safe_action_str(self, action: Any) -> str:
-        """Safely convert action to string."""
+        """Safely convert action to string (memoized for hashable actions)."""
         try:
-            return str(action)
+            try:
+                return _action_str(action)
+            except TypeError:
+                # Unhashable action value; format without the cache
+                return str(action)
         except Exception:
             return "Action"
 
@@ -200,10 +500,12 @@ Make your decision now by using the MCP tools."""
 
     def reset_state(self):
         """Reset state between games."""
-        self.recent_moves = []
+        self.recent_moves.clear()
         self.total_cost = 0.0
         self.total_tokens = 0
         self.move_count = 0
+        self.auto_moves = 0
+        self.cache_hits = 0
 
     def get_stats(self) -> Dict[str, Any]:
         """Get player statistics."""
@@ -213,6 +515,8 @@ Make your decision now by using the MCP tools."""
             "total_cost": self.total_cost,
             "total_tokens": self.total_tokens,
             "move_count": self.move_count,
+            "auto_moves": self.auto_moves,
+            "cache_hits": self.cache_hits,
             "avg_cost_per_move": self.total_cost / self.move_count if self.move_count > 0 else 0,
             "mode": "mcp"
         }
@@ -7,18 +7,79 @@ Uses Claude API with native tool calling for game state exploration.
 import os
 import json
 import logging
-from typing import Dict, Any, Tuple
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
 from llm_game_utils import GameResultLogger
 
 try:
-    from anthropic import Anthropic
+    from anthropic import Anthropic, DefaultHttpxClient, DEFAULT_CONNECTION_LIMITS, Timeout
     ANTHROPIC_AVAILABLE = True
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from .response_cache import ResponseCache
 from .base_mcp_player import BaseMCPPlayer
+from ..batch_dispatcher import AnthropicBatchDispatcher, BATCH_COST_MULTIPLIER
 from ...mcp.server import CatanatronMCPServer
 
+# Anthropic clients shared by all players using the same API key, so the
+# underlying connection pool stays warm across players and moves
+_ANTHROPIC_CLIENTS: Dict[str, "Anthropic"] = {}
+_ANTHROPIC_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_anthropic_client(api_key: str) -> "Anthropic":
+    """Get the shared Anthropic client for an API key."""
+    with _ANTHROPIC_CLIENTS_LOCK:
+        client = _ANTHROPIC_CLIENTS.get(api_key)
+        if client is None:
+            # Build Limits from the SDK's own HTTP library, whichever it bundles
+            limits = type(DEFAULT_CONNECTION_LIMITS)(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=300.0
+            )
+            client = Anthropic(
+                api_key=api_key,
+                http_client=DefaultHttpxClient(
+                    http2=HTTP2_AVAILABLE,
+                    limits=limits,
+                    timeout=Timeout(120.0, connect=10.0)
+                )
+            )
+            _ANTHROPIC_CLIENTS[api_key] = client
+        return client
+
+
+# Batch dispatchers shared by all players using the same API key, so
+# requests from parallel games land in the same batches
+_BATCH_DISPATCHERS: Dict[str, AnthropicBatchDispatcher] = {}
+_BATCH_DISPATCHERS_LOCK = threading.Lock()
+
+# Prompt cache pricing relative to the base input token price
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.1
+
+# Runs read-only tool calls while a streamed response is still arriving
+_TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mcp-tool")
+
+
+def _get_batch_dispatcher(api_key: str, client) -> AnthropicBatchDispatcher:
+    """Get the shared batch dispatcher for an API key."""
+    with _BATCH_DISPATCHERS_LOCK:
+        dispatcher = _BATCH_DISPATCHERS.get(api_key)
+        if dispatcher is None:
+            dispatcher = AnthropicBatchDispatcher(client)
+            _BATCH_DISPATCHERS[api_key] = dispatcher
+        return dispatcher
+
 
 class MCPClaudePlayer(BaseMCPPlayer):
     """
@@ -34,7 +95,10 @@ class MCPClaudePlayer(BaseMCPPlayer):
         session_id: str = None,
         logger: GameResultLogger = None,
         mcp_server: CatanatronMCPServer = None,
-        anthropic_api_key: str = None
+        anthropic_api_key: str = None,
+        use_batch_api: bool = False,
+        stream_responses: bool = False,
+        response_cache: Optional[ResponseCache] = None
     ):
         """
         Initialize Claude MCP player.
@@ -46,6 +110,18 @@ class MCPClaudePlayer(BaseMCPPlayer):
             logger: GameResultLogger instance
             mcp_server: Shared MCP server
             anthropic_api_key: Anthropic API key (or None to use env var)
+            use_batch_api: Route requests through the Message Batches API
+                (half price, minutes of latency; not for interactive runs).
+                A batched decision holds its MCP server's game context across
+                several batch round trips, so the player gets a private server
+                and mcp_server must not be passed
+            stream_responses: Stream responses and start read-only tool calls
+                as soon as each tool_use block is complete
+            response_cache: Persistent prompt -> action cache (or None to disable)
+
+        Raises:
+            ValueError: If use_batch_api is combined with stream_responses or
+                an mcp_server
         """
         if not ANTHROPIC_AVAILABLE:
             raise ImportError(
@@ -53,8 +129,20 @@ class MCPClaudePlayer(BaseMCPPlayer):
                 "Install with: pip install anthropic"
             )
 
+        if use_batch_api and stream_responses:
+            raise ValueError("use_batch_api and stream_responses cannot be combined")
+        if use_batch_api:
+            # A shared server would have its context replaced by other games
+            # while this player's batches are pending
+            if mcp_server is not None:
+                raise ValueError("use_batch_api needs a private MCP server; don't pass mcp_server")
+            mcp_server = CatanatronMCPServer(f"catan_{color}_batch")
+
         model_name = model_config.get("name", "Claude")
-        super().__init__(color, model_name, session_id, logger, mcp_server)
+        super().__init__(
+            color, model_name, session_id, logger, mcp_server,
+            response_cache=response_cache
+        )
 
         # Initialize Anthropic client
         api_key = anthropic_api_key or os.getenv("ANTHROPIC_API_KEY")
@@ -63,14 +151,19 @@ class MCPClaudePlayer(BaseMCPPlayer):
                 "ANTHROPIC_API_KEY must be provided or set in environment"
             )
 
-        self.client = Anthropic(api_key=api_key)
+        self.client = _get_anthropic_client(api_key)
         self.model_id = model_config["model_id"]
         self.temperature = model_config.get("temperature", 0.7)
         self.max_tokens = model_config.get("max_tokens", 4000)
+        self.use_batch_api = use_batch_api
+        self.stream_responses = stream_responses
+        self.batch_dispatcher = _get_batch_dispatcher(api_key, self.client) if use_batch_api else None
 
         # Pricing (per million tokens)
-        self.input_cost_per_million = model_config.get("input_cost", 3.0) * 1000  # Convert to per million
-        self.output_cost_per_million = model_config.get("output_cost", 15.0) * 1000
+        self.input_cost_per_million = model_config.get("input_cost", 0.003) * 1000  # Convert to per million
+        self.output_cost_per_million = model_config.get("output_cost", 0.015) * 1000
+        self._input_cost_per_token = self.input_cost_per_million / 1_000_000
+        self._output_cost_per_token = self.output_cost_per_million / 1_000_000
 
     def query_llm_with_mcp(
         self,
@@ -86,18 +179,23 @@ class MCPClaudePlayer(BaseMCPPlayer):
             # Convert MCP tools to Anthropic format
             tools = self._convert_mcp_tools_to_anthropic()
 
-            messages = [{"role": "user", "content": "Make your move in the game."}]
+            messages = [{"role": "user", "content": self._build_user_message()}]
 
             # Multi-turn conversation for tool use
             max_turns = 10  # Prevent infinite loops
             total_input_tokens = 0
             total_output_tokens = 0
+            cache_write_tokens = 0
+            cache_read_tokens = 0
             final_response_text = ""
 
             for turn in range(max_turns):
-                self.log.debug(f"Turn {turn + 1}/{max_turns}")
+                self.log.debug("Turn %d/%d", turn + 1, max_turns)
 
-                response = self.client.messages.create(
+                # No cache_control breakpoint: tools + system prompt come to
+                # ~2.5k characters (~630 tokens), below Anthropic's 1024-token
+                # minimum cacheable prefix, so it would never be cached
+                params = dict(
                     model=self.model_id,
                     max_tokens=self.max_tokens,
                     temperature=self.temperature,
@@ -105,10 +203,17 @@ class MCPClaudePlayer(BaseMCPPlayer):
                     messages=messages,
                     tools=tools
                 )
+                early_results: Dict[str, Future] = {}
+                if self.stream_responses:
+                    response = self._stream_message(mcp_server, early_results, **params)
+                else:
+                    response = self._create_message(**params)
 
                 # Track tokens
                 total_input_tokens += response.usage.input_tokens
                 total_output_tokens += response.usage.output_tokens
+                cache_write_tokens += getattr(response.usage, "cache_creation_input_tokens", 0) or 0
+                cache_read_tokens += getattr(response.usage, "cache_read_input_tokens", 0) or 0
 
                 # Check if Claude wants to use tools
                 if response.stop_reason == "tool_use":
@@ -116,11 +221,15 @@ class MCPClaudePlayer(BaseMCPPlayer):
                     tool_results = []
                     for content_block in response.content:
                         if content_block.type == "tool_use":
-                            self.log.debug(f"Tool call: {content_block.name}")
-                            result = mcp_server.handle_tool_call(
-                                content_block.name,
-                                content_block.input
-                            )
+                            self.log.debug("Tool call: %s", content_block.name)
+                            early_result = early_results.get(content_block.id)
+                            if early_result is not None:
+                                result = early_result.result()
+                            else:
+                                result = mcp_server.handle_tool_call(
+                                    content_block.name,
+                                    content_block.input
+                                )
                             tool_results.append({
                                 "type": "tool_result",
                                 "tool_use_id": content_block.id,
@@ -132,8 +241,14 @@ class MCPClaudePlayer(BaseMCPPlayer):
                                 # Extract final text from response
                                 final_response_text = self._extract_text_from_response(response)
                                 # Calculate cost and return
-                                cost = self._calculate_cost(total_input_tokens, total_output_tokens)
-                                total_tokens = total_input_tokens + total_output_tokens
+                                cost = self._calculate_cost(
+                                    total_input_tokens, total_output_tokens,
+                                    cache_write_tokens, cache_read_tokens
+                                )
+                                total_tokens = (
+                                    total_input_tokens + total_output_tokens
+                                    + cache_write_tokens + cache_read_tokens
+                                )
                                 return (final_response_text, cost, total_tokens)
 
                     # Add assistant response and tool results to conversation
@@ -151,8 +266,14 @@ class MCPClaudePlayer(BaseMCPPlayer):
 
             # If we got here, Claude didn't select an action
             final_response_text = self._extract_text_from_response(response)
-            cost = self._calculate_cost(total_input_tokens, total_output_tokens)
-            total_tokens = total_input_tokens + total_output_tokens
+            cost = self._calculate_cost(
+                total_input_tokens, total_output_tokens,
+                cache_write_tokens, cache_read_tokens
+            )
+            total_tokens = (
+                total_input_tokens + total_output_tokens
+                + cache_write_tokens + cache_read_tokens
+            )
 
             self.log.warning(
                 f"Claude completed {turn + 1} turns without selecting action"
@@ -164,19 +285,45 @@ class MCPClaudePlayer(BaseMCPPlayer):
             self.log.error(f"Error querying Claude with MCP: {e}", exc_info=True)
             return (f"Error: {str(e)}", 0.0, 0)
 
-    def _convert_mcp_tools_to_anthropic(self) -> list:
-        """Convert MCP tool definitions to Anthropic format."""
-        mcp_tools = self.mcp_server.get_tools()
-        anthropic_tools = []
+    def _create_message(self, **params):
+        """Send a Messages API request, directly or through the batch dispatcher."""
+        if self.batch_dispatcher is not None:
+            return self.batch_dispatcher.submit(params).result()
+        return self.client.messages.create(**params)
 
-        for tool in mcp_tools:
-            anthropic_tools.append({
-                "name": tool["name"],
-                "description": tool["description"],
-                "input_schema": tool["input_schema"]
-            })
+    def _stream_message(
+        self,
+        mcp_server: CatanatronMCPServer,
+        early_results: Dict[str, Future],
+        **params
+    ):
+        """
+        Stream a Messages API request, starting read-only tools as blocks complete.
 
-        return anthropic_tools
+        select_action is left to the caller so selections stay in block order.
+
+        Args:
+            mcp_server: MCP server to run tools against
+            early_results: Filled with tool_use id -> Future of the tool result
+            **params: Keyword arguments for messages.stream()
+
+        Returns:
+            The final accumulated Message
+        """
+        with self.client.messages.stream(**params) as stream:
+            for event in stream:
+                if event.type != "content_block_stop":
+                    continue
+                block = event.content_block
+                if block.type == "tool_use" and block.name != "select_action":
+                    early_results[block.id] = _TOOL_EXECUTOR.submit(
+                        mcp_server.handle_tool_call, block.name, block.input
+                    )
+            return stream.get_final_message()
+
+    def _convert_mcp_tools_to_anthropic(self) -> tuple:
+        """Get MCP tool definitions in Anthropic format (cached on the server)."""
+        return self.mcp_server.get_anthropic_tools()
 
     def _extract_text_from_response(self, response) -> str:
         """Extract text content from response."""
@@ -186,17 +333,32 @@ class MCPClaudePlayer(BaseMCPPlayer):
                 texts.append(block.text)
         return "\n".join(texts) if texts else "No text response"
 
-    def _calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
+    def _calculate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        cache_write_tokens: int = 0,
+        cache_read_tokens: int = 0
+    ) -> float:
         """
         Calculate API cost.
 
         Args:
-            input_tokens: Number of input tokens
+            input_tokens: Number of uncached input tokens
             output_tokens: Number of output tokens
+            cache_write_tokens: Input tokens written to the prompt cache
+            cache_read_tokens: Input tokens read from the prompt cache
 
         Returns:
             Cost in dollars
         """
-        input_cost = (input_tokens / 1_000_000) * self.input_cost_per_million
-        output_cost = (output_tokens / 1_000_000) * self.output_cost_per_million
+        billed_input = (
+            input_tokens
+            + cache_write_tokens * CACHE_WRITE_MULTIPLIER
+            + cache_read_tokens * CACHE_READ_MULTIPLIER
+        )
+        input_cost = billed_input * self._input_cost_per_token
+        output_cost = output_tokens * self._output_cost_per_token
+        if self.use_batch_api:
+            return (input_cost + output_cost) * BATCH_COST_MULTIPLIER
         return input_cost + output_cost
@@ -7,16 +7,127 @@ Works with any model that supports function/tool calling (Claude, GPT, etc.).
 
 import os
 import json
+import atexit
+import asyncio
 import logging
-import time
+import threading
+import weakref
 from typing import Dict, Any, Tuple, List, Optional
 
 import httpx
 from llm_game_utils import GameResultLogger
 
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from .response_cache import ResponseCache
 from .base_mcp_player import BaseMCPPlayer
 from ...mcp.server import CatanatronMCPServer
 
+# System prompt note explaining TOON-encoded tool results
+TOON_PROMPT_NOTE = """
+
+Tool results for get_game_state and get_valid_actions use compact TOON format:
+- name[N]{a|b|c}: is a table of N rows; each indented line below is one row of |-separated values for a, b, c
+- name{a|b}: 1|2 is a single record; nested fields use dotted names like details.value"""
+
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# Shared connection pools, one AsyncClient per (event loop, API key).
+# Clients live for the lifetime of their loop so TLS sessions are reused
+# across tool turns, moves and players.
+_OPENROUTER_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_OPENROUTER_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_openrouter_client(api_key: str) -> httpx.AsyncClient:
+    """Get the shared AsyncClient for this API key on the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _OPENROUTER_CLIENTS_LOCK:
+        clients = _OPENROUTER_CLIENTS.setdefault(loop, {})
+        client = clients.get(api_key)
+        if client is None or client.is_closed:
+            limits = httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=300.0
+            )
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(120.0, connect=10.0),
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "HTTP-Referer": "https://github.com/infoFiets/llm-catan-arena",
+                    "X-Title": "LLM Catan Arena",
+                    "Content-Type": "application/json"
+                },
+                transport=httpx.AsyncHTTPTransport(
+                    http2=HTTP2_AVAILABLE,
+                    limits=limits,
+                    retries=0
+                )
+            )
+            clients[api_key] = client
+        return client
+
+
+async def close_openrouter_clients():
+    """Close the shared clients bound to the running event loop."""
+    with _OPENROUTER_CLIENTS_LOCK:
+        clients = _OPENROUTER_CLIENTS.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
+
+# One long-lived event loop thread drives the async client for every sync
+# decide() caller, so worker threads share its clients instead of each
+# leaking a loop and connection pool
+_SYNC_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_SYNC_LOOP_THREAD: Optional[threading.Thread] = None
+_SYNC_LOOP_LOCK = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared background event loop, starting it on first use."""
+    global _SYNC_LOOP, _SYNC_LOOP_THREAD
+    with _SYNC_LOOP_LOCK:
+        if _SYNC_LOOP is None:
+            _SYNC_LOOP = asyncio.new_event_loop()
+            _SYNC_LOOP_THREAD = threading.Thread(
+                target=_SYNC_LOOP.run_forever, name="openrouter-loop", daemon=True
+            )
+            _SYNC_LOOP_THREAD.start()
+            atexit.register(shutdown_sync_loop)
+        return _SYNC_LOOP
+
+
+def _run_sync(coro):
+    """Run a coroutine to completion on the shared background event loop."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_sync_loop()).result()
+
+
+def shutdown_sync_loop(timeout: float = 10.0):
+    """Close the background loop's clients, then stop and close the loop."""
+    global _SYNC_LOOP, _SYNC_LOOP_THREAD
+    with _SYNC_LOOP_LOCK:
+        loop, thread = _SYNC_LOOP, _SYNC_LOOP_THREAD
+        _SYNC_LOOP = _SYNC_LOOP_THREAD = None
+    if loop is None:
+        return
+    atexit.unregister(shutdown_sync_loop)
+
+    try:
+        asyncio.run_coroutine_threadsafe(close_openrouter_clients(), loop).result(timeout)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
 
 class OpenRouterToolsPlayer(BaseMCPPlayer):
     """
@@ -48,7 +159,9 @@ class OpenRouterToolsPlayer(BaseMCPPlayer):
         mcp_server: CatanatronMCPServer = None,
         api_key: str = None,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        stream_responses: bool = False,
+        response_cache: Optional[ResponseCache] = None
     ):
         """
         Initialize OpenRouter tool-calling player.
@@ -62,9 +175,17 @@ class OpenRouterToolsPlayer(BaseMCPPlayer):
             api_key: OpenRouter API key (or None to use env var)
             max_retries: Max retries on API failure
             retry_delay: Base delay between retries
+            stream_responses: Stream completions and start read-only tool calls
+                as soon as each one is complete
+            response_cache: Persistent prompt -> action cache (or None to disable)
+
+        model_config may set tool_result_format ("toon" or "json", default "toon").
         """
         model_name = model_config.get("name", "LLM")
-        super().__init__(color, model_name, session_id, logger, mcp_server)
+        super().__init__(
+            color, model_name, session_id, logger, mcp_server,
+            response_cache=response_cache
+        )
 
         # API setup
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
@@ -78,21 +199,14 @@ class OpenRouterToolsPlayer(BaseMCPPlayer):
         self.max_tokens = model_config.get("max_tokens", 4000)
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.stream_responses = stream_responses
+        self.tool_result_format = model_config.get("tool_result_format", "toon")
 
         # Pricing (per 1K tokens)
         self.input_cost_per_k = model_config.get("input_cost", 0.001)
         self.output_cost_per_k = model_config.get("output_cost", 0.002)
-
-        # HTTP client
-        self.http_client = httpx.Client(
-            timeout=120,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "HTTP-Referer": "https://github.com/infoFiets/llm-catan-arena",
-                "X-Title": "LLM Catan Arena",
-                "Content-Type": "application/json"
-            }
-        )
+        self._input_cost_per_token = self.input_cost_per_k / 1000.0
+        self._output_cost_per_token = self.output_cost_per_k / 1000.0
 
         # Warn if model might not support tool calling
         if self.model_id not in self.TOOL_CALLING_MODELS:
@@ -109,6 +223,18 @@ class OpenRouterToolsPlayer(BaseMCPPlayer):
         """
         Query LLM with tool calling via OpenRouter.
 
+        Blocking wrapper around aquery_llm_with_mcp() for Catanatron's sync decide().
+        """
+        return _run_sync(self.aquery_llm_with_mcp(system_prompt, mcp_server))
+
+    async def aquery_llm_with_mcp(
+        self,
+        system_prompt: str,
+        mcp_server: CatanatronMCPServer
+    ) -> Tuple[str, float, int]:
+        """
+        Query LLM with tool calling via OpenRouter.
+
         Uses OpenRouter's tool calling format (OpenAI-compatible).
         """
         try:
@@ -117,7 +243,7 @@ class OpenRouterToolsPlayer(BaseMCPPlayer):
 
             messages = [
                 {"role": "system", "content": system_prompt},
-                {"role": "user", "content": "Make your move in the game."}
+                {"role": "user", "content": self._build_user_message()}
             ]
 
             # Multi-turn conversation for tool use
@@ -127,10 +253,13 @@ class OpenRouterToolsPlayer(BaseMCPPlayer):
             final_response_text = ""
 
             for turn in range(max_turns):
-                self.log.debug(f"Turn {turn + 1}/{max_turns}")
+                self.log.debug("Turn %d/%d", turn + 1, max_turns)
 
-                # Make API call with retry
-                response_data = self._make_request_with_retry(messages, tools)
+                # Make API call with retry (streaming may start tools early)
+                early_results: Dict[int, asyncio.Future] = {}
+                response_data = await self._make_request_with_retry(
+                    messages, tools, mcp_server, early_results
+                )
 
                 if response_data is None:
                     # All retries failed
@@ -154,21 +283,24 @@ class OpenRouterToolsPlayer(BaseMCPPlayer):
                     # Add assistant message with tool calls to history
                     messages.append(message)
 
-                    # Process each tool call
-                    for tool_call in tool_calls:
-                        tool_name = tool_call.get("function", {}).get("name", "")
-                        tool_args_str = tool_call.get("function", {}).get("arguments", "{}")
-                        tool_call_id = tool_call.get("id", "")
+                    calls = [self._parse_tool_call(tool_call) for tool_call in tool_calls]
 
-                        try:
-                            tool_args = json.loads(tool_args_str)
-                        except json.JSONDecodeError:
-                            tool_args = {}
+                    # Read-only tools run concurrently; select_action is applied
+                    # in order below so the first selection wins. Results are
+                    # matched by position: providers may send empty or repeated ids
+                    read_results = iter(await asyncio.gather(*[
+                        early_results.get(index) or mcp_server.ahandle_tool_call(
+                            tool_name, tool_args, result_format=self.tool_result_format
+                        )
+                        for index, (_, tool_name, tool_args) in enumerate(calls)
+                        if tool_name != "select_action"
+                    ]))
 
-                        self.log.debug(f"Tool call: {tool_name}({tool_args})")
-
-                        # Execute tool via MCP server
-                        result = mcp_server.handle_tool_call(tool_name, tool_args)
+                    for tool_call_id, tool_name, tool_args in calls:
+                        if tool_name == "select_action":
+                            result = mcp_server.handle_tool_call(tool_name, tool_args)
+                        else:
+                            result = next(read_results)
 
                         # Add tool result to messages
                         messages.append({
@@ -198,26 +330,73 @@ class OpenRouterToolsPlayer(BaseMCPPlayer):
             self.log.error(f"Error in query_llm_with_mcp: {e}", exc_info=True)
             return (f"Error: {str(e)}", 0.0, 0)
 
-    def _make_request_with_retry(
+    def _parse_tool_call(self, tool_call: Dict) -> Tuple[str, str, Dict]:
+        """
+        Extract id, name and decoded arguments from an OpenAI-format tool call.
+
+        Args:
+            tool_call: Tool call dict from the assistant message
+
+        Returns:
+            Tuple of (tool_call_id, tool_name, tool_args)
+        """
+        function = tool_call.get("function", {})
+        tool_name = function.get("name", "")
+
+        try:
+            tool_args = json.loads(function.get("arguments", "{}"))
+        except json.JSONDecodeError:
+            tool_args = {}
+
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("Tool call: %s(%s)", tool_name, tool_args)
+        return (tool_call.get("id", ""), tool_name, tool_args)
+
+    def _extra_prompt_instructions(self) -> str:
+        """Explain TOON-encoded tool results when they are enabled."""
+        return TOON_PROMPT_NOTE if self.tool_result_format == "toon" else ""
+
+    async def _make_request_with_retry(
         self,
         messages: List[Dict],
-        tools: List[Dict]
+        tools: List[Dict],
+        mcp_server: CatanatronMCPServer = None,
+        early_results: Optional[Dict[int, asyncio.Future]] = None
     ) -> Optional[Dict]:
-        """Make API request with retry logic."""
+        """
+        Make API request with retry logic.
+
+        Args:
+            messages: Conversation so far
+            tools: Tool definitions in OpenAI format
+            mcp_server: MCP server for early tool dispatch when streaming
+            early_results: Filled with tool call index -> pending result when streaming
+
+        Returns:
+            Completion response dict (non-streaming shape), or None on failure
+        """
         last_error = None
+        http_client = _get_openrouter_client(self.api_key)
+        payload = {
+            "model": self.model_id,
+            "messages": messages,
+            "tools": tools,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens
+        }
+        if self.stream_responses:
+            payload["stream"] = True
+            payload["stream_options"] = {"include_usage": True}
 
         for attempt in range(self.max_retries):
             try:
-                response = self.http_client.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    json={
-                        "model": self.model_id,
-                        "messages": messages,
-                        "tools": tools,
-                        "temperature": self.temperature,
-                        "max_tokens": self.max_tokens
-                    }
-                )
+                if self.stream_responses:
+                    if early_results is None:
+                        early_results = {}
+                    early_results.clear()
+                    return await self._stream_request(http_client, payload, mcp_server, early_results)
+
+                response = await http_client.post(OPENROUTER_URL, json=payload)
                 response.raise_for_status()
                 return response.json()
 
@@ -235,35 +414,107 @@ class OpenRouterToolsPlayer(BaseMCPPlayer):
 
             if attempt < self.max_retries - 1:
                 sleep_time = self.retry_delay * (attempt + 1)
-                time.sleep(sleep_time)
+                await asyncio.sleep(sleep_time)
 
         self.log.error(f"All {self.max_retries} attempts failed: {last_error}")
         return None
 
-    def _convert_tools_to_openai_format(self) -> List[Dict]:
-        """Convert MCP tools to OpenAI/OpenRouter function calling format."""
-        mcp_tools = self.mcp_server.get_tools()
-        openai_tools = []
+    async def _stream_request(
+        self,
+        http_client: httpx.AsyncClient,
+        payload: Dict,
+        mcp_server: Optional[CatanatronMCPServer],
+        early_results: Dict[int, asyncio.Future]
+    ) -> Dict:
+        """
+        Stream a completion over SSE, dispatching each finished read-only tool call.
+
+        A tool call is complete once the next one starts or the stream ends,
+        so its execution overlaps with the rest of the model output.
+
+        Returns:
+            Response dict in the same shape as a non-streaming completion
+        """
+        content_parts = []
+        tool_calls: List[Dict] = []
+        finish_reason = ""
+        usage = {}
+
+        async with http_client.stream("POST", OPENROUTER_URL, json=payload) as response:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
 
-        for tool in mcp_tools:
-            openai_tools.append({
-                "type": "function",
-                "function": {
-                    "name": tool["name"],
-                    "description": tool["description"],
-                    "parameters": tool["input_schema"]
-                }
-            })
+            async for line in response.aiter_lines():
+                # Skip blank keep-alive lines, SSE comments and the [DONE] sentinel;
+                # the generator is drained rather than broken out of
+                if not line.startswith("data: "):
+                    continue
+                data = line[len("data: "):]
+                if data == "[DONE]":
+                    continue
+
+                chunk = json.loads(data)
+                usage = chunk.get("usage") or usage
+
+                for choice in chunk.get("choices", []):
+                    delta = choice.get("delta") or {}
+                    if delta.get("content"):
+                        content_parts.append(delta["content"])
+
+                    for call_delta in delta.get("tool_calls") or []:
+                        index = call_delta.get("index", len(tool_calls))
+                        if index >= len(tool_calls):
+                            self._dispatch_tool_early(tool_calls, mcp_server, early_results)
+                            tool_calls.append({
+                                "id": "",
+                                "type": "function",
+                                "function": {"name": "", "arguments": ""}
+                            })
+                        call = tool_calls[index]
+                        if call_delta.get("id"):
+                            call["id"] = call_delta["id"]
+                        function = call_delta.get("function") or {}
+                        call["function"]["name"] += function.get("name") or ""
+                        call["function"]["arguments"] += function.get("arguments") or ""
+
+                    if choice.get("finish_reason"):
+                        finish_reason = choice["finish_reason"]
+
+        self._dispatch_tool_early(tool_calls, mcp_server, early_results)
+
+        message = {"role": "assistant", "content": "".join(content_parts) or None}
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+
+        return {
+            "choices": [{"message": message, "finish_reason": finish_reason}],
+            "usage": usage
+        }
+
+    def _dispatch_tool_early(
+        self,
+        tool_calls: List[Dict],
+        mcp_server: Optional[CatanatronMCPServer],
+        early_results: Dict[int, asyncio.Future]
+    ):
+        """Start the most recent complete tool call if it is read-only."""
+        if not tool_calls or mcp_server is None:
+            return
+
+        index = len(tool_calls) - 1
+        _, tool_name, tool_args = self._parse_tool_call(tool_calls[index])
+        if tool_name == "select_action" or index in early_results:
+            return
+
+        early_results[index] = asyncio.ensure_future(
+            mcp_server.ahandle_tool_call(tool_name, tool_args, result_format=self.tool_result_format)
+        )
 
-        return openai_tools
+    def _convert_tools_to_openai_format(self) -> Tuple[Dict, ...]:
+        """Get MCP tools in OpenAI/OpenRouter function calling format (cached on the server)."""
+        return self.mcp_server.get_openai_tools()
 
     def _calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
         """Calculate API cost based on token usage."""
-        input_cost = (input_tokens / 1000) * self.input_cost_per_k
-        output_cost = (output_tokens / 1000) * self.output_cost_per_k
-        return input_cost + output_cost
-
-    def __del__(self):
-        """Clean up HTTP client."""
-        if hasattr(self, 'http_client'):
-            self.http_client.close()
+        return input_tokens * self._input_cost_per_token + output_tokens * self._output_cost_per_token
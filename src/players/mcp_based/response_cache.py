@@ -0,0 +1,136 @@
+"""
+Persistent LLM response cache for MCP players.
+
+Maps (model, system prompt, game state, legal actions) to the action the
+model picked, so identical decisions (e.g. opening placements on the same
+map) are answered without an API call across arena runs.
+
+Lookups go through an in-memory dict first, then SQLite.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_CACHE_PATH = "data/cache/llm_responses.sqlite"
+DEFAULT_TTL_DAYS = 30
+
+
+class ResponseCache:
+    """SQLite-backed prompt → action cache with an in-memory front."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_days: float = DEFAULT_TTL_DAYS):
+        """
+        Initialize cache, creating the database if needed.
+
+        Args:
+            path: SQLite database file
+            ttl_days: Entries older than this are ignored
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_days * 86400
+        self._memory: Dict[bytes, Tuple[int, str, float]] = {}
+        self._lock = threading.Lock()
+        self.log = logging.getLogger("ResponseCache")
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key BLOB PRIMARY KEY, model TEXT, action_idx INT, action_str TEXT, "
+            "tokens INT, created REAL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        model_id: str,
+        system_prompt: str,
+        state: Dict[str, Any],
+        action_strings: List[str],
+        sampling: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """
+        Build a cache key from everything that determines the model's input.
+
+        Args:
+            model_id: Model identifier
+            system_prompt: System prompt sent to the model
+            state: Canonical game state (JSON-serializable)
+            action_strings: String forms of the playable actions
+            sampling: Sampling parameters (temperature, max_tokens, ...)
+
+        Returns:
+            blake2b digest
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        for part in (
+            model_id,
+            system_prompt,
+            json.dumps(state, sort_keys=True, separators=(",", ":"), default=str),
+            "\x1f".join(sorted(action_strings)),
+            json.dumps(sampling or {}, sort_keys=True, separators=(",", ":"), default=str),
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x1e")
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[Tuple[int, str]]:
+        """
+        Look up a cached decision.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Tuple of (action_index, action_str), or None on miss/expiry
+        """
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                row = self._conn.execute(
+                    "SELECT action_idx, action_str, created FROM llm_cache WHERE key = ?",
+                    (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                entry = (row[0], row[1], row[2])
+                self._memory[key] = entry
+
+        if entry[2] < cutoff:
+            return None
+        return entry[0], entry[1]
+
+    def put(self, key: bytes, model_id: str, action_idx: int, action_str: str, tokens: int):
+        """
+        Store a decision.
+
+        Args:
+            key: Key from make_key()
+            model_id: Model identifier
+            action_idx: Index of the chosen action in playable_actions
+            action_str: String form of the chosen action (validated on hit)
+            tokens: Tokens the original query used
+        """
+        created = time.time()
+        with self._lock:
+            self._memory[key] = (action_idx, action_str, created)
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model_id, action_idx, action_str, tokens, created)
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self.log.warning(f"Failed to persist cache entry: {e}")
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
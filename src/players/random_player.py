@@ -6,6 +6,7 @@ Useful for comparison with LLM players.
 """
 
 import random
+from typing import Optional
 from catanatron.models.player import Player
 
 
@@ -16,16 +17,18 @@ class RandomPlayer(Player):
     Makes random choices from available actions without any strategy.
     """
 
-    def __init__(self, color):
+    def __init__(self, color, seed: Optional[int] = None):
         """
         Initialize random player.
 
         Args:
             color: Catanatron color string
+            seed: Optional seed for reproducible games
         """
         super().__init__(color, is_bot=True)
         self.model_name = "Random"
         self.move_count = 0
+        self._rng = random.Random(seed)
 
     def decide(self, game, playable_actions):
         """
@@ -39,7 +42,7 @@ class RandomPlayer(Player):
             Randomly selected action
         """
         self.move_count += 1
-        return random.choice(playable_actions)
+        return self._rng.choice(playable_actions)
 
     def reset_state(self):
         """Reset state between games."""
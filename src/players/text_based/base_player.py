@@ -5,21 +5,128 @@ Abstract base class that wraps Catanatron's Player interface for LLM-based playe
 Handles prompt generation, response parsing, and error handling.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
 import random
 import re
+import sys
 import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import List, Any, Dict
+from collections import OrderedDict, deque
+from typing import List, Any, Dict, Optional, Tuple
 
 from catanatron.models.player import Player
 from llm_game_utils import GameResultLogger
 
-from ...prompt_builder import CatanPromptBuilder
+from ...prompt_builder import CatanPromptBuilder, RESPONSE_FORMAT_INSTRUCTION
 
-# Default retry configuration
-DEFAULT_MAX_RETRIES = 3
-DEFAULT_RETRY_DELAY = 1.0  # seconds
+# Default retry configuration (exponential backoff with jitter)
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_RETRY_DELAY = 1.0  # seconds, delay before the first retry
+MAX_RETRY_DELAY = 8.0  # seconds
+
+# Max responses remembered per player for repeated prompts
+PROMPT_CACHE_SIZE = 4096
+
+# Cap on in-flight async LLM queries per event loop (keeps concurrent
+# players within provider rate limits)
+MAX_CONCURRENT_QUERIES = 20
+
+_QUERY_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_query_semaphore() -> asyncio.Semaphore:
+    """Get the query semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _QUERY_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+        _QUERY_SEMAPHORES[loop] = semaphore
+    return semaphore
+
+
+def _usage_field(obj: Any, name: str) -> Any:
+    """Read a field from an API usage object or dict (None if missing)."""
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def cached_prompt_tokens(response: Any) -> int:
+    """
+    Prompt tokens served from the provider's prompt cache, as reported in usage.
+
+    Reads Anthropic's usage.cache_read_input_tokens or OpenAI-style
+    usage.prompt_tokens_details.cached_tokens; 0 when not reported.
+
+    Args:
+        response: API response object (or dict) with a usage field
+
+    Returns:
+        Number of cached prompt tokens
+    """
+    usage = _usage_field(response, "usage")
+    cached = _usage_field(usage, "cache_read_input_tokens")
+    if cached is None:
+        cached = _usage_field(_usage_field(usage, "prompt_tokens_details"), "cached_tokens")
+    return cached if isinstance(cached, int) else 0
+
+
+@functools.lru_cache(maxsize=4096)
+def _action_str(action) -> str:
+    """String form of an action; Catanatron actions are hashable namedtuples."""
+    return sys.intern(str(action))
+
+
+# Response parsing patterns, in priority order (see _parse_response)
+_JSON_OBJECT_RE = re.compile(r'\{[^{}]*\}')
+_ACTION_LABEL_RE = re.compile(r'\*{0,2}[Aa]ction[:\s]*(\d+)\*{0,2}')
+_LINE_START_NUMBER_RE = re.compile(r'(?:^|\n)\s*(\d+)[\.\)\:\s\-]')
+_NUMBER_RE = re.compile(r'\b(\d+)\b')
+
+# (player_state key suffix, default) read for this player and for opponents
+_PLAYER_FIELDS = (
+    ("WOOD_IN_HAND", 0),
+    ("BRICK_IN_HAND", 0),
+    ("SHEEP_IN_HAND", 0),
+    ("WHEAT_IN_HAND", 0),
+    ("ORE_IN_HAND", 0),
+    ("ACTUAL_VICTORY_POINTS", 0),
+    ("SETTLEMENTS_AVAILABLE", 5),
+    ("CITIES_AVAILABLE", 4),
+    ("ROADS_AVAILABLE", 15),
+    ("KNIGHT_IN_HAND", 0),
+    ("YEAR_OF_PLENTY_IN_HAND", 0),
+    ("MONOPOLY_IN_HAND", 0),
+    ("ROAD_BUILDING_IN_HAND", 0),
+    ("VICTORY_POINT_IN_HAND", 0),
+)
+_OPPONENT_FIELDS = (
+    ("ACTUAL_VICTORY_POINTS", 0),
+    ("WOOD_IN_HAND", 0),
+    ("BRICK_IN_HAND", 0),
+    ("SHEEP_IN_HAND", 0),
+    ("WHEAT_IN_HAND", 0),
+    ("ORE_IN_HAND", 0),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _player_state_keys(
+    player_index: int,
+    fields: Tuple[Tuple[str, int], ...]
+) -> Tuple[Tuple[str, int], ...]:
+    """Prefixed player_state keys (e.g. "P0_WOOD_IN_HAND") with their defaults."""
+    prefix = f"P{player_index}_"
+    return tuple((prefix + suffix, default) for suffix, default in fields)
 
 
 class BaseLLMPlayer(Player, ABC):
@@ -55,8 +162,8 @@ class BaseLLMPlayer(Player, ABC):
             logger: Optional GameResultLogger instance
             is_bot: Whether this is a bot player
             prompt_format: Prompt format - "json", "json-minified", or "toon"
-            max_retries: Maximum number of retries on API failure
-            retry_delay: Delay between retries in seconds
+            max_retries: Maximum number of API attempts before falling back
+            retry_delay: Delay before the first retry in seconds (doubles per retry)
         """
         super().__init__(color, is_bot)
         self.model_name = model_name
@@ -64,19 +171,26 @@ class BaseLLMPlayer(Player, ABC):
         self.logger = logger
         self.prompt_format = prompt_format
         self.prompt_builder = CatanPromptBuilder(prompt_format=prompt_format)
-        self.recent_moves = []
+        self.recent_moves = deque(maxlen=5)  # Last 5 moves for context
         self.total_cost = 0.0
         self.total_tokens = 0
         self.move_count = 0
         self.error_count = 0
+        self.cache_hits = 0
+        self.auto_moves = 0
+        self.cached_tokens = 0
         self.max_retries = max_retries
         self.retry_delay = retry_delay
 
+        # Responses to previously seen prompts (deterministic models only);
+        # kept across games since replays and opening placements repeat
+        self._prompt_cache: "OrderedDict[bytes, Tuple[str, int]]" = OrderedDict()
+
         # Set up logging
         self.log = logging.getLogger(f"{self.__class__.__name__}:{color}")
 
     @abstractmethod
-    def query_llm(self, prompt: str) -> tuple[str, float, int]:
+    def query_llm(self, prompt: str) -> tuple:
         """
         Query the LLM with a prompt.
 
@@ -86,13 +200,29 @@ class BaseLLMPlayer(Player, ABC):
             prompt: The prompt to send to the LLM
 
         Returns:
-            Tuple of (response_text, cost, tokens_used)
+            Tuple of (response_text, cost, tokens_used), optionally followed
+            by cached_tokens (prompt tokens served from the provider's cache)
 
         Raises:
             Exception: If the API call fails (will be retried by query_llm_with_retry)
         """
         pass
 
+    async def aquery_llm(self, prompt: str) -> tuple:
+        """
+        Async variant of query_llm().
+
+        Defaults to running the blocking implementation in a worker thread;
+        subclasses with a native async client override this.
+
+        Args:
+            prompt: The prompt to send to the LLM
+
+        Returns:
+            Same tuple as query_llm()
+        """
+        return await asyncio.to_thread(self.query_llm, prompt)
+
     def query_llm_with_retry(self, prompt: str) -> tuple[str, float, int, bool]:
         """
         Query LLM with automatic retry on failure.
@@ -108,8 +238,8 @@ class BaseLLMPlayer(Player, ABC):
 
         for attempt in range(self.max_retries):
             try:
-                response, cost, tokens = self.query_llm(prompt)
-                return (response, cost, tokens, False)
+                result = self.query_llm(prompt)
+                return self._unpack_query_result(result)
             except Exception as e:
                 last_error = e
                 self.error_count += 1
@@ -117,13 +247,67 @@ class BaseLLMPlayer(Player, ABC):
                     f"API call failed (attempt {attempt + 1}/{self.max_retries}): {e}"
                 )
                 if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))  # Exponential backoff
+                    time.sleep(self._backoff_delay(attempt))
 
         # All retries failed
         self.log.error(f"All {self.max_retries} API attempts failed: {last_error}")
         # Return fallback with flag indicating error
         return ("1", 0.0, 0, True)
 
+    async def aquery_llm_with_retry(self, prompt: str) -> tuple[str, float, int, bool]:
+        """
+        Async variant of query_llm_with_retry().
+
+        Queries are limited to MAX_CONCURRENT_QUERIES in flight per event loop.
+
+        Args:
+            prompt: The prompt to send to the LLM
+
+        Returns:
+            Tuple of (response_text, cost, tokens_used, was_error)
+        """
+        last_error = None
+
+        for attempt in range(self.max_retries):
+            try:
+                async with _get_query_semaphore():
+                    result = await self.aquery_llm(prompt)
+                return self._unpack_query_result(result)
+            except Exception as e:
+                last_error = e
+                self.error_count += 1
+                self.log.warning(
+                    f"API call failed (attempt {attempt + 1}/{self.max_retries}): {e}"
+                )
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(self._backoff_delay(attempt))
+
+        self.log.error(f"All {self.max_retries} API attempts failed: {last_error}")
+        return ("1", 0.0, 0, True)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Delay before retrying after a failed attempt.
+
+        Doubles per attempt up to MAX_RETRY_DELAY, with jitter so players hit
+        by the same rate limit don't retry in lockstep.
+
+        Args:
+            attempt: Zero-based index of the failed attempt
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.retry_delay * (2 ** attempt), MAX_RETRY_DELAY)
+        return delay * random.uniform(0.5, 1.0)
+
+    def _unpack_query_result(self, result: tuple) -> tuple[str, float, int, bool]:
+        """Record cached tokens from a query_llm() result and return it with was_error=False."""
+        response, cost, tokens = result[:3]
+        if len(result) > 3:
+            self.cached_tokens += result[3]
+        return (response, cost, tokens, False)
+
     def decide(self, game, playable_actions):
         """
         Main decision method called by Catanatron.
@@ -135,66 +319,224 @@ class BaseLLMPlayer(Player, ABC):
         Returns:
             One action from playable_actions
         """
+        if len(playable_actions) == 1:
+            return self._auto_decision(playable_actions[0])
+
         try:
-            # Extract player state from game
             player_state = self._extract_player_state(game)
 
-            # Build prompt
-            prompt = self.prompt_builder.build_action_prompt(
-                game_state=game,
-                player_state=player_state,
-                available_actions=playable_actions,
-                recent_moves=self.recent_moves[-5:]  # Last 5 moves for context
-            )
+            # Check the response cache before rendering the prompt
+            cache_key = self._prompt_cache_key(game, player_state, playable_actions)
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                response, prompt_length = cached
+                return self._finish_decision(playable_actions, prompt_length, response, 0.0, 0, False)
+
+            prompt = self._build_prompt(game, player_state, playable_actions)
 
             # Query LLM with retry
-            self.log.debug(f"Querying LLM with prompt (len={len(prompt)})")
+            self.log.debug("Querying LLM with prompt (len=%d)", len(prompt))
             response, cost, tokens, was_error = self.query_llm_with_retry(prompt)
+            if not was_error:
+                self._store_cached_response(cache_key, response, len(prompt))
 
-            # Update stats
-            self.total_cost += cost
-            self.total_tokens += tokens
-            self.move_count += 1
-
-            # If API failed, use random action instead of parsing "1"
-            if was_error:
-                selected_action = self._fallback_action(playable_actions)
-            else:
-                # Parse response to select action
-                selected_action = self._parse_response(response, playable_actions)
-
-            # Log the move
-            if self.logger and self.session_id:
-                self.logger.log_move(
-                    session_id=self.session_id,
-                    player=str(self.color),
-                    move_data={
-                        "action": self._safe_action_str(selected_action),
-                        "prompt_length": len(prompt),
-                        "response": response[:200] if not was_error else "[API_ERROR]",
-                        "cost": cost,
-                        "tokens": tokens,
-                        "api_error": was_error
-                    },
-                    turn_number=self.move_count
-                )
-
-            # Track move for context
-            self.recent_moves.append(self._safe_action_str(selected_action))
-
-            return selected_action
+            return self._finish_decision(playable_actions, len(prompt), response, cost, tokens, was_error)
 
         except Exception as e:
             self.log.error(f"Error in decide(): {e}", exc_info=True)
             # Fallback to random action
             return self._fallback_action(playable_actions)
 
+    async def adecide(self, game, playable_actions):
+        """
+        Async variant of decide() for callers driving players from an event loop.
+
+        Lets independent games run their players' LLM queries concurrently,
+        e.g. with asyncio.gather().
+
+        Args:
+            game: Complete game state (read-only)
+            playable_actions: List of valid actions at this moment
+
+        Returns:
+            One action from playable_actions
+        """
+        if len(playable_actions) == 1:
+            return self._auto_decision(playable_actions[0])
+
+        try:
+            player_state = self._extract_player_state(game)
+
+            # Check the response cache before rendering the prompt
+            cache_key = self._prompt_cache_key(game, player_state, playable_actions)
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                response, prompt_length = cached
+                return self._finish_decision(playable_actions, prompt_length, response, 0.0, 0, False)
+
+            prompt = self._build_prompt(game, player_state, playable_actions)
+
+            self.log.debug("Querying LLM with prompt (len=%d, async)", len(prompt))
+            response, cost, tokens, was_error = await self.aquery_llm_with_retry(prompt)
+            if not was_error:
+                self._store_cached_response(cache_key, response, len(prompt))
+
+            return self._finish_decision(playable_actions, len(prompt), response, cost, tokens, was_error)
+
+        except Exception as e:
+            self.log.error(f"Error in adecide(): {e}", exc_info=True)
+            return self._fallback_action(playable_actions)
+
+    def _auto_decision(self, action):
+        """
+        Play the only legal action without querying the LLM.
+
+        Args:
+            action: The single playable action
+
+        Returns:
+            The action
+        """
+        self.move_count += 1
+        self.auto_moves += 1
+        self.recent_moves.append(self._safe_action_str(action))
+        return action
+
+    def _build_prompt(self, game, player_state: Dict[str, Any], playable_actions) -> str:
+        """
+        Build the action prompt for this decision.
+
+        Args:
+            game: Complete game state
+            player_state: Output of _extract_player_state()
+            playable_actions: List of valid actions
+
+        Returns:
+            Prompt string
+        """
+        return self.prompt_builder.build_action_prompt(
+            game_state=game,
+            player_state=player_state,
+            available_actions=playable_actions,
+            recent_moves=self.recent_moves
+        )
+
+    def _prompt_cache_key(
+        self,
+        game,
+        player_state: Dict[str, Any],
+        playable_actions
+    ) -> Optional[bytes]:
+        """
+        Hash the inputs of the action prompt for the response cache.
+
+        Covers everything _build_prompt() renders (player state, actions,
+        recent moves, turn number and format), so the prompt itself only has
+        to be built on a miss. Only deterministic (temperature 0) players
+        cache responses, so sampled play is never replaced by a replay.
+
+        Args:
+            game: Complete game state
+            player_state: Output of _extract_player_state()
+            playable_actions: List of valid actions
+
+        Returns:
+            Digest, or None if responses shouldn't be cached
+        """
+        if getattr(self, "temperature", None) != 0:
+            return None
+        prompt_inputs = (
+            self.prompt_format,
+            getattr(game.state, "num_turns", None),
+            player_state,
+            [self._safe_action_str(action) for action in playable_actions],
+            list(self.recent_moves),
+        )
+        return hashlib.blake2b(repr(prompt_inputs).encode("utf-8"), digest_size=16).digest()
+
+    def _get_cached_response(self, cache_key: Optional[bytes]) -> Optional[Tuple[str, int]]:
+        """Get the cached (response, prompt_length) for a key, if any."""
+        if cache_key is None:
+            return None
+        cached = self._prompt_cache.get(cache_key)
+        if cached is not None:
+            self._prompt_cache.move_to_end(cache_key)
+            self.cache_hits += 1
+        return cached
+
+    def _store_cached_response(self, cache_key: Optional[bytes], response: str, prompt_length: int):
+        """Remember a response, evicting the least recently used beyond PROMPT_CACHE_SIZE."""
+        if cache_key is None:
+            return
+        self._prompt_cache[cache_key] = (response, prompt_length)
+        if len(self._prompt_cache) > PROMPT_CACHE_SIZE:
+            self._prompt_cache.popitem(last=False)
+
+    def _finish_decision(
+        self,
+        playable_actions,
+        prompt_length: int,
+        response: str,
+        cost: float,
+        tokens: int,
+        was_error: bool
+    ):
+        """
+        Update stats, select and log the action after an LLM query.
+
+        Args:
+            playable_actions: List of valid actions
+            prompt_length: Length of the prompt that was sent
+            response: LLM response text
+            cost: Query cost
+            tokens: Tokens used
+            was_error: Whether all API attempts failed
+
+        Returns:
+            Selected action
+        """
+        # Update stats
+        self.total_cost += cost
+        self.total_tokens += tokens
+        self.move_count += 1
+
+        # If API failed, use random action instead of parsing "1"
+        if was_error:
+            selected_action = self._fallback_action(playable_actions)
+        else:
+            # Parse response to select action
+            selected_action = self._parse_response(response, playable_actions)
+
+        action_str = self._safe_action_str(selected_action)
+
+        # Log the move
+        if self.logger and self.session_id:
+            self.logger.log_move(
+                session_id=self.session_id,
+                player=str(self.color),
+                move_data={
+                    "action": action_str,
+                    "prompt_length": prompt_length,
+                    "response": response[:200] if not was_error else "[API_ERROR]",
+                    "cost": cost,
+                    "tokens": tokens,
+                    "api_error": was_error
+                },
+                turn_number=self.move_count
+            )
+
+        # Track move for context
+        self.recent_moves.append(action_str)
+
+        return selected_action
+
     def _safe_action_str(self, action: Any) -> str:
         """
         Safely convert action to string, handling Catanatron 3.x bug.
 
         Catanatron 3.x has a bug in action_repr that calls .value on string colors.
         This method wraps the conversion in a try/except to provide a fallback.
+        Successful conversions of hashable actions are memoized.
 
         Args:
             action: Action object to convert
@@ -203,7 +545,11 @@ class BaseLLMPlayer(Player, ABC):
             String representation of the action
         """
         try:
-            return str(action)
+            try:
+                return _action_str(action)
+            except TypeError:
+                # Unhashable action value; format without the cache
+                return str(action)
         except (AttributeError, TypeError):
             # Fallback if Catanatron's action_repr fails
             try:
@@ -227,61 +573,58 @@ class BaseLLMPlayer(Player, ABC):
         try:
             # Get player index from color (Catanatron 3.x uses indexed player_state)
             player_index = game.state.color_to_index[self.color]
-            prefix = f"P{player_index}_"
+            player_state = game.state.player_state
+
+            # Read all fields from the flattened player_state dict in one pass
+            (
+                wood, brick, sheep, wheat, ore,
+                victory_points,
+                settlements_available, cities_available, roads_available,
+                knight_count, yop_count, monopoly_count, road_building_count, vp_count,
+            ) = [
+                player_state.get(key, default)
+                for key, default in _player_state_keys(player_index, _PLAYER_FIELDS)
+            ]
 
-            # Get resources from flattened player_state dict
             resources = {
-                "wood": game.state.player_state.get(f"{prefix}WOOD_IN_HAND", 0),
-                "brick": game.state.player_state.get(f"{prefix}BRICK_IN_HAND", 0),
-                "sheep": game.state.player_state.get(f"{prefix}SHEEP_IN_HAND", 0),
-                "wheat": game.state.player_state.get(f"{prefix}WHEAT_IN_HAND", 0),
-                "ore": game.state.player_state.get(f"{prefix}ORE_IN_HAND", 0)
+                "wood": wood,
+                "brick": brick,
+                "sheep": sheep,
+                "wheat": wheat,
+                "ore": ore
             }
 
-            # Get victory points
-            victory_points = game.state.player_state.get(f"{prefix}ACTUAL_VICTORY_POINTS", 0)
-
             # Get buildings (count available vs. total to get built count)
-            settlements_available = game.state.player_state.get(f"{prefix}SETTLEMENTS_AVAILABLE", 5)
             settlements = 5 - settlements_available
-
-            cities_available = game.state.player_state.get(f"{prefix}CITIES_AVAILABLE", 4)
             cities = 4 - cities_available
-
-            roads_available = game.state.player_state.get(f"{prefix}ROADS_AVAILABLE", 15)
             roads = 15 - roads_available
 
-            # Get development cards
-            dev_cards = []
-            knight_count = game.state.player_state.get(f"{prefix}KNIGHT_IN_HAND", 0)
-            yop_count = game.state.player_state.get(f"{prefix}YEAR_OF_PLENTY_IN_HAND", 0)
-            monopoly_count = game.state.player_state.get(f"{prefix}MONOPOLY_IN_HAND", 0)
-            road_building_count = game.state.player_state.get(f"{prefix}ROAD_BUILDING_IN_HAND", 0)
-            vp_count = game.state.player_state.get(f"{prefix}VICTORY_POINT_IN_HAND", 0)
-
-            dev_cards.extend(["KNIGHT"] * knight_count)
-            dev_cards.extend(["YEAR_OF_PLENTY"] * yop_count)
-            dev_cards.extend(["MONOPOLY"] * monopoly_count)
-            dev_cards.extend(["ROAD_BUILDING"] * road_building_count)
-            dev_cards.extend(["VICTORY_POINT"] * vp_count)
+            # Get development cards (counts, zero entries omitted)
+            dev_cards = {
+                card: count
+                for card, count in (
+                    ("KNIGHT", knight_count),
+                    ("YEAR_OF_PLENTY", yop_count),
+                    ("MONOPOLY", monopoly_count),
+                    ("ROAD_BUILDING", road_building_count),
+                    ("VICTORY_POINT", vp_count),
+                )
+                if count
+            }
 
             # Get opponent info (simplified)
             opponents = []
             for opp_color, opp_index in game.state.color_to_index.items():
                 if opp_color != self.color:
-                    opp_prefix = f"P{opp_index}_"
-                    opp_vp = game.state.player_state.get(f"{opp_prefix}ACTUAL_VICTORY_POINTS", 0)
-                    opp_resources = sum([
-                        game.state.player_state.get(f"{opp_prefix}WOOD_IN_HAND", 0),
-                        game.state.player_state.get(f"{opp_prefix}BRICK_IN_HAND", 0),
-                        game.state.player_state.get(f"{opp_prefix}SHEEP_IN_HAND", 0),
-                        game.state.player_state.get(f"{opp_prefix}WHEAT_IN_HAND", 0),
-                        game.state.player_state.get(f"{opp_prefix}ORE_IN_HAND", 0)
-                    ])
+                    opp_vp, *opp_hand = [
+                        player_state.get(key, default)
+                        for key, default in _player_state_keys(opp_index, _OPPONENT_FIELDS)
+                    ]
                     opponents.append({
-                        "color": opp_color,
+                        # Plain string so prompts serialize without enum handling
+                        "color": getattr(opp_color, "value", opp_color),
                         "victory_points": opp_vp,
-                        "resource_count": opp_resources
+                        "resource_count": sum(opp_hand)
                     })
 
             return {
@@ -313,8 +656,18 @@ class BaseLLMPlayer(Player, ABC):
             response_text = response.strip()
             num_actions = len(playable_actions)
 
+            # Requested format: {"action": N, "reason": "..."}, possibly fenced
+            json_match = _JSON_OBJECT_RE.search(response_text)
+            if json_match:
+                try:
+                    action_num = int(json.loads(json_match.group(0))["action"])
+                except (ValueError, KeyError, TypeError):
+                    action_num = 0
+                if 1 <= action_num <= num_actions:
+                    return playable_actions[action_num - 1]
+
             # Pattern 1: Look for "Action: N", "Action N", "**Action: N**", etc.
-            action_pattern = re.search(r'\*{0,2}[Aa]ction[:\s]*(\d+)\*{0,2}', response_text)
+            action_pattern = _ACTION_LABEL_RE.search(response_text)
             if action_pattern:
                 action_num = int(action_pattern.group(1))
                 if 1 <= action_num <= num_actions:
@@ -322,29 +675,30 @@ class BaseLLMPlayer(Player, ABC):
 
             # Pattern 2: Look for standalone number at start of response or after newline
             # Matches "1.", "1)", "1:", "1 -", or just "1" at line start
-            line_start_pattern = re.search(r'(?:^|\n)\s*(\d+)[\.\)\:\s\-]', response_text)
+            line_start_pattern = _LINE_START_NUMBER_RE.search(response_text)
             if line_start_pattern:
                 action_num = int(line_start_pattern.group(1))
                 if 1 <= action_num <= num_actions:
                     return playable_actions[action_num - 1]
 
             # Pattern 3: Find first standalone number in reasonable range
-            all_numbers = re.findall(r'\b(\d+)\b', response_text[:500])  # Check first 500 chars
-            for num_str in all_numbers:
-                num = int(num_str)
+            for match in _NUMBER_RE.finditer(response_text, 0, 500):  # Check first 500 chars
+                num = int(match.group(1))
                 if 1 <= num <= num_actions:
                     return playable_actions[num - 1]
 
-            # Pattern 4: Try to match action description keywords
+            # Pattern 4: Try to match action descriptions, longest first so a
+            # specific action wins over one whose description it contains
             response_lower = response_text.lower()
-            for i, action in enumerate(playable_actions):
-                action_str = self._safe_action_str(action).lower()
-                # Check for key parts of action description
-                if action_str in response_lower:
+            action_strs = [self._safe_action_str(action).lower() for action in playable_actions]
+            for i in sorted(range(num_actions), key=lambda i: len(action_strs[i]), reverse=True):
+                if action_strs[i] in response_lower:
                     return playable_actions[i]
 
             # Default to first action if parsing fails
-            self.log.warning(f"Could not parse response, defaulting to first action. Response: {response[:100]}")
+            self.log.warning(
+                "Could not parse response, defaulting to first action. Response: %.100s", response
+            )
             return playable_actions[0]
 
         except Exception as e:
@@ -366,11 +720,14 @@ class BaseLLMPlayer(Player, ABC):
 
     def reset_state(self):
         """Reset state between games."""
-        self.recent_moves = []
+        self.recent_moves.clear()
         self.total_cost = 0.0
         self.total_tokens = 0
         self.move_count = 0
         self.error_count = 0
+        self.cache_hits = 0
+        self.auto_moves = 0
+        self.cached_tokens = 0
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -386,6 +743,10 @@ class BaseLLMPlayer(Player, ABC):
             "total_tokens": self.total_tokens,
             "move_count": self.move_count,
             "error_count": self.error_count,
+            "cache_hits": self.cache_hits,
+            "auto_moves": self.auto_moves,
+            "cached_tokens": self.cached_tokens,
+            "cached_token_share": self.cached_tokens / self.total_tokens if self.total_tokens > 0 else 0,
             "avg_cost_per_move": self.total_cost / self.move_count if self.move_count > 0 else 0
         }
 
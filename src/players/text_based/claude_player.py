@@ -5,7 +5,8 @@ LLM player implementation using Claude models via OpenRouter.
 """
 
 from llm_game_utils import OpenRouterClient, GameResultLogger
-from .base_player import BaseLLMPlayer
+from .base_player import BaseLLMPlayer, RESPONSE_FORMAT_INSTRUCTION, cached_prompt_tokens
+from ..batch_dispatcher import AnthropicBatchDispatcher, BATCH_COST_MULTIPLIER
 
 
 class ClaudePlayer(BaseLLMPlayer):
@@ -15,6 +16,12 @@ class ClaudePlayer(BaseLLMPlayer):
     Uses OpenRouter API to query Claude models.
     """
 
+    SYSTEM_PROMPT = (
+        "You are an expert Settlers of Catan player. "
+        "Analyze the game state carefully and choose the best action. "
+        + RESPONSE_FORMAT_INSTRUCTION
+    )
+
     def __init__(
         self,
         color,
@@ -22,7 +29,8 @@ class ClaudePlayer(BaseLLMPlayer):
         model_config: dict,
         session_id: str = None,
         logger: GameResultLogger = None,
-        prompt_format: str = "json"
+        prompt_format: str = "json",
+        batch_dispatcher: AnthropicBatchDispatcher = None
     ):
         """
         Initialize Claude player.
@@ -35,6 +43,13 @@ class ClaudePlayer(BaseLLMPlayer):
             session_id: Optional session ID for logging
             logger: Optional GameResultLogger instance
             prompt_format: Prompt format - "json", "json-minified", or "toon"
+            batch_dispatcher: Route queries through the Anthropic Message Batches
+                API (half price, minutes of latency; for offline tournaments).
+                Requires model_config["anthropic_model_id"], the native Anthropic
+                model name (OpenRouter ids are rejected by the Batches API).
+
+        Raises:
+            ValueError: If batch_dispatcher is set without anthropic_model_id
         """
         model_name = model_config.get("name", "Claude")
         super().__init__(color, model_name, session_id, logger, prompt_format=prompt_format)
@@ -42,9 +57,19 @@ class ClaudePlayer(BaseLLMPlayer):
         self.client = client
         self.model_id = model_config["model_id"]
         self.temperature = model_config.get("temperature", 0.7)
-        self.max_tokens = model_config.get("max_tokens", 1000)
+        self.max_tokens = model_config.get("max_tokens", 256)
+
+        self.batch_dispatcher = batch_dispatcher
+        self.anthropic_model_id = model_config.get("anthropic_model_id")
+        if batch_dispatcher is not None and not self.anthropic_model_id:
+            raise ValueError(
+                "model_config['anthropic_model_id'] is required with batch_dispatcher "
+                f"(the OpenRouter id {self.model_id!r} is not a native Anthropic model name)"
+            )
+        self._input_cost_per_token = model_config.get("input_cost", 0.003) / 1000
+        self._output_cost_per_token = model_config.get("output_cost", 0.015) / 1000
 
-    def query_llm(self, prompt: str) -> tuple[str, float, int]:
+    def query_llm(self, prompt: str) -> tuple[str, float, int, int]:
         """
         Query Claude via OpenRouter.
 
@@ -52,19 +77,21 @@ class ClaudePlayer(BaseLLMPlayer):
             prompt: The prompt to send to Claude
 
         Returns:
-            Tuple of (response_text, cost, tokens_used)
+            Tuple of (response_text, cost, tokens_used, cached_tokens)
 
         Raises:
             Exception: If the API call fails (will be retried by base class)
         """
+        if self.batch_dispatcher is not None:
+            return self._query_batch(prompt)
+
+        # No cache_control here: OpenRouterClient.query() takes the system
+        # prompt as a plain string, and this prompt is far below Anthropic's
+        # 1024-token minimum cacheable prefix anyway
         response = self.client.query(
             model_id=self.model_id,
             prompt=prompt,
-            system_prompt=(
-                "You are an expert Settlers of Catan player. "
-                "Analyze the game state carefully and choose the best action. "
-                "Respond with the number of your chosen action and a brief explanation."
-            ),
+            system_prompt=self.SYSTEM_PROMPT,
             temperature=self.temperature,
             max_tokens=self.max_tokens
         )
@@ -72,5 +99,36 @@ class ClaudePlayer(BaseLLMPlayer):
         return (
             response.response,
             response.cost,
-            response.total_tokens
+            response.total_tokens,
+            cached_prompt_tokens(response)
+        )
+
+    def _query_batch(self, prompt: str) -> tuple[str, float, int, int]:
+        """
+        Query Claude through the Message Batches API, blocking until the batch ends.
+
+        Args:
+            prompt: The prompt to send to Claude
+
+        Returns:
+            Tuple of (response_text, cost, tokens_used, cached_tokens)
+        """
+        message = self.batch_dispatcher.submit({
+            "model": self.anthropic_model_id,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "system": self.SYSTEM_PROMPT,
+            "messages": [{"role": "user", "content": prompt}]
+        }).result()
+
+        text = "\n".join(
+            block.text for block in message.content if getattr(block, "type", None) == "text"
         )
+        input_tokens = message.usage.input_tokens
+        output_tokens = message.usage.output_tokens
+        cost = (
+            input_tokens * self._input_cost_per_token
+            + output_tokens * self._output_cost_per_token
+        ) * BATCH_COST_MULTIPLIER
+
+        return (text, cost, input_tokens + output_tokens, cached_prompt_tokens(message))
@@ -5,7 +5,7 @@ LLM player implementation using GPT models via OpenRouter.
 """
 
 from llm_game_utils import OpenRouterClient, GameResultLogger
-from .base_player import BaseLLMPlayer
+from .base_player import BaseLLMPlayer, RESPONSE_FORMAT_INSTRUCTION, cached_prompt_tokens
 
 
 class GPTPlayer(BaseLLMPlayer):
@@ -15,6 +15,13 @@ class GPTPlayer(BaseLLMPlayer):
     Uses OpenRouter API to query GPT models.
     """
 
+    SYSTEM_PROMPT = (
+        "You are an expert Settlers of Catan player with strong strategic thinking. "
+        "Carefully evaluate each available action and choose the one that maximizes "
+        "your chances of winning. "
+        + RESPONSE_FORMAT_INSTRUCTION
+    )
+
     def __init__(
         self,
         color,
@@ -42,9 +49,9 @@ class GPTPlayer(BaseLLMPlayer):
         self.client = client
         self.model_id = model_config["model_id"]
         self.temperature = model_config.get("temperature", 0.7)
-        self.max_tokens = model_config.get("max_tokens", 1000)
+        self.max_tokens = model_config.get("max_tokens", 256)
 
-    def query_llm(self, prompt: str) -> tuple[str, float, int]:
+    def query_llm(self, prompt: str) -> tuple[str, float, int, int]:
         """
         Query GPT via OpenRouter.
 
@@ -52,7 +59,7 @@ class GPTPlayer(BaseLLMPlayer):
             prompt: The prompt to send to GPT
 
         Returns:
-            Tuple of (response_text, cost, tokens_used)
+            Tuple of (response_text, cost, tokens_used, cached_tokens)
 
         Raises:
             Exception: If the API call fails (will be retried by base class)
@@ -60,12 +67,7 @@ class GPTPlayer(BaseLLMPlayer):
         response = self.client.query(
             model_id=self.model_id,
             prompt=prompt,
-            system_prompt=(
-                "You are an expert Settlers of Catan player with strong strategic thinking. "
-                "Carefully evaluate each available action and choose the one that maximizes "
-                "your chances of winning. Respond with the number of your chosen action "
-                "followed by your reasoning."
-            ),
+            system_prompt=self.SYSTEM_PROMPT,
             temperature=self.temperature,
             max_tokens=self.max_tokens
         )
@@ -73,5 +75,6 @@ class GPTPlayer(BaseLLMPlayer):
         return (
             response.response,
             response.cost,
-            response.total_tokens
+            response.total_tokens,
+            cached_prompt_tokens(response)
         )
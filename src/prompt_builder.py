@@ -10,17 +10,203 @@ Supports multiple formats for token efficiency:
 - toon: TOON-style format (Token-Oriented Object Notation) for ~53% token reduction
 """
 
+import functools
 import json
-from typing import List, Dict, Any, Literal, Optional
+import operator
+import sys
+from itertools import islice
+from typing import Callable, List, Dict, Any, Literal, Optional, Sequence, Tuple, Union
 from llm_game_utils import PromptFormatter
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+__all__ = ["CatanPromptBuilder", "PromptFormat", "RESPONSE_FORMAT_INSTRUCTION"]
+
 # Type alias for format options
 PromptFormat = Literal["json", "json-minified", "toon"]
 
+# Fixed part of the TOON prompt; filled with str.format_map in _toon_prompt
+_TOON_HEADER = """SETTLERS OF CATAN - Choose your action
+
+Turn: {turn} | You: {color}
+
+Resources{{wood, brick, sheep, wheat, ore}}:
+{wood}, {brick}, {sheep}, {wheat}, {ore}
+
+Buildings{{settlements, cities, roads}}:
+{settlements}, {cities}, {roads}
+
+VP: {vp}
+Dev Cards[{dev_card_count}]: {dev_cards}
+
+Opponents[{opponent_count}]{{color, vp, cards}}:
+"""
+
+# Fixed TOON schema: zero-filled defaults and one-call getters in column order
+_EMPTY_RESOURCES = {"wood": 0, "brick": 0, "sheep": 0, "wheat": 0, "ore": 0}
+_RESOURCE_GETTER = operator.itemgetter(*_EMPTY_RESOURCES)
+_NO_BUILDINGS = {"settlements": 0, "cities": 0, "roads": 0}
+_BUILDING_GETTER = operator.itemgetter(*_NO_BUILDINGS)
+
+# Answer format requested by every text player's system prompt; also the
+# closing line of the compact prompt formats
+RESPONSE_FORMAT_INSTRUCTION = (
+    'Respond with JSON only: {"action": <action number>, "reason": "<at most 20 words>"}'
+)
+
+# Strategic hints for _build_context
+_CONTEXT_NEAR_WIN = "You're close to winning! Focus on reaching 10 victory points."
+_CONTEXT_EARLY_GAME = "Early game - focus on expansion and resource generation."
+_CONTEXT_DEFAULT = "Choose your action carefully to maximize your chances of winning."
+
+
+# Encoder is picked once at import; orjson always emits minified output
+if ORJSON_AVAILABLE:
+    def _dumps_compact(data: Any) -> str:
+        """Serialize to JSON without whitespace (orjson)."""
+        return orjson.dumps(data, default=str).decode("utf-8")
+else:
+    def _dumps_compact(data: Any) -> str:
+        """Serialize to JSON without whitespace (stdlib fallback)."""
+        return json.dumps(data, separators=(',', ':'), default=str)
+
+
+def _action_to_string_uncached(action: Any) -> str:
+    """Readable string for a Catanatron action (see CatanPromptBuilder._action_to_string)."""
+    # Every object has __str__, so just try Catanatron's string representation
+    try:
+        return sys.intern(str(action))
+    except AttributeError:
+        # Catanatron 3.x has a bug where action_repr tries to call .value on string colors
+        pass
+
+    # Fallback: construct a basic description
+    try:
+        action_type = type(action).__name__
+
+        # Handle different action types
+        if hasattr(action, 'action_type'):
+            action_type = sys.intern(f"{action.action_type}")
+
+        # Try to get color if available
+        color_str = ""
+        if hasattr(action, 'color'):
+            color_str = f" for {action.color}"
+
+        return f"{action_type}{color_str}"
+    except Exception:
+        return "Action"
+
+
+# Catanatron actions are hashable namedtuples that recur every turn; results
+# are interned so the text players' own action-string cache shares them
+_action_to_string_cached = functools.lru_cache(maxsize=4096)(_action_to_string_uncached)
+
+
+def _format_dev_cards(dev_cards: Union[Dict[str, int], List[str]]) -> Tuple[int, str]:
+    """Total and inline summary of development cards (see CatanPromptBuilder)."""
+    if not isinstance(dev_cards, dict):
+        return len(dev_cards), ", ".join(dev_cards) if dev_cards else "none"
+
+    total = sum(dev_cards.values())
+    if not total:
+        return 0, "none"
+    return total, ", ".join(f"{card}:{count}" for card, count in dev_cards.items() if count)
+
+
+def _get_columns(getter: Callable, defaults: Dict[str, int], values: Dict[str, Any]) -> Tuple:
+    """
+    Read a fixed set of columns, zero-filling any that are missing.
+
+    Text players always send the full schema, so the direct itemgetter call
+    is the normal path; the merged-dict fallback only runs for partial states.
+    """
+    try:
+        return getter(values)
+    except KeyError:
+        return getter({**defaults, **values})
+
+
+# Prompt bodies are plain functions of already-extracted data: no builder
+# state or self.* lookups on the per-turn path, and easy to swap for a
+# compiled implementation later.
+def _toon_prompt(
+    player_state: Dict[str, Any],
+    action_choices: List[str],
+    context: str,
+    turn: int
+) -> str:
+    """TOON-style prompt text (see CatanPromptBuilder._format_toon_style)."""
+    # Extract resources and buildings with consistent ordering
+    wood, brick, sheep, wheat, ore = _get_columns(
+        _RESOURCE_GETTER, _EMPTY_RESOURCES, player_state.get("resources", {})
+    )
+    settlements, cities, roads = _get_columns(_BUILDING_GETTER, _NO_BUILDINGS, player_state)
+
+    # Get victory points and dev cards
+    vp = player_state.get("victory_points", 0)
+    dev_card_count, dev_cards_str = _format_dev_cards(player_state.get("dev_cards", {}))
+
+    # Get opponents
+    opponents = player_state.get("opponents", [])
+
+    # Build TOON-style prompt
+    parts: List[str] = [_TOON_HEADER.format_map({
+        "turn": turn,
+        "color": player_state.get("color", "UNKNOWN"),
+        "wood": wood, "brick": brick, "sheep": sheep, "wheat": wheat, "ore": ore,
+        "settlements": settlements, "cities": cities, "roads": roads,
+        "vp": vp,
+        "dev_card_count": dev_card_count,
+        "dev_cards": dev_cards_str,
+        "opponent_count": len(opponents),
+    })]
+    # Add opponents, one row each
+    if opponents:
+        parts.append("\n".join(
+            f"{opp.get('color', '?')}, {opp.get('victory_points', 0)}, {opp.get('resource_count', 0)}"
+            for opp in opponents
+        ) + "\n")
+
+    # Add actions
+    parts.append(f"\nActions[{len(action_choices)}]:\n")
+    if action_choices:
+        parts.append("\n".join(f"{i}. {action}" for i, action in enumerate(action_choices, 1)) + "\n")
+
+    # Add context/instructions
+    parts.append(f"\n{context}\n\n{RESPONSE_FORMAT_INSTRUCTION}")
+
+    return "".join(parts)
+
+
+def _json_minified_prompt(state_dict: Dict[str, Any], action_choices: List[str], context: str) -> str:
+    """Minified JSON prompt text (see CatanPromptBuilder._format_json_minified)."""
+    # Build complete state for minification
+    full_state = {
+        "game": "Settlers of Catan",
+        "state": state_dict,
+        # Numbered strings rather than {"1": ...}: no per-action dict entry,
+        # shorter on the wire, and the model never has to count positions
+        "actions": [f"{i}. {action}" for i, action in enumerate(action_choices, 1)]
+    }
+
+    # Minify JSON
+    minified = _dumps_compact(full_state)
+
+    prompt = f"{minified}\n\n{context}\n\n{RESPONSE_FORMAT_INSTRUCTION}"
+
+    return prompt
+
 
 class CatanPromptBuilder:
     """Builds prompts for LLM players in Settlers of Catan."""
 
+    __slots__ = ("formatter", "_prompt_format", "_build")
+
     def __init__(self, prompt_format: PromptFormat = "json"):
         """
         Initialize the prompt builder with PromptFormatter.
@@ -31,12 +217,27 @@ class CatanPromptBuilder:
         self.formatter = PromptFormatter()
         self.prompt_format = prompt_format
 
+    @property
+    def prompt_format(self) -> PromptFormat:
+        """Default prompt format; setting it re-resolves the format builder."""
+        return self._prompt_format
+
+    @prompt_format.setter
+    def prompt_format(self, prompt_format: PromptFormat):
+        self._prompt_format = prompt_format
+        self._build = self._builder_for(prompt_format)
+
+    @classmethod
+    def _builder_for(cls, prompt_format: str):
+        """Format builder for a format name; unknown names use standard JSON."""
+        return cls._FORMAT_BUILDERS.get(prompt_format, cls._build_json)
+
     def build_action_prompt(
         self,
         game_state: Any,
         player_state: Dict[str, Any],
         available_actions: List[Any],
-        recent_moves: List[str] = None,
+        recent_moves: Sequence[str] = None,
         prompt_format: Optional[PromptFormat] = None
     ) -> str:
         """
@@ -52,11 +253,11 @@ class CatanPromptBuilder:
         Returns:
             Formatted prompt string ready for LLM
         """
-        # Use provided format or fall back to instance default
-        active_format = prompt_format or self.prompt_format
-
-        # Extract and format game state
-        state_dict = self._extract_state_dict(game_state, player_state)
+        # Format builder was resolved when the default format was set
+        if prompt_format is None or prompt_format == self._prompt_format:
+            build = self._build
+        else:
+            build = self._builder_for(prompt_format)
 
         # Format available actions as readable choices
         action_choices = self._format_actions(available_actions)
@@ -64,20 +265,34 @@ class CatanPromptBuilder:
         # Build context from recent moves
         context = self._build_context(recent_moves, player_state)
 
-        # Route to appropriate formatter based on format
-        if active_format == "toon":
-            return self._format_toon_style(game_state, player_state, action_choices, context)
-        elif active_format == "json-minified":
-            return self._format_json_minified(state_dict, action_choices, context)
-        else:
-            # Default: standard JSON format
-            prompt = self.formatter.format_game_state(
-                game_name="Settlers of Catan",
-                current_state=state_dict,
-                available_actions=action_choices,
-                additional_context=context
-            )
-            return prompt
+        return build(self, game_state, player_state, action_choices, context)
+
+    def _build_json(
+        self,
+        game_state: Any,
+        player_state: Dict[str, Any],
+        action_choices: List[str],
+        context: str
+    ) -> str:
+        """Standard JSON prompt via PromptFormatter (the default format)."""
+        return self.formatter.format_game_state(
+            game_name="Settlers of Catan",
+            current_state=self._extract_state_dict(game_state, player_state),
+            available_actions=action_choices,
+            additional_context=context
+        )
+
+    def _build_json_minified(
+        self,
+        game_state: Any,
+        player_state: Dict[str, Any],
+        action_choices: List[str],
+        context: str
+    ) -> str:
+        """Minified JSON prompt from the extracted state dict."""
+        return self._format_json_minified(
+            self._extract_state_dict(game_state, player_state), action_choices, context
+        )
 
     def _extract_state_dict(self, game_state: Any, player_state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -98,7 +313,7 @@ class CatanPromptBuilder:
                 "cities": player_state.get("cities", 0),
                 "roads": player_state.get("roads", 0)
             },
-            "your_development_cards": player_state.get("dev_cards", []),
+            "your_development_cards": player_state.get("dev_cards", {}),
         }
 
         # Add opponent information (limited to avoid prompt bloat)
@@ -142,31 +357,12 @@ class CatanPromptBuilder:
             Human-readable action description
         """
         try:
-            # Try to use Catanatron's string representation
-            if hasattr(action, '__str__'):
-                return str(action)
-        except AttributeError:
-            # Catanatron 3.x has a bug where action_repr tries to call .value on string colors
-            pass
-
-        # Fallback: construct a basic description
-        try:
-            action_type = str(type(action).__name__)
-
-            # Handle different action types
-            if hasattr(action, 'action_type'):
-                action_type = str(action.action_type)
-
-            # Try to get color if available
-            color_str = ""
-            if hasattr(action, 'color'):
-                color_str = f" for {action.color}"
+            return _action_to_string_cached(action)
+        except TypeError:
+            # Unhashable action objects can't be memoized
+            return _action_to_string_uncached(action)
 
-            return f"{action_type}{color_str}"
-        except Exception:
-            return "Action"
-
-    def _build_context(self, recent_moves: List[str] = None, player_state: Dict[str, Any] = None) -> str:
+    def _build_context(self, recent_moves: Sequence[str] = None, player_state: Dict[str, Any] = None) -> str:
         """
         Build contextual information to help the LLM make better decisions.
 
@@ -177,26 +373,25 @@ class CatanPromptBuilder:
         Returns:
             Context string
         """
-        context_parts = []
-
-        # Add recent moves context
-        if recent_moves and len(recent_moves) > 0:
-            recent_context = "Recent moves: " + ", ".join(recent_moves[-3:])
-            context_parts.append(recent_context)
-
-        # Add strategic context based on game state
+        # Strategic context based on game state
+        vp_context = None
         if player_state:
             vp = player_state.get("victory_points", 0)
             if vp >= 8:
-                context_parts.append("You're close to winning! Focus on reaching 10 victory points.")
+                vp_context = _CONTEXT_NEAR_WIN
             elif vp <= 2:
-                context_parts.append("Early game - focus on expansion and resource generation.")
+                vp_context = _CONTEXT_EARLY_GAME
 
-        # Combine context
-        if context_parts:
-            return " ".join(context_parts)
+        if not recent_moves:
+            return vp_context or _CONTEXT_DEFAULT
 
-        return "Choose your action carefully to maximize your chances of winning."
+        # Recent moves context (last 3; islice also works on deques)
+        if len(recent_moves) > 3:
+            recent_moves = islice(recent_moves, len(recent_moves) - 3, None)
+        recent_context = "Recent moves: " + ", ".join(recent_moves)
+        if vp_context:
+            return f"{recent_context} {vp_context}"
+        return recent_context
 
     def build_trade_prompt(
         self,
@@ -215,20 +410,20 @@ class CatanPromptBuilder:
         """
         resources = player_state.get("resources", {})
 
-        prompt = f"""Trading Decision in Settlers of Catan
+        parts = [f"""Trading Decision in Settlers of Catan
 
 Your current resources: {self._format_resources(resources)}
 
 Available trade options:
-"""
+"""]
         for i, trade in enumerate(trade_options, 1):
             give = trade.get("give", {})
             receive = trade.get("receive", {})
-            prompt += f"\n{i}. Give: {self._format_resources(give)} → Receive: {self._format_resources(receive)}"
+            parts.append(f"\n{i}. Give: {self._format_resources(give)} → Receive: {self._format_resources(receive)}")
 
-        prompt += "\n\nWhich trade would you like to make? Choose the number or 'none' to skip trading."
+        parts.append("\n\nWhich trade would you like to make? Choose the number or 'none' to skip trading.")
 
-        return prompt
+        return "".join(parts)
 
     def _format_resources(self, resources: Dict[str, int]) -> str:
         """
@@ -240,15 +435,19 @@ Available trade options:
         Returns:
             Formatted resource string
         """
-        if not resources:
-            return "none"
+        return ", ".join(f"{count} {resource}" for resource, count in resources.items() if count > 0) or "none"
 
-        formatted = []
-        for resource, count in resources.items():
-            if count > 0:
-                formatted.append(f"{count} {resource}")
+    def _format_dev_cards(self, dev_cards: Union[Dict[str, int], List[str]]) -> Tuple[int, str]:
+        """
+        Format development cards as a total and an inline summary.
+
+        Args:
+            dev_cards: Card name to count (or a list with one entry per card)
 
-        return ", ".join(formatted) if formatted else "none"
+        Returns:
+            Tuple of (total cards, summary like "KNIGHT:2, MONOPOLY:1")
+        """
+        return _format_dev_cards(dev_cards)
 
     def _format_toon_style(
         self,
@@ -274,66 +473,11 @@ Available trade options:
         Returns:
             TOON-formatted prompt string
         """
-        # Get turn number from game state (it's in game_state.state.num_turns)
-        turn = 0
-        if game_state:
-            if hasattr(game_state, 'state') and hasattr(game_state.state, 'num_turns'):
-                turn = game_state.state.num_turns
-            elif hasattr(game_state, 'num_turns'):
-                turn = game_state.num_turns
-
-        # Extract resources with consistent ordering
-        res = player_state.get("resources", {})
-        wood = res.get("wood", 0)
-        brick = res.get("brick", 0)
-        sheep = res.get("sheep", 0)
-        wheat = res.get("wheat", 0)
-        ore = res.get("ore", 0)
-
-        # Extract buildings
-        settlements = player_state.get("settlements", 0)
-        cities = player_state.get("cities", 0)
-        roads = player_state.get("roads", 0)
-
-        # Get victory points and dev cards
-        vp = player_state.get("victory_points", 0)
-        dev_cards = player_state.get("dev_cards", [])
-
-        # Get opponents
-        opponents = player_state.get("opponents", [])
-
-        # Build TOON-style prompt
-        prompt = f"""SETTLERS OF CATAN - Choose your action
-
-Turn: {turn} | You: {player_state.get('color', 'UNKNOWN')}
+        # Get turn number from game state (it's in game_state.state.num_turns,
+        # or on game_state itself when passed a bare State)
+        turn = getattr(getattr(game_state, "state", game_state), "num_turns", 0)
 
-Resources{{wood, brick, sheep, wheat, ore}}:
-{wood}, {brick}, {sheep}, {wheat}, {ore}
-
-Buildings{{settlements, cities, roads}}:
-{settlements}, {cities}, {roads}
-
-VP: {vp}
-Dev Cards[{len(dev_cards)}]: {', '.join(dev_cards) if dev_cards else 'none'}
-
-Opponents[{len(opponents)}]{{color, vp, cards}}:
-"""
-        # Add opponents
-        for opp in opponents:
-            prompt += f"{opp.get('color', '?')}, {opp.get('victory_points', 0)}, {opp.get('resource_count', 0)}\n"
-
-        # Add actions
-        prompt += f"\nActions[{len(action_choices)}]:\n"
-        for i, action in enumerate(action_choices, 1):
-            prompt += f"{i}. {action}\n"
-
-        # Add context/instructions
-        prompt += f"""
-{context}
-
-Reply with the action number and brief reasoning."""
-
-        return prompt
+        return _toon_prompt(player_state, action_choices, context, turn)
 
     def _format_json_minified(
         self,
@@ -354,20 +498,11 @@ Reply with the action number and brief reasoning."""
         Returns:
             JSON-minified prompt string
         """
-        # Build complete state for minification
-        full_state = {
-            "game": "Settlers of Catan",
-            "state": state_dict,
-            "actions": {str(i+1): action for i, action in enumerate(action_choices)}
-        }
-
-        # Minify JSON
-        minified = json.dumps(full_state, separators=(',', ':'))
-
-        prompt = f"""{minified}
-
-{context}
-
-Reply with the action number and brief reasoning."""
-
-        return prompt
+        return _json_minified_prompt(state_dict, action_choices, context)
+
+    # Non-default format builders; TOON reads player_state directly and
+    # never needs the extracted state dict
+    _FORMAT_BUILDERS = {
+        "toon": _format_toon_style,
+        "json-minified": _build_json_minified,
+    }
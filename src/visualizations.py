@@ -4,9 +4,12 @@ Visualization Module for LLM Catan Arena.
 Generate professional, blog-ready charts and visualizations.
 """
 
+import functools
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 import pandas as pd
 import numpy as np
@@ -36,27 +39,230 @@ plt.rcParams['xtick.labelsize'] = 9
 plt.rcParams['ytick.labelsize'] = 9
 plt.rcParams['legend.fontsize'] = 9
 
+# Saved-chart resolution; pass dpi=300 for final, blog-ready exports
+DEFAULT_DPI = 150
+
+
+@functools.lru_cache(maxsize=32)
+def _palette(name: str, n_colors: Optional[int] = None) -> Tuple[Tuple[float, float, float], ...]:
+    """Cached seaborn palette as an immutable tuple of RGB colors."""
+    return tuple(sns.color_palette(name, n_colors))
+
+
+def _color_to_model(game: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Map each player color in a game to its full model name.
+
+    Args:
+        game: Game result dictionary
+
+    Returns:
+        Dictionary mapping color (e.g. 'RED') to full model name
+    """
+    # extract_full_model_name only reads final_scores keys
+    return _color_to_model_cached(tuple(game.get("players", [])),
+                                  tuple(game.get("final_scores", {})))
+
+
+@functools.lru_cache(maxsize=1024)
+def _color_to_model_cached(players: Tuple[str, ...],
+                           score_names: Tuple[str, ...]) -> Dict[str, str]:
+    """Color -> model for a player lineup; tournaments repeat lineups across games."""
+    final_scores = dict.fromkeys(score_names)
+    color_to_model = {}
+    for player_str in players:
+        # First player with a matching color wins, like the per-move scan did
+        if ':' in player_str:
+            color_to_model.setdefault(player_str.rsplit(':', 1)[1],
+                                      extract_full_model_name(final_scores, player_str))
+    return color_to_model
+
+
+def _moves_frame(games: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Flatten every move of every game into one DataFrame (single pass over games).
+
+    Args:
+        games: List of game result dictionaries
+
+    Returns:
+        DataFrame with one row per move, in game order: game_idx, model
+        (categorical; NaN when the player's model is unknown), timestamp (raw
+        string), turn_number, prompt_length, tokens
+    """
+    # Numeric columns are preallocated and filled in place rather than grown
+    # as Python lists and converted afterwards
+    total_moves = sum(len(game.get("moves", [])) for game in games)
+    game_idx = np.empty(total_moves, dtype=np.int64)
+    turns = np.empty(total_moves, dtype=np.int64)
+    prompt_lengths = np.empty(total_moves, dtype=np.int64)
+    totals = np.empty(total_moves, dtype=np.int64)
+    models: List[Optional[str]] = []
+    timestamps: List[Optional[str]] = []
+
+    k = 0
+    for i, game in enumerate(games):
+        moves = game.get("moves", [])
+        if not moves:
+            continue
+        color_to_model = _color_to_model(game)
+
+        for move in moves:
+            move_data = move.get("move_data", {})
+            game_idx[k] = i
+            turns[k] = move.get("turn_number", 0)
+            prompt_lengths[k] = move_data.get("prompt_length", 0)
+            totals[k] = move_data.get("tokens", 0)
+            models.append(color_to_model.get(move.get("player")))
+            timestamps.append(move.get("timestamp"))
+            k += 1
+
+    return pd.DataFrame({
+        "game_idx": game_idx,
+        "model": pd.Series(models, dtype="category"),
+        "timestamp": pd.Series(timestamps, dtype=object),
+        "turn_number": turns,
+        "prompt_length": prompt_lengths,
+        "tokens": totals,
+    })
+
+
+def _game_lengths(moves: pd.DataFrame) -> np.ndarray:
+    """
+    Get the length (highest turn number) of every game that has moves.
+
+    Turn numbers are reduced per game with one np.maximum.reduceat over the
+    flattened moves, instead of a Python max() per game. reduceat is already
+    a single compiled pass, so a JIT kernel (e.g. numba) would not beat it.
+
+    Args:
+        moves: Output of _moves_frame()
+
+    Returns:
+        Array of game lengths in turns (games without moves are skipped)
+    """
+    turns = moves["turn_number"].to_numpy()
+    if turns.size == 0:
+        return turns
+
+    # Rows are in game order, so each game's segment starts where game_idx changes
+    starts = np.flatnonzero(np.diff(moves["game_idx"].to_numpy(), prepend=-1))
+    return np.maximum.reduceat(turns, starts)
+
+
+def _decision_times(moves: pd.DataFrame) -> Dict[str, List[float]]:
+    """
+    Get seconds between consecutive moves, grouped by the moving player's model.
+
+    All timestamps are parsed in one pd.to_datetime call and differenced per
+    game with a groupby; missing or malformed timestamps become NaT and drop
+    out with the duration filter.
+
+    Args:
+        moves: Output of _moves_frame()
+
+    Returns:
+        Dictionary mapping full model name to decision times (0 < t < 60 seconds)
+    """
+    if moves.empty:
+        return {}
+
+    ts = pd.to_datetime(moves["timestamp"], format="ISO8601", errors="coerce", utc=True)
+    dur = ts.groupby(moves["game_idx"]).diff().dt.total_seconds()
+
+    # Only count reasonable durations (< 60 seconds) for known models
+    mask = (dur > 0) & (dur < 60) & moves["model"].notna()
+    by_model = dur[mask].groupby(moves["model"][mask], observed=True)
+    return {model: durs.tolist() for model, durs in by_model}
+
+
+def _token_usage(moves: pd.DataFrame) -> pd.DataFrame:
+    """
+    Get average estimated input/output tokens per move for each model.
+
+    Input tokens are estimated as prompt_length / 4; output tokens are the
+    rest of the reported total. Averaged with a single groupby.
+
+    Args:
+        moves: Output of _moves_frame()
+
+    Returns:
+        DataFrame indexed by full model name (sorted) with 'input' and 'output' columns
+    """
+    known = moves[moves["model"].notna()]
+    tokens = pd.DataFrame({"model": known["model"], "input": known["prompt_length"] // 4})
+    tokens["output"] = (known["tokens"] - tokens["input"]).clip(lower=0)
+    means = tokens.groupby("model", observed=True)[["input", "output"]].mean()
+    means.index = means.index.astype(object)
+    return means.sort_index()
+
+
+def games_to_frames(games: List[Dict[str, Any]]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Convert nested game dictionaries into columnar frames.
+
+    Args:
+        games: List of game result dictionaries
+
+    Returns:
+        Tuple of (games_df with one row per game: session_id, winner, players,
+        final_scores; moves_df with one row per move, see _moves_frame())
+    """
+    games_df = pd.DataFrame({
+        "session_id": [g.get("session_id", "") for g in games],
+        # object dtype keeps a missing winner as None through to_dict();
+        # categorical/string columns would turn it into a truthy NaN
+        "winner": pd.Series([g.get("winner", "") for g in games], dtype=object),
+        "players": [g.get("players", []) for g in games],
+        "final_scores": [g.get("final_scores", {}) for g in games],
+    })
+    return games_df, _moves_frame(games)
+
+
+def extract_move_features(
+    games: List[Dict[str, Any]]
+) -> Tuple[np.ndarray, Dict[str, List[float]], pd.DataFrame]:
+    """
+    Compute all move-level chart inputs from one pass over the games.
+
+    Args:
+        games: List of game result dictionaries
+
+    Returns:
+        Tuple of (game lengths, decision times per model, token usage per model),
+        as used by plot_game_length_distribution, plot_decision_speed and
+        plot_token_usage
+    """
+    moves = _moves_frame(games)
+    return _game_lengths(moves), _decision_times(moves), _token_usage(moves)
+
 
 def plot_win_rates(games: List[Dict[str, Any]],
-                   output_path: str = "output/charts/win_rates.png") -> None:
+                   output_path: str = "output/charts/win_rates.png",
+                   win_rates: Optional[pd.DataFrame] = None,
+                   dpi: int = DEFAULT_DPI) -> None:
     """
     Create and save win rate bar chart.
 
     Args:
         games: List of game result dictionaries
         output_path: Path to save the chart
+        win_rates: Precomputed calculate_win_rates(games) result (computed if None)
+        dpi: Raster resolution (ignored for vector formats like .svg/.pdf)
     """
-    win_rates = calculate_win_rates(games)
+    if win_rates is None:
+        win_rates = calculate_win_rates(games)
 
     if win_rates.empty:
         logging.warning("No win rate data to plot")
         return
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
 
     # Create bar plot
     bars = ax.bar(range(len(win_rates)), win_rates['win_rate'],
-                  color=sns.color_palette("husl", len(win_rates)),
+                  color=_palette("husl", len(win_rates)),
                   edgecolor='black', linewidth=0.5)
 
     # Customize
@@ -70,44 +276,50 @@ def plot_win_rates(games: List[Dict[str, Any]],
     ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda y, _: f'{y:.0%}'))
 
     # Add value labels on bars
-    for i, (idx, row) in enumerate(win_rates.iterrows()):
-        height = row['win_rate']
-        ax.text(i, height + 0.02,
-               f"{row['win_rate']:.1%}\n({row['wins']}/{row['games']})",
+    y_offset = 0.02
+    for i, row in enumerate(win_rates.itertuples(index=False)):
+        height = row.win_rate
+        ax.text(i, height + y_offset,
+               f"{row.win_rate:.1%}\n({row.wins}/{row.games})",
                ha='center', va='bottom', fontsize=8, fontweight='bold')
 
     # Add grid
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     ax.set_axisbelow(True)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
 
     logging.info(f"Win rates chart saved to {output_path}")
     print(f"✓ Win rates chart saved to {output_path}")
 
 
 def plot_cost_efficiency(games: List[Dict[str, Any]],
-                        output_path: str = "output/charts/cost_efficiency.png") -> None:
+                        output_path: str = "output/charts/cost_efficiency.png",
+                        costs: Optional[pd.DataFrame] = None,
+                        dpi: int = DEFAULT_DPI) -> None:
     """
     Create and save cost efficiency scatter plot (cost vs wins).
 
     Args:
         games: List of game result dictionaries
         output_path: Path to save the chart
+        costs: Precomputed calculate_costs(games) result (computed if None)
+        dpi: Raster resolution (ignored for vector formats like .svg/.pdf)
     """
-    costs = calculate_costs(games)
+    if costs is None:
+        costs = calculate_costs(games)
 
     if costs.empty:
         logging.warning("No cost data to plot")
         return
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
 
     # Create scatter plot with size based on games played
     scatter = ax.scatter(costs['total_cost'], costs['wins'],
@@ -119,9 +331,9 @@ def plot_cost_efficiency(games: List[Dict[str, Any]],
                         linewidth=1)
 
     # Add model labels
-    for _, row in costs.iterrows():
-        ax.annotate(row['model'],
-                   (row['total_cost'], row['wins']),
+    for row in costs.itertuples(index=False):
+        ax.annotate(row.model,
+                   (row.total_cost, row.wins),
                    xytext=(5, 5), textcoords='offset points',
                    fontsize=8, fontweight='bold')
 
@@ -132,35 +344,39 @@ def plot_cost_efficiency(games: List[Dict[str, Any]],
                  fontweight='bold', pad=20)
     ax.grid(True, alpha=0.3, linestyle='--')
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
 
     logging.info(f"Cost efficiency chart saved to {output_path}")
     print(f"✓ Cost efficiency chart saved to {output_path}")
 
 
 def plot_cost_per_win(games: List[Dict[str, Any]],
-                     output_path: str = "output/charts/cost_per_win.png") -> None:
+                     output_path: str = "output/charts/cost_per_win.png",
+                     costs: Optional[pd.DataFrame] = None,
+                     dpi: int = DEFAULT_DPI) -> None:
     """
     Create and save cost per win bar chart.
 
     Args:
         games: List of game result dictionaries
         output_path: Path to save the chart
+        costs: Precomputed calculate_costs(games) result (computed if None)
+        dpi: Raster resolution (ignored for vector formats like .svg/.pdf)
     """
-    costs = calculate_costs(games)
+    if costs is None:
+        costs = calculate_costs(games)
 
     if costs.empty:
         logging.warning("No cost data to plot")
         return
 
-    # Filter out infinite values (models with no wins)
-    costs_filtered = costs[costs['cost_per_win'] != float('inf')].copy()
+    # Filter out infinite/NaN values (models with no wins)
+    costs_filtered = costs.loc[np.isfinite(costs['cost_per_win'].to_numpy())]
 
     if costs_filtered.empty:
         logging.warning("No models with wins to plot cost per win")
@@ -168,11 +384,12 @@ def plot_cost_per_win(games: List[Dict[str, Any]],
 
     costs_filtered = costs_filtered.sort_values('cost_per_win')
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
 
     # Create bar plot
     bars = ax.bar(range(len(costs_filtered)), costs_filtered['cost_per_win'],
-                  color=sns.color_palette("rocket", len(costs_filtered)),
+                  color=_palette("rocket", len(costs_filtered)),
                   edgecolor='black', linewidth=0.5)
 
     # Customize
@@ -183,55 +400,55 @@ def plot_cost_per_win(games: List[Dict[str, Any]],
     ax.set_xticks(range(len(costs_filtered)))
     ax.set_xticklabels(costs_filtered['model'], rotation=45, ha='right')
 
-    # Add value labels
-    for i, (idx, row) in enumerate(costs_filtered.iterrows()):
-        height = row['cost_per_win']
-        ax.text(i, height + (ax.get_ylim()[1] * 0.01),
+    # Add value labels (the y-limit is fixed by now, so read it once)
+    y_offset = ax.get_ylim()[1] * 0.01
+    for i, row in enumerate(costs_filtered.itertuples(index=False)):
+        height = row.cost_per_win
+        ax.text(i, height + y_offset,
                f"${height:.4f}",
                ha='center', va='bottom', fontsize=8, fontweight='bold')
 
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     ax.set_axisbelow(True)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
 
     logging.info(f"Cost per win chart saved to {output_path}")
     print(f"✓ Cost per win chart saved to {output_path}")
 
 
 def plot_game_length_distribution(games: List[Dict[str, Any]],
-                                  output_path: str = "output/charts/game_length_distribution.png") -> None:
+                                  output_path: str = "output/charts/game_length_distribution.png",
+                                  game_lengths: Optional[np.ndarray] = None,
+                                  dpi: int = DEFAULT_DPI) -> None:
     """
     Create and save game length distribution histogram.
 
     Args:
         games: List of game result dictionaries
         output_path: Path to save the chart
+        game_lengths: Precomputed lengths from extract_move_features() (computed if None)
+        dpi: Raster resolution (ignored for vector formats like .svg/.pdf)
     """
-    game_lengths = []
-
-    for game in games:
-        moves = game.get("moves", [])
-        if moves:
-            max_turn = max(m.get("turn_number", 0) for m in moves)
-            game_lengths.append(max_turn)
+    if game_lengths is None:
+        game_lengths = _game_lengths(_moves_frame(games))
 
-    if not game_lengths:
+    if game_lengths.size == 0:
         logging.warning("No game length data to plot")
         return
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
 
     # Create histogram
     n, bins, patches = ax.hist(game_lengths, bins=15,
                                edgecolor='black', linewidth=0.5,
-                               color=sns.color_palette("mako")[3])
+                               color=_palette("mako")[3])
 
     # Add mean and median lines
     mean_length = np.mean(game_lengths)
@@ -251,26 +468,27 @@ def plot_game_length_distribution(games: List[Dict[str, Any]],
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     ax.set_axisbelow(True)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
 
     logging.info(f"Game length distribution chart saved to {output_path}")
     print(f"✓ Game length distribution chart saved to {output_path}")
 
 
 def plot_head_to_head(games: List[Dict[str, Any]],
-                     output_path: str = "output/charts/head_to_head.png") -> None:
+                     output_path: str = "output/charts/head_to_head.png",
+                     dpi: int = DEFAULT_DPI) -> None:
     """
     Create and save head-to-head win rate heatmap.
 
     Args:
         games: List of game result dictionaries
         output_path: Path to save the chart
+        dpi: Raster resolution (ignored for vector formats like .svg/.pdf)
     """
     h2h_matrix = head_to_head_matrix(games)
 
@@ -278,7 +496,8 @@ def plot_head_to_head(games: List[Dict[str, Any]],
         logging.warning("No head-to-head data to plot")
         return
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig = Figure(figsize=(10, 8))
+    ax = fig.subplots()
 
     # Create heatmap
     sns.heatmap(h2h_matrix, annot=True, fmt='.2%', cmap='RdYlGn',
@@ -298,57 +517,32 @@ def plot_head_to_head(games: List[Dict[str, Any]],
     plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
     plt.setp(ax.get_yticklabels(), rotation=0)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
 
     logging.info(f"Head-to-head heatmap saved to {output_path}")
     print(f"✓ Head-to-head heatmap saved to {output_path}")
 
 
 def plot_decision_speed(games: List[Dict[str, Any]],
-                       output_path: str = "output/charts/decision_speed.png") -> None:
+                       output_path: str = "output/charts/decision_speed.png",
+                       decision_times: Optional[Dict[str, List[float]]] = None,
+                       dpi: int = DEFAULT_DPI) -> None:
     """
     Create and save decision speed box plot (API response times).
 
     Args:
         games: List of game result dictionaries
         output_path: Path to save the chart
+        decision_times: Precomputed times from extract_move_features() (computed if None)
+        dpi: Raster resolution (ignored for vector formats like .svg/.pdf)
     """
-    from datetime import datetime
-    from collections import defaultdict
-
-    # Collect decision times per model
-    decision_times = defaultdict(list)
-
-    for game in games:
-        moves = game.get("moves", [])
-        final_scores = game.get("final_scores", {})
-
-        for i, move in enumerate(moves):
-            if i == 0:
-                continue  # Skip first move (no previous timestamp)
-
-            try:
-                current_time = datetime.fromisoformat(move['timestamp'])
-                prev_time = datetime.fromisoformat(moves[i-1]['timestamp'])
-                duration = (current_time - prev_time).total_seconds()
-
-                # Only count reasonable durations (< 60 seconds)
-                if 0 < duration < 60:
-                    player = move['player']
-                    # Find model for this player color
-                    for player_str in game.get('players', []):
-                        if player_str.endswith(f':{player}'):
-                            full_model = extract_full_model_name(final_scores, player_str)
-                            decision_times[full_model].append(duration)
-                            break
-            except:
-                continue
+    if decision_times is None:
+        decision_times = _decision_times(_moves_frame(games))
 
     if not decision_times:
         logging.warning("No decision time data to plot")
@@ -358,14 +552,17 @@ def plot_decision_speed(games: List[Dict[str, Any]],
     models = sorted(decision_times.keys())
     data = [decision_times[model] for model in models]
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
 
     # Create box plot
-    bp = ax.boxplot(data, labels=models, patch_artist=True,
+    bp = ax.boxplot(data, patch_artist=True,
                     notch=True, showfliers=False)
+    ax.set_xticks(range(1, len(models) + 1))
+    ax.set_xticklabels(models)
 
     # Color the boxes
-    colors = sns.color_palette("Set2", len(models))
+    colors = _palette("Set2", len(models))
     for patch, color in zip(bp['boxes'], colors):
         patch.set_facecolor(color)
         patch.set_alpha(0.7)
@@ -375,80 +572,57 @@ def plot_decision_speed(games: List[Dict[str, Any]],
     ax.set_ylabel('Decision Time (seconds)', fontweight='bold')
     ax.set_title(f'API Response Time Distribution (N={len(games)} games)',
                  fontweight='bold', pad=20)
-    plt.xticks(rotation=45, ha='right')
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     ax.set_axisbelow(True)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
 
     logging.info(f"Decision speed chart saved to {output_path}")
     print(f"✓ Decision speed chart saved to {output_path}")
 
 
 def plot_token_usage(games: List[Dict[str, Any]],
-                    output_path: str = "output/charts/token_usage.png") -> None:
+                    output_path: str = "output/charts/token_usage.png",
+                    token_means: Optional[pd.DataFrame] = None,
+                    dpi: int = DEFAULT_DPI) -> None:
     """
     Create and save token usage stacked bar chart.
 
     Args:
         games: List of game result dictionaries
         output_path: Path to save the chart
+        token_means: Precomputed usage from extract_move_features() (computed if None)
+        dpi: Raster resolution (ignored for vector formats like .svg/.pdf)
     """
-    from collections import defaultdict
-
-    # Collect token usage per model
-    token_stats = defaultdict(lambda: {"input": [], "output": []})
-
-    for game in games:
-        moves = game.get("moves", [])
-        final_scores = game.get("final_scores", {})
+    if token_means is None:
+        token_means = _token_usage(_moves_frame(games))
 
-        for move in moves:
-            player = move['player']
-            move_data = move.get('move_data', {})
-
-            # Find model for this player
-            for player_str in game.get('players', []):
-                if player_str.endswith(f':{player}'):
-                    full_model = extract_full_model_name(final_scores, player_str)
-
-                    # Estimate input/output tokens (rough approximation)
-                    total_tokens = move_data.get('tokens', 0)
-                    prompt_length = move_data.get('prompt_length', 0)
-
-                    # Rough estimate: input ~= prompt_length/4, output = rest
-                    input_tokens = prompt_length // 4
-                    output_tokens = max(0, total_tokens - input_tokens)
-
-                    token_stats[full_model]["input"].append(input_tokens)
-                    token_stats[full_model]["output"].append(output_tokens)
-                    break
-
-    if not token_stats:
+    if token_means.empty:
         logging.warning("No token usage data to plot")
         return
 
     # Calculate averages
-    models = sorted(token_stats.keys())
-    avg_input = [np.mean(token_stats[m]["input"]) for m in models]
-    avg_output = [np.mean(token_stats[m]["output"]) for m in models]
+    models = list(token_means.index)
+    avg_input = token_means["input"].to_numpy()
+    avg_output = token_means["output"].to_numpy()
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
 
     # Create stacked bar chart
     x = np.arange(len(models))
     width = 0.6
 
     p1 = ax.bar(x, avg_input, width, label='Input Tokens',
-               color=sns.color_palette("muted")[0], edgecolor='black', linewidth=0.5)
+               color=_palette("muted")[0], edgecolor='black', linewidth=0.5)
     p2 = ax.bar(x, avg_output, width, bottom=avg_input, label='Output Tokens',
-               color=sns.color_palette("muted")[1], edgecolor='black', linewidth=0.5)
+               color=_palette("muted")[1], edgecolor='black', linewidth=0.5)
 
     # Customize
     ax.set_xlabel('Model', fontweight='bold')
@@ -461,20 +635,20 @@ def plot_token_usage(games: List[Dict[str, Any]],
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     ax.set_axisbelow(True)
 
-    # Add total labels
+    # Add total labels (the y-limit is fixed by now, so read it once)
+    y_offset = ax.get_ylim()[1] * 0.02
     for i, model in enumerate(models):
         total = avg_input[i] + avg_output[i]
-        ax.text(i, total + (ax.get_ylim()[1] * 0.02),
+        ax.text(i, total + y_offset,
                f'{int(total)}',
                ha='center', va='bottom', fontsize=8, fontweight='bold')
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
 
     logging.info(f"Token usage chart saved to {output_path}")
     print(f"✓ Token usage chart saved to {output_path}")
@@ -482,7 +656,8 @@ def plot_token_usage(games: List[Dict[str, Any]],
 
 def plot_example_game_timeline(games: List[Dict[str, Any]],
                                game_index: int = 0,
-                               output_path: str = "output/charts/example_game_timeline.png") -> None:
+                               output_path: str = "output/charts/example_game_timeline.png",
+                               dpi: int = DEFAULT_DPI) -> None:
     """
     Create and save victory point timeline for an example game.
 
@@ -490,6 +665,7 @@ def plot_example_game_timeline(games: List[Dict[str, Any]],
         games: List of game result dictionaries
         game_index: Index of game to visualize
         output_path: Path to save the chart
+        dpi: Raster resolution (ignored for vector formats like .svg/.pdf)
     """
     if game_index >= len(games):
         logging.warning(f"Game index {game_index} out of range")
@@ -505,7 +681,8 @@ def plot_example_game_timeline(games: List[Dict[str, Any]],
         logging.warning("No final scores available for timeline")
         return
 
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
 
     # For now, just show final scores as a bar chart
     # (Full timeline would require state reconstruction)
@@ -513,16 +690,18 @@ def plot_example_game_timeline(games: List[Dict[str, Any]],
     scores = list(final_scores.values())
 
     bars = ax.barh(players, scores,
-                   color=sns.color_palette("viridis", len(players)),
+                   color=_palette("viridis", len(players)),
                    edgecolor='black', linewidth=0.5)
 
     # Highlight winner
-    winner = game.get("winner", "")
-    for i, player in enumerate(players):
-        if player.endswith(winner.split(':')[-1]):
-            bars[i].set_color('gold')
-            bars[i].set_edgecolor('darkgoldenrod')
-            bars[i].set_linewidth(2)
+    winner_color = game.get("winner", "").rsplit(':', 1)[-1]
+    winner_idx = None
+    if winner_color:
+        winner_idx = next((i for i, player in enumerate(players) if player.endswith(winner_color)), None)
+    if winner_idx is not None:
+        bars[winner_idx].set_color('gold')
+        bars[winner_idx].set_edgecolor('darkgoldenrod')
+        bars[winner_idx].set_linewidth(2)
 
     # Add value labels
     for i, score in enumerate(scores):
@@ -539,26 +718,36 @@ def plot_example_game_timeline(games: List[Dict[str, Any]],
     ax.grid(axis='x', alpha=0.3, linestyle='--')
     ax.set_axisbelow(True)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
 
     logging.info(f"Example game timeline saved to {output_path}")
     print(f"✓ Example game timeline saved to {output_path}")
 
 
 def generate_all_visualizations(games: List[Dict[str, Any]],
-                               output_dir: str = "output/charts") -> None:
+                               output_dir: str = "output/charts",
+                               max_workers: Optional[int] = None,
+                               dpi: int = DEFAULT_DPI,
+                               output_format: str = "png") -> None:
     """
     Generate all visualization charts at once.
 
+    Charts are independent and CPU-bound (rasterization), so they are
+    rendered in a process pool. Each chart draws on its own pyplot-free
+    Figure, so no GUI backend or global figure registry is involved.
+
     Args:
         games: List of game result dictionaries
         output_dir: Directory to save all charts
+        max_workers: Worker processes (default: one per chart, up to CPU count;
+                     1 renders sequentially in this process)
+        dpi: Raster resolution for every chart
+        output_format: File format/extension, e.g. "png", or "svg"/"pdf" for vector output
     """
     print(f"\nGenerating all visualizations...")
     print(f"Output directory: {output_dir}\n")
@@ -566,15 +755,47 @@ def generate_all_visualizations(games: List[Dict[str, Any]],
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # Aggregations shared by several charts are computed once
+    win_rates = calculate_win_rates(games)
+    costs = calculate_costs(games)
+    games_df, moves = games_to_frames(games)
+    game_lengths, decision_times, token_means = (
+        _game_lengths(moves), _decision_times(moves), _token_usage(moves)
+    )
+    del moves
+
+    # With move-level data aggregated, charts only need per-game summaries;
+    # workers get those instead of every game's full move log
+    games = games_df.to_dict("records")
+
+    def chart_path(name: str) -> str:
+        return str(output_dir / f"{name}.{output_format}")
+
+    charts = [
+        (plot_win_rates, (games, chart_path("win_rates")), {"win_rates": win_rates}),
+        (plot_cost_efficiency, (games, chart_path("cost_efficiency")), {"costs": costs}),
+        (plot_cost_per_win, (games, chart_path("cost_per_win")), {"costs": costs}),
+        (plot_game_length_distribution, (games, chart_path("game_length_distribution")),
+         {"game_lengths": game_lengths}),
+        (plot_head_to_head, (games, chart_path("head_to_head")), {}),
+        (plot_decision_speed, (games, chart_path("decision_speed")),
+         {"decision_times": decision_times}),
+        (plot_token_usage, (games, chart_path("token_usage")), {"token_means": token_means}),
+        (plot_example_game_timeline, (games, 0, chart_path("example_game_timeline")), {}),
+    ]
+
+    if max_workers is None:
+        max_workers = min(len(charts), os.cpu_count() or 1)
+
     # Generate all charts
-    plot_win_rates(games, str(output_dir / "win_rates.png"))
-    plot_cost_efficiency(games, str(output_dir / "cost_efficiency.png"))
-    plot_cost_per_win(games, str(output_dir / "cost_per_win.png"))
-    plot_game_length_distribution(games, str(output_dir / "game_length_distribution.png"))
-    plot_head_to_head(games, str(output_dir / "head_to_head.png"))
-    plot_decision_speed(games, str(output_dir / "decision_speed.png"))
-    plot_token_usage(games, str(output_dir / "token_usage.png"))
-    plot_example_game_timeline(games, 0, str(output_dir / "example_game_timeline.png"))
+    if max_workers <= 1:
+        for plot, args, kwargs in charts:
+            plot(*args, dpi=dpi, **kwargs)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(plot, *args, dpi=dpi, **kwargs) for plot, args, kwargs in charts]
+            for future in futures:
+                future.result()
 
     print(f"\n✅ All visualizations generated successfully!")
     print(f"   Saved to: {output_dir}")
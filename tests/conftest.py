@@ -0,0 +1,91 @@
+"""
+Shared pytest configuration.
+
+Tests are safe to run in parallel with pytest-xdist (`pytest tests/ -n auto`):
+fixtures write only under pytest's per-worker tmp paths, open no ports, and
+shared (session/class-scoped) fixtures are either read-only or reset around
+every test.
+
+Tests marked @pytest.mark.perf are pytest-benchmark micro-benchmarks
+guarding the MCP server's hot paths; they are skipped unless pytest is run
+with --perf.
+
+FakeAction and the minimal mock_game/mock_actions fixtures are shared by
+the MCP and player tests; modules with richer games override the fixtures.
+"""
+
+import pytest
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+try:
+    import pytest_benchmark  # noqa: F401
+    BENCHMARK_AVAILABLE = True
+except ImportError:
+    BENCHMARK_AVAILABLE = False
+
+
+@dataclass(frozen=True)
+class FakeAction:
+    """Stand-in for a Catanatron Action (hashable, like the real namedtuple)."""
+    action_type: str
+    color: str
+    value: Any
+
+    def __str__(self):
+        return f"{self.action_type.split('.')[-1]} action"
+
+
+# Player state of the minimal mock_game: RED is P0, BLUE is P1
+_MINIMAL_PLAYER_STATE = {"P0_WOOD_IN_HAND": 2, "P0_ACTUAL_VICTORY_POINTS": 4, "P1_VICTORY_POINTS": 5}
+
+
+@pytest.fixture
+def mock_game():
+    """Minimal two-player game the MCP game wrapper can read."""
+    state = SimpleNamespace(
+        color_to_index={"RED": 0, "BLUE": 1},
+        player_state=dict(_MINIMAL_PLAYER_STATE),
+        actions=[],
+        development_deck=[],
+        board=SimpleNamespace(settlements={}, cities={}, roads={})
+    )
+    return SimpleNamespace(id="test_game", state=state)
+
+
+@pytest.fixture
+def mock_actions():
+    """Two playable actions (a single one would skip the LLM)."""
+    return [
+        FakeAction("ActionType.BUILD_ROAD", "RED", 10),
+        FakeAction("ActionType.END_TURN", "RED", None),
+    ]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--perf", action="store_true", default=False,
+        help="run @pytest.mark.perf micro-benchmarks (needs pytest-benchmark)"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "perf: micro-benchmark, skipped unless pytest is run with --perf"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip perf benchmarks unless --perf is given and pytest-benchmark is installed."""
+    if not config.getoption("--perf"):
+        reason = "perf benchmark: run with --perf"
+    elif not BENCHMARK_AVAILABLE:
+        reason = "perf benchmark: pytest-benchmark not installed"
+    else:
+        return
+
+    skip_perf = pytest.mark.skip(reason=reason)
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
@@ -5,13 +5,25 @@ Tests action ID generation and bidirectional mapping.
 """
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import sys
 from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from mcp.action_mapper import ActionMapper
+from tests.conftest import FakeAction
+
+
+_MOCK_ACTIONS = [
+    FakeAction("ActionType.BUILD_SETTLEMENT", "RED", 42),
+    FakeAction("ActionType.BUILD_ROAD", "RED", 15),
+    FakeAction("ActionType.PLAY_KNIGHT_CARD", "RED", None),
+    FakeAction("ActionType.END_TURN", "RED", None),
+    FakeAction("ActionType.BUY_DEVELOPMENT_CARD", "RED", None),
+]
 
 
 class TestActionMapper:
@@ -19,50 +31,15 @@ class TestActionMapper:
 
     @pytest.fixture
     def mock_actions(self):
-        """Create mock Catanatron actions."""
-        actions = []
-
-        # BUILD_SETTLEMENT action
-        action1 = Mock()
-        action1.action_type = Mock()
-        action1.action_type.__str__ = lambda self: "ActionType.BUILD_SETTLEMENT"
-        action1.color = "RED"
-        action1.value = 42
-        actions.append(action1)
-
-        # BUILD_ROAD action
-        action2 = Mock()
-        action2.action_type = Mock()
-        action2.action_type.__str__ = lambda self: "ActionType.BUILD_ROAD"
-        action2.color = "RED"
-        action2.value = 15
-        actions.append(action2)
-
-        # PLAY_KNIGHT_CARD action
-        action3 = Mock()
-        action3.action_type = Mock()
-        action3.action_type.__str__ = lambda self: "ActionType.PLAY_KNIGHT_CARD"
-        action3.color = "RED"
-        action3.value = None
-        actions.append(action3)
-
-        # END_TURN action
-        action4 = Mock()
-        action4.action_type = Mock()
-        action4.action_type.__str__ = lambda self: "ActionType.END_TURN"
-        action4.color = "RED"
-        action4.value = None
-        actions.append(action4)
-
-        # BUY_DEVELOPMENT_CARD action
-        action5 = Mock()
-        action5.action_type = Mock()
-        action5.action_type.__str__ = lambda self: "ActionType.BUY_DEVELOPMENT_CARD"
-        action5.color = "RED"
-        action5.value = None
-        actions.append(action5)
-
-        return actions
+        """Shared fake Catanatron actions (read-only, built once per module)."""
+        return _MOCK_ACTIONS
+
+    @pytest.fixture(scope="module")
+    def populated_mapper(self):
+        """Descriptive-ID mapper over the shared actions, for read-only tests."""
+        mapper = ActionMapper(use_descriptive_ids=True)
+        mapper.set_actions(_MOCK_ACTIONS)
+        return mapper
 
     def test_initialization_descriptive(self):
         """Test mapper initialization with descriptive IDs."""
@@ -84,10 +61,9 @@ class TestActionMapper:
         assert len(mapper.id_to_action) == 5
         assert len(mapper.action_to_id) == 5
 
-    def test_descriptive_action_ids(self, mock_actions):
+    def test_descriptive_action_ids(self, populated_mapper):
         """Test descriptive action ID generation."""
-        mapper = ActionMapper(use_descriptive_ids=True)
-        mapper.set_actions(mock_actions)
+        mapper = populated_mapper
 
         action_ids = mapper.get_all_action_ids()
 
@@ -112,37 +88,33 @@ class TestActionMapper:
         assert "action_3" in action_ids
         assert "action_4" in action_ids
 
-    def test_get_action_by_id(self, mock_actions):
+    def test_get_action_by_id(self, populated_mapper, mock_actions):
         """Test retrieving action by ID."""
-        mapper = ActionMapper(use_descriptive_ids=True)
-        mapper.set_actions(mock_actions)
+        mapper = populated_mapper
 
         action = mapper.get_action("build_settlement_42")
         assert action is not None
         assert action == mock_actions[0]
 
-    def test_get_action_id_by_object(self, mock_actions):
+    def test_get_action_id_by_object(self, populated_mapper, mock_actions):
         """Test retrieving ID by action object."""
-        mapper = ActionMapper(use_descriptive_ids=True)
-        mapper.set_actions(mock_actions)
+        mapper = populated_mapper
 
         action_id = mapper.get_action_id(mock_actions[0])
         assert action_id == "build_settlement_42"
 
-    def test_is_valid_action_id(self, mock_actions):
+    def test_is_valid_action_id(self, populated_mapper):
         """Test action ID validation."""
-        mapper = ActionMapper(use_descriptive_ids=True)
-        mapper.set_actions(mock_actions)
+        mapper = populated_mapper
 
         assert mapper.is_valid_action_id("build_settlement_42") is True
         assert mapper.is_valid_action_id("build_road_15") is True
         assert mapper.is_valid_action_id("invalid_action") is False
         assert mapper.is_valid_action_id("") is False
 
-    def test_get_all_actions_with_ids(self, mock_actions):
+    def test_get_all_actions_with_ids(self, populated_mapper):
         """Test getting all actions with metadata."""
-        mapper = ActionMapper(use_descriptive_ids=True)
-        mapper.set_actions(mock_actions)
+        mapper = populated_mapper
 
         actions_with_ids = mapper.get_all_actions_with_ids()
 
@@ -168,16 +140,11 @@ class TestActionMapper:
 
     def test_duplicate_action_ids(self):
         """Test handling of duplicate action IDs."""
-        actions = []
-
-        # Create two identical actions (same type and value)
-        for i in range(2):
-            action = Mock()
-            action.action_type = Mock()
-            action.action_type.__str__ = lambda self: "ActionType.BUILD_SETTLEMENT"
-            action.color = "RED"
-            action.value = 42
-            actions.append(action)
+        # Two identical actions (same type and value)
+        actions = [
+            FakeAction("ActionType.BUILD_SETTLEMENT", "RED", 42),
+            FakeAction("ActionType.BUILD_SETTLEMENT", "RED", 42),
+        ]
 
         mapper = ActionMapper(use_descriptive_ids=True)
         mapper.set_actions(actions)
@@ -189,6 +156,19 @@ class TestActionMapper:
         assert "build_settlement_42" in action_ids
         assert "build_settlement_42_1" in action_ids
 
+    def test_action_id_lookup_by_identity(self):
+        """Test reverse lookup uses object identity, not action equality."""
+        first = FakeAction("ActionType.BUILD_SETTLEMENT", "RED", 42)
+        second = FakeAction("ActionType.BUILD_SETTLEMENT", "RED", 42)
+        assert first == second and hash(first) == hash(second)
+
+        mapper = ActionMapper(use_descriptive_ids=True)
+        mapper.set_actions([first, second])
+
+        assert mapper.get_action_id(first) == "build_settlement_42"
+        assert mapper.get_action_id(second) == "build_settlement_42_1"
+        assert mapper.get_action_id(FakeAction("ActionType.BUILD_SETTLEMENT", "RED", 42)) is None
+
     def test_empty_actions_list(self):
         """Test with empty actions list."""
         mapper = ActionMapper(use_descriptive_ids=True)
@@ -198,10 +178,9 @@ class TestActionMapper:
         assert mapper.get_action("any_id") is None
         assert mapper.is_valid_action_id("any_id") is False
 
-    def test_bidirectional_mapping(self, mock_actions):
+    def test_bidirectional_mapping(self, populated_mapper, mock_actions):
         """Test that mapping works in both directions."""
-        mapper = ActionMapper(use_descriptive_ids=True)
-        mapper.set_actions(mock_actions)
+        mapper = populated_mapper
 
         for action in mock_actions:
             # Get ID from action
@@ -221,13 +200,7 @@ class TestActionMapper:
         first_ids = set(mapper.get_all_action_ids())
 
         # Create new actions
-        new_actions = []
-        action = Mock()
-        action.action_type = Mock()
-        action.action_type.__str__ = lambda self: "ActionType.ROLL"
-        action.color = "BLUE"
-        action.value = None
-        new_actions.append(action)
+        new_actions = [FakeAction("ActionType.ROLL", "BLUE", None)]
 
         # Set new actions
         mapper.set_actions(new_actions)
@@ -245,23 +218,22 @@ class TestActionMapper:
         """Test safe string conversion of actions."""
         mapper = ActionMapper(use_descriptive_ids=True)
 
-        # Normal case - Mock's default str() just returns its class name
+        # Normal case - FakeAction's __str__ names the action type
         result = mapper._safe_action_str(mock_actions[0])
-        assert "Mock" in result or "action" in result.lower()
+        assert "action" in result.lower()
 
         # Test with object that has proper string representation
-        class FakeAction:
+        class DescribedAction:
             def __str__(self):
                 return "BUILD_SETTLEMENT at node 42"
 
-        fake_action = FakeAction()
-        result = mapper._safe_action_str(fake_action)
+        described_action = DescribedAction()
+        result = mapper._safe_action_str(described_action)
         assert result == "BUILD_SETTLEMENT at node 42"
 
-    def test_action_type_extraction(self, mock_actions):
+    def test_action_type_extraction(self, populated_mapper, mock_actions):
         """Test action type extraction."""
-        mapper = ActionMapper(use_descriptive_ids=True)
-        mapper.set_actions(mock_actions)
+        mapper = populated_mapper
 
         # Check that action types are properly extracted
         action_type = mapper._get_action_type(mock_actions[0])
@@ -270,11 +242,23 @@ class TestActionMapper:
         action_type = mapper._get_action_type(mock_actions[3])
         assert action_type == "END_TURN"
 
+    def test_action_type_memoized_per_action_list(self):
+        """Test action types are converted once per action until new actions are set."""
+        action_type = Mock()
+        action_type.__str__ = Mock(return_value="ActionType.ROLL")
+        action = SimpleNamespace(action_type=action_type, color="RED", value=None)
+
+        mapper = ActionMapper(use_descriptive_ids=True)
+        mapper.set_actions([action])
+        mapper.get_all_actions_with_ids()
+        assert action_type.__str__.call_count == 1
+
+        mapper.set_actions([action])
+        assert action_type.__str__.call_count == 2
+
     def test_action_without_action_type_attribute(self):
         """Test handling actions without action_type attribute."""
-        action = Mock(spec=[])  # No attributes
-        action.color = "RED"
-        action.value = 10
+        action = SimpleNamespace(color="RED", value=10)  # No action_type
 
         mapper = ActionMapper(use_descriptive_ids=True)
         mapper.set_actions([action])
@@ -282,8 +266,8 @@ class TestActionMapper:
         # Should fall back to class name
         action_ids = mapper.get_all_action_ids()
         assert len(action_ids) == 1
-        # ID should contain "mock" (from Mock class name)
-        assert "mock" in action_ids[0].lower() or "action_0" in action_ids[0]
+        # ID should start with the class name
+        assert action_ids[0] == "simplenamespace_10"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,146 @@
+"""
+Unit tests for AnthropicBatchDispatcher.
+
+Uses an in-memory fake of client.messages.batches (no network).
+"""
+
+import pytest
+import threading
+from types import SimpleNamespace
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.players.batch_dispatcher import AnthropicBatchDispatcher
+
+
+class FakeBatches:
+    """
+    Fake messages.batches API.
+
+    Each request's outcome comes from its prompt: "errored" and "expired"
+    fail with that result type, "missing" gets no result entry, anything else
+    succeeds with a message echoing the prompt. Results are returned in
+    reverse order so routing must go by custom_id.
+    """
+
+    def __init__(self, polls_until_ended=2, fail_create=False):
+        self.polls_until_ended = polls_until_ended
+        self.fail_create = fail_create
+        self.created = []
+        self._lock = threading.Lock()
+        self._polls = {}
+
+    def create(self, requests):
+        if self.fail_create:
+            raise ConnectionError("batch API down")
+        with self._lock:
+            batch_id = f"batch_{len(self.created)}"
+            self.created.append(requests)
+            self._polls[batch_id] = 0
+        return SimpleNamespace(id=batch_id, processing_status="in_progress")
+
+    def retrieve(self, batch_id):
+        with self._lock:
+            self._polls[batch_id] += 1
+            ended = self._polls[batch_id] >= self.polls_until_ended
+        return SimpleNamespace(id=batch_id, processing_status="ended" if ended else "in_progress")
+
+    def results(self, batch_id):
+        requests = self.created[int(batch_id.split("_")[1])]
+        entries = []
+        for request in requests:
+            prompt = request["params"]["messages"][0]["content"]
+            if prompt == "missing":
+                continue
+            if prompt in ("errored", "expired"):
+                result = SimpleNamespace(type=prompt)
+            else:
+                result = SimpleNamespace(type="succeeded", message=f"reply to {prompt}")
+            entries.append(SimpleNamespace(custom_id=request["custom_id"], result=result))
+        return reversed(entries)
+
+
+def _params(prompt):
+    """messages.create() parameters for a one-message prompt."""
+    return {"model": "claude-test", "max_tokens": 16, "messages": [{"role": "user", "content": prompt}]}
+
+
+class TestAnthropicBatchDispatcher:
+    """Test suite for batching, polling and result routing."""
+
+    @pytest.fixture
+    def batches(self):
+        """Fake batches API that ends each batch after two polls."""
+        return FakeBatches()
+
+    @pytest.fixture
+    def dispatcher(self, batches):
+        """Dispatcher with short waits over the fake client."""
+        client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+        dispatcher = AnthropicBatchDispatcher(
+            client, max_batch_size=4, max_wait=0.05, poll_interval=0.01
+        )
+        yield dispatcher
+        dispatcher.close()
+
+    def test_concurrent_submits_routed_by_custom_id(self, dispatcher, batches):
+        """Test requests from many threads are batched and each gets its own reply."""
+        replies = {}
+
+        def decide(i):
+            replies[i] = dispatcher.submit(_params(f"move {i}")).result(timeout=5)
+
+        threads = [threading.Thread(target=decide, args=(i,)) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert replies == {i: f"reply to move {i}" for i in range(10)}
+        assert all(len(requests) <= 4 for requests in batches.created)
+        custom_ids = [request["custom_id"] for requests in batches.created for request in requests]
+        assert len(custom_ids) == len(set(custom_ids)) == 10
+
+    @pytest.mark.parametrize("prompt,message", [
+        ("errored", "Batch request errored"),
+        ("expired", "Batch request expired"),
+        ("missing", "No batch result"),
+    ])
+    def test_failed_entries_raise(self, dispatcher, prompt, message):
+        """Test errored, expired and missing entries surface as exceptions."""
+        ok = dispatcher.submit(_params("fine"))
+        failed = dispatcher.submit(_params(prompt))
+
+        assert ok.result(timeout=5) == "reply to fine"
+        with pytest.raises(RuntimeError, match=message):
+            failed.result(timeout=5)
+
+    def test_create_failure_fails_whole_batch(self):
+        """Test a failed batch submission is raised from every request's Future."""
+        client = SimpleNamespace(messages=SimpleNamespace(batches=FakeBatches(fail_create=True)))
+        dispatcher = AnthropicBatchDispatcher(client, max_batch_size=2, max_wait=5.0)
+
+        futures = [dispatcher.submit(_params(f"move {i}")) for i in range(2)]
+
+        for future in futures:
+            with pytest.raises(ConnectionError):
+                future.result(timeout=5)
+        dispatcher.close()
+
+    def test_close_flushes_pending(self, batches):
+        """Test close() sends waiting requests and rejects new ones."""
+        client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+        dispatcher = AnthropicBatchDispatcher(client, max_wait=60.0, poll_interval=0.01)
+
+        future = dispatcher.submit(_params("last move"))
+        dispatcher.close()
+
+        assert future.result(timeout=5) == "reply to last move"
+        with pytest.raises(RuntimeError, match="closed"):
+            dispatcher.submit(_params("too late"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,9 +1,10 @@
 """
 Tests for Elo rating system.
+
+PYTEST_DONT_REWRITE: plain asserts, this module skips pytest's rewrite pass.
 """
 
 import pytest
-import tempfile
 import json
 from pathlib import Path
 
@@ -13,54 +14,55 @@ from src.elo import EloRating, DEFAULT_ELO, DEFAULT_K_FACTOR
 class TestEloRating:
     """Test cases for EloRating class."""
 
-    @pytest.fixture
-    def temp_ratings_file(self):
-        """Create a temporary ratings file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            yield f.name
-        # Cleanup handled by test
+    @pytest.fixture(scope="session")
+    def temp_ratings_file(self, tmp_path_factory):
+        """Path of a ratings file shared by all tests (reset before each)."""
+        return str(tmp_path_factory.mktemp("elo") / "ratings.json")
+
+    @pytest.fixture(autouse=True)
+    def _reset_ratings_file(self, temp_ratings_file):
+        """Remove ratings left by the previous test so each starts fresh."""
+        Path(temp_ratings_file).unlink(missing_ok=True)
 
     @pytest.fixture
     def elo(self, temp_ratings_file):
         """Create an EloRating instance with temporary file."""
         return EloRating(ratings_file=temp_ratings_file)
 
-    def test_initialization(self, elo):
+    @pytest.fixture(scope="session")
+    def ro_elo(self, tmp_path_factory):
+        """Shared EloRating for tests that never update ratings."""
+        return EloRating(ratings_file=str(tmp_path_factory.mktemp("ro_elo") / "ratings.json"))
+
+    def test_initialization(self, ro_elo):
         """Test that EloRating initializes correctly."""
-        assert elo.k_factor == DEFAULT_K_FACTOR
-        assert elo.default_elo == DEFAULT_ELO
-        assert len(elo.ratings) == 0
-        assert len(elo.history) == 0
+        assert ro_elo.k_factor == DEFAULT_K_FACTOR
+        assert ro_elo.default_elo == DEFAULT_ELO
+        assert len(ro_elo.ratings) == 0
+        assert len(ro_elo.history) == 0
 
-    def test_default_rating(self, elo):
+    def test_default_rating(self, ro_elo):
         """Test that new players get default rating."""
-        assert elo.get_rating("new_player") == DEFAULT_ELO
-
-    def test_expected_score_equal_ratings(self, elo):
-        """Test expected score when ratings are equal."""
-        expected = elo._expected_score(1500, 1500)
-        assert expected == pytest.approx(0.5, abs=0.001)
-
-    def test_expected_score_higher_rating(self, elo):
-        """Test expected score when player has higher rating."""
-        expected = elo._expected_score(1700, 1500)
-        # Higher rated player should expect > 0.5
-        assert expected > 0.5
-        assert expected < 1.0
-
-    def test_expected_score_lower_rating(self, elo):
-        """Test expected score when player has lower rating."""
-        expected = elo._expected_score(1300, 1500)
-        # Lower rated player should expect < 0.5
-        assert expected < 0.5
-        assert expected > 0.0
-
-    def test_actual_score_placements(self, elo):
+        assert ro_elo.get_rating("new_player") == DEFAULT_ELO
+
+    @pytest.mark.parametrize("rating,opponent_avg,low,high", [
+        (1500, 1500, 0.499, 0.501),  # Equal ratings expect 0.5
+        (1700, 1500, 0.5, 1.0),      # Higher rated player expects > 0.5
+        (1300, 1500, 0.0, 0.5),      # Lower rated player expects < 0.5
+    ])
+    def test_expected_score(self, ro_elo, rating, opponent_avg, low, high):
+        """Test expected score against the opponent average."""
+        assert low < ro_elo._expected_score(rating, opponent_avg) < high
+
+    @pytest.mark.parametrize("placement,expected", [
+        (1, 1.0),
+        (2, 0.667),
+        (3, 0.333),
+        (4, 0.0),
+    ])
+    def test_actual_score_placements(self, ro_elo, placement, expected):
         """Test actual score calculation for different placements."""
-        assert elo._actual_score(1, 4) == pytest.approx(1.0)
-        assert elo._actual_score(2, 4) == pytest.approx(0.667, abs=0.01)
-        assert elo._actual_score(3, 4) == pytest.approx(0.333, abs=0.01)
-        assert elo._actual_score(4, 4) == pytest.approx(0.0)
+        assert ro_elo._actual_score(placement, 4) == pytest.approx(expected, abs=0.01)
 
     def test_update_ratings_basic(self, elo):
         """Test basic rating update for a 4-player game."""
@@ -186,14 +188,18 @@ class TestEloRating:
         assert "player_a" in formatted
         assert "player_b" in formatted
 
-    def test_rating_convergence(self, elo):
+    def test_rating_convergence(self, elo, monkeypatch):
         """Test that ratings converge over many games."""
+        # Persistence has its own test; skip 20 file rewrites here
+        monkeypatch.setattr(elo, "_save_ratings", lambda: None)
+
         # Simulate p1 winning 80% of games against p2
-        for i in range(20):
-            if i % 5 == 0:
-                elo.update_ratings({"scores": {"p1": 5, "p2": 10}})  # p2 wins 20%
-            else:
-                elo.update_ratings({"scores": {"p1": 10, "p2": 5}})  # p1 wins 80%
+        p1_wins = {"scores": {"p1": 10, "p2": 5}}
+        p2_wins = {"scores": {"p1": 5, "p2": 10}}
+        results = [p2_wins if i % 5 == 0 else p1_wins for i in range(20)]
+
+        for game_result in results:
+            elo.update_ratings(game_result)
 
         # p1 should have significantly higher rating
         assert elo.get_rating("p1") > elo.get_rating("p2")
@@ -2,17 +2,156 @@
 Unit tests for CatanatronGameWrapper.
 
 Tests game state serialization and JSON compatibility.
+
+PYTEST_DONT_REWRITE: plain asserts, this module skips pytest's rewrite pass.
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock
 import json
+from types import MappingProxyType, SimpleNamespace
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from catanatron import Color
 from mcp.game_wrapper import CatanatronGameWrapper
+from mcp.server import _dumps_result
+
+
+# Built once at import: the wrapper only reads the game, so every test can
+# share the same plain objects instead of rebuilding a Mock tree per test
+_PLAYER_STATE = MappingProxyType({
+    # RED player (index 0)
+    "P0_WOOD_IN_HAND": 2,
+    "P0_BRICK_IN_HAND": 1,
+    "P0_SHEEP_IN_HAND": 3,
+    "P0_WHEAT_IN_HAND": 1,
+    "P0_ORE_IN_HAND": 0,
+    "P0_ACTUAL_VICTORY_POINTS": 4,
+    "P0_VICTORY_POINTS": 3,
+    "P0_SETTLEMENTS_AVAILABLE": 2,  # Built 3
+    "P0_CITIES_AVAILABLE": 3,  # Built 1
+    "P0_ROADS_AVAILABLE": 10,  # Built 5
+    "P0_KNIGHT_IN_HAND": 1,
+    "P0_YEAR_OF_PLENTY_IN_HAND": 0,
+    "P0_MONOPOLY_IN_HAND": 0,
+    "P0_ROAD_BUILDING_IN_HAND": 0,
+    "P0_VICTORY_POINT_IN_HAND": 1,
+    "P0_HAS_ROAD": False,
+    "P0_HAS_ARMY": False,
+    "P0_PLAYED_KNIGHT": 2,
+    "P0_LONGEST_ROAD_LENGTH": 4,
+
+    # BLUE player (index 1)
+    "P1_WOOD_IN_HAND": 1,
+    "P1_BRICK_IN_HAND": 2,
+    "P1_SHEEP_IN_HAND": 0,
+    "P1_WHEAT_IN_HAND": 1,
+    "P1_ORE_IN_HAND": 1,
+    "P1_ACTUAL_VICTORY_POINTS": 5,
+    "P1_VICTORY_POINTS": 5,
+    "P1_SETTLEMENTS_AVAILABLE": 3,
+    "P1_CITIES_AVAILABLE": 4,
+    "P1_ROADS_AVAILABLE": 12,
+    "P1_KNIGHT_IN_HAND": 0,
+    "P1_YEAR_OF_PLENTY_IN_HAND": 1,
+    "P1_MONOPOLY_IN_HAND": 0,
+    "P1_ROAD_BUILDING_IN_HAND": 0,
+    "P1_VICTORY_POINT_IN_HAND": 0,
+    "P1_HAS_ROAD": True,
+    "P1_HAS_ARMY": False,
+    "P1_PLAYED_KNIGHT": 0,
+
+    # WHITE player (index 2)
+    "P2_WOOD_IN_HAND": 0,
+    "P2_BRICK_IN_HAND": 0,
+    "P2_SHEEP_IN_HAND": 2,
+    "P2_WHEAT_IN_HAND": 3,
+    "P2_ORE_IN_HAND": 2,
+    "P2_ACTUAL_VICTORY_POINTS": 3,
+    "P2_VICTORY_POINTS": 2,
+    "P2_SETTLEMENTS_AVAILABLE": 3,
+    "P2_CITIES_AVAILABLE": 4,
+    "P2_ROADS_AVAILABLE": 13,
+    "P2_HAS_ROAD": False,
+    "P2_HAS_ARMY": False,
+    "P2_PLAYED_KNIGHT": 1,
+
+    # ORANGE player (index 3)
+    "P3_WOOD_IN_HAND": 3,
+    "P3_BRICK_IN_HAND": 3,
+    "P3_SHEEP_IN_HAND": 1,
+    "P3_WHEAT_IN_HAND": 0,
+    "P3_ORE_IN_HAND": 0,
+    "P3_ACTUAL_VICTORY_POINTS": 2,
+    "P3_VICTORY_POINTS": 2,
+    "P3_SETTLEMENTS_AVAILABLE": 3,
+    "P3_CITIES_AVAILABLE": 4,
+    "P3_ROADS_AVAILABLE": 11,
+    "P3_HAS_ROAD": False,
+    "P3_HAS_ARMY": False,
+    "P3_PLAYED_KNIGHT": 0,
+})
+
+_GAME = SimpleNamespace(
+    id="test_game_123",
+    state=SimpleNamespace(
+        color_to_index={
+            "RED": 0,
+            "BLUE": 1,
+            "WHITE": 2,
+            "ORANGE": 3
+        },
+        player_state=_PLAYER_STATE,
+        # The wrapper only takes len() of the deck and str() of recent
+        # actions, so plain placeholders are enough (no Mocks needed)
+        actions=[object()] * 15,
+        development_deck=[None] * 20
+    )
+)
+
+# RED's "your_state" as derived from _PLAYER_STATE
+EXPECTED_RED_STATE = {
+    "resources": {"wood": 2, "brick": 1, "sheep": 3, "wheat": 1, "ore": 0},
+    "total_resources": 7,
+    "victory_points": 4,
+    "public_victory_points": 3,
+    "buildings": {
+        "settlements_built": 3,
+        "cities_built": 1,
+        "roads_built": 5,
+        "settlements_available": 2,
+        "cities_available": 3,
+        "roads_available": 10
+    },
+    "development_cards": {
+        "knight": 1,
+        "year_of_plenty": 0,
+        "monopoly": 0,
+        "road_building": 0,
+        "victory_point": 1,
+        "total": 2
+    },
+    "has_longest_road": False,
+    "has_largest_army": False,
+    "knights_played": 2,
+    "longest_road_length": 4
+}
+
+# Board state is only read with include_board=True
+_GAME_WITH_BOARD = SimpleNamespace(
+    id=_GAME.id,
+    state=SimpleNamespace(
+        **vars(_GAME.state),
+        board=SimpleNamespace(
+            settlements={},
+            cities={},
+            roads={},
+            robber_tile="hex_5"
+        )
+    )
+)
 
 
 class TestCatanatronGameWrapper:
@@ -20,107 +159,20 @@ class TestCatanatronGameWrapper:
 
     @pytest.fixture
     def mock_game(self):
-        """Create a mock Catanatron game."""
-        game = Mock()
-        game.id = "test_game_123"
+        """Shared read-only fake Catanatron game."""
+        return _GAME
 
-        # Mock game state
-        game.state = Mock()
-        game.state.color_to_index = {
-            "RED": 0,
-            "BLUE": 1,
-            "WHITE": 2,
-            "ORANGE": 3
-        }
-
-        # Mock player state (flat dict)
-        game.state.player_state = {
-            # RED player (index 0)
-            "P0_WOOD_IN_HAND": 2,
-            "P0_BRICK_IN_HAND": 1,
-            "P0_SHEEP_IN_HAND": 3,
-            "P0_WHEAT_IN_HAND": 1,
-            "P0_ORE_IN_HAND": 0,
-            "P0_ACTUAL_VICTORY_POINTS": 4,
-            "P0_VICTORY_POINTS": 3,
-            "P0_SETTLEMENTS_AVAILABLE": 2,  # Built 3
-            "P0_CITIES_AVAILABLE": 3,  # Built 1
-            "P0_ROADS_AVAILABLE": 10,  # Built 5
-            "P0_KNIGHT_IN_HAND": 1,
-            "P0_YEAR_OF_PLENTY_IN_HAND": 0,
-            "P0_MONOPOLY_IN_HAND": 0,
-            "P0_ROAD_BUILDING_IN_HAND": 0,
-            "P0_VICTORY_POINT_IN_HAND": 1,
-            "P0_HAS_ROAD": False,
-            "P0_HAS_ARMY": False,
-            "P0_PLAYED_KNIGHT": 2,
-            "P0_LONGEST_ROAD_LENGTH": 4,
-
-            # BLUE player (index 1)
-            "P1_WOOD_IN_HAND": 1,
-            "P1_BRICK_IN_HAND": 2,
-            "P1_SHEEP_IN_HAND": 0,
-            "P1_WHEAT_IN_HAND": 1,
-            "P1_ORE_IN_HAND": 1,
-            "P1_ACTUAL_VICTORY_POINTS": 5,
-            "P1_VICTORY_POINTS": 5,
-            "P1_SETTLEMENTS_AVAILABLE": 3,
-            "P1_CITIES_AVAILABLE": 4,
-            "P1_ROADS_AVAILABLE": 12,
-            "P1_KNIGHT_IN_HAND": 0,
-            "P1_YEAR_OF_PLENTY_IN_HAND": 1,
-            "P1_MONOPOLY_IN_HAND": 0,
-            "P1_ROAD_BUILDING_IN_HAND": 0,
-            "P1_VICTORY_POINT_IN_HAND": 0,
-            "P1_HAS_ROAD": True,
-            "P1_HAS_ARMY": False,
-            "P1_PLAYED_KNIGHT": 0,
-
-            # WHITE player (index 2)
-            "P2_WOOD_IN_HAND": 0,
-            "P2_BRICK_IN_HAND": 0,
-            "P2_SHEEP_IN_HAND": 2,
-            "P2_WHEAT_IN_HAND": 3,
-            "P2_ORE_IN_HAND": 2,
-            "P2_ACTUAL_VICTORY_POINTS": 3,
-            "P2_VICTORY_POINTS": 2,
-            "P2_SETTLEMENTS_AVAILABLE": 3,
-            "P2_CITIES_AVAILABLE": 4,
-            "P2_ROADS_AVAILABLE": 13,
-            "P2_HAS_ROAD": False,
-            "P2_HAS_ARMY": False,
-            "P2_PLAYED_KNIGHT": 1,
-
-            # ORANGE player (index 3)
-            "P3_WOOD_IN_HAND": 3,
-            "P3_BRICK_IN_HAND": 3,
-            "P3_SHEEP_IN_HAND": 1,
-            "P3_WHEAT_IN_HAND": 0,
-            "P3_ORE_IN_HAND": 0,
-            "P3_ACTUAL_VICTORY_POINTS": 2,
-            "P3_VICTORY_POINTS": 2,
-            "P3_SETTLEMENTS_AVAILABLE": 3,
-            "P3_CITIES_AVAILABLE": 4,
-            "P3_ROADS_AVAILABLE": 11,
-            "P3_HAS_ROAD": False,
-            "P3_HAS_ARMY": False,
-            "P3_PLAYED_KNIGHT": 0,
-        }
-
-        # Mock actions list
-        game.state.actions = [Mock() for _ in range(15)]
-
-        # Mock development deck
-        game.state.development_deck = [Mock() for _ in range(20)]
-
-        # Mock board
-        game.state.board = Mock()
-        game.state.board.settlements = {}
-        game.state.board.cities = {}
-        game.state.board.roads = {}
-        game.state.board.robber_tile = "hex_5"
-
-        return game
+    @pytest.fixture(scope="module")
+    def red_full_state(self):
+        """RED's state with board and history, computed once for the module."""
+        return CatanatronGameWrapper(_GAME_WITH_BOARD, "RED").get_state(
+            include_board=True, include_history=True
+        )
+
+    @pytest.fixture(scope="module")
+    def red_state_json(self, red_full_state):
+        """red_full_state serialized once (raises if not JSON serializable)."""
+        return json.dumps(red_full_state)
 
     def test_initialization(self, mock_game):
         """Test wrapper initialization."""
@@ -135,9 +187,7 @@ class TestCatanatronGameWrapper:
         wrapper = CatanatronGameWrapper(mock_game, "RED")
         state = wrapper.get_state()
 
-        # Verify JSON serializable
-        json_str = json.dumps(state)
-        assert json_str is not None
+        # JSON serializability is covered by test_json_serialization
 
         # Check structure
         assert "game_id" in state
@@ -158,38 +208,7 @@ class TestCatanatronGameWrapper:
         wrapper = CatanatronGameWrapper(mock_game, "RED")
         state = wrapper.get_state()
 
-        your_state = state["your_state"]
-
-        # Check resources
-        assert your_state["resources"]["wood"] == 2
-        assert your_state["resources"]["brick"] == 1
-        assert your_state["resources"]["sheep"] == 3
-        assert your_state["resources"]["wheat"] == 1
-        assert your_state["resources"]["ore"] == 0
-        assert your_state["total_resources"] == 7
-
-        # Check victory points
-        assert your_state["victory_points"] == 4
-        assert your_state["public_victory_points"] == 3
-
-        # Check buildings
-        assert your_state["buildings"]["settlements_built"] == 3
-        assert your_state["buildings"]["cities_built"] == 1
-        assert your_state["buildings"]["roads_built"] == 5
-        assert your_state["buildings"]["settlements_available"] == 2
-        assert your_state["buildings"]["cities_available"] == 3
-        assert your_state["buildings"]["roads_available"] == 10
-
-        # Check dev cards
-        assert your_state["development_cards"]["knight"] == 1
-        assert your_state["development_cards"]["victory_point"] == 1
-        assert your_state["development_cards"]["total"] == 2
-
-        # Check special achievements
-        assert your_state["has_longest_road"] is False
-        assert your_state["has_largest_army"] is False
-        assert your_state["knights_played"] == 2
-        assert your_state["longest_road_length"] == 4
+        assert state["your_state"] == EXPECTED_RED_STATE
 
     def test_opponents_state_extraction(self, mock_game):
         """Test opponent state extraction."""
@@ -212,7 +231,7 @@ class TestCatanatronGameWrapper:
         assert blue["buildings"]["roads"] == 3
         assert blue["has_longest_road"] is True
 
-    def test_include_board_state(self, mock_game):
+    def test_include_board_state(self, mock_game, red_full_state):
         """Test board state inclusion."""
         wrapper = CatanatronGameWrapper(mock_game, "RED")
 
@@ -221,7 +240,7 @@ class TestCatanatronGameWrapper:
         assert "board" not in state_no_board
 
         # With board
-        state_with_board = wrapper.get_state(include_board=True)
+        state_with_board = red_full_state
         assert "board" in state_with_board
         assert "settlements" in state_with_board["board"]
         assert "cities" in state_with_board["board"]
@@ -229,7 +248,7 @@ class TestCatanatronGameWrapper:
         assert "robber_tile" in state_with_board["board"]
         assert state_with_board["board"]["robber_tile"] == "hex_5"
 
-    def test_include_history(self, mock_game):
+    def test_include_history(self, mock_game, red_full_state):
         """Test action history inclusion."""
         wrapper = CatanatronGameWrapper(mock_game, "RED")
 
@@ -238,7 +257,7 @@ class TestCatanatronGameWrapper:
         assert "recent_actions" not in state_no_history
 
         # With history
-        state_with_history = wrapper.get_state(include_history=True)
+        state_with_history = red_full_state
         assert "recent_actions" in state_with_history
         assert len(state_with_history["recent_actions"]) == 10
 
@@ -264,20 +283,42 @@ class TestCatanatronGameWrapper:
         assert "RED" not in [opp["color"] for opp in state_red["opponents"]]
         assert "BLUE" not in [opp["color"] for opp in state_blue["opponents"]]
 
-    def test_json_serialization(self, mock_game):
+    def test_json_serialization(self, red_state_json):
         """Test that entire state is JSON serializable."""
-        wrapper = CatanatronGameWrapper(mock_game, "RED")
-        state = wrapper.get_state(include_board=True, include_history=True)
-
-        # Should not raise exception
-        json_str = json.dumps(state)
-        assert len(json_str) > 0
+        assert red_state_json
 
         # Should be able to parse back
-        parsed = json.loads(json_str)
+        parsed = json.loads(red_state_json)
         assert parsed["your_color"] == "RED"
         assert parsed["turn_number"] == 15
 
+    def test_color_enums_serialized_as_names(self):
+        """Test real Color members come out as plain names under either encoder."""
+        game = SimpleNamespace(
+            id="color_game",
+            state=SimpleNamespace(
+                color_to_index={Color.RED: 0, Color.BLUE: 1},
+                player_state=_PLAYER_STATE,
+                actions=[],
+                development_deck=[],
+                board=SimpleNamespace(
+                    settlements={7: Color.BLUE},
+                    cities={},
+                    roads={(7, 8): Color.RED},
+                    robber_tile=None
+                )
+            )
+        )
+
+        state = CatanatronGameWrapper(game, Color.RED).get_state(include_board=True)
+
+        assert state["your_color"] == "RED"
+        assert [opp["color"] for opp in state["opponents"]] == ["BLUE"]
+        assert state["board"]["settlements"][0]["color"] == "BLUE"
+        assert state["board"]["roads"][0]["color"] == "RED"
+        # Plain json.dumps (no default=) raises on any leftover enum
+        assert json.loads(_dumps_result(state)) == json.loads(json.dumps(state))
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,170 @@
+"""
+Tests for MCPClaudePlayer.
+
+Drives the tool-use loop with canned Anthropic stream events (no network).
+"""
+
+import json
+import pytest
+import threading
+from types import SimpleNamespace
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.mcp.server import CatanatronMCPServer
+from src.players.mcp_based import mcp_claude_player
+from src.players.mcp_based.mcp_claude_player import MCPClaudePlayer
+
+
+_USAGE = SimpleNamespace(
+    input_tokens=100, output_tokens=10, cache_creation_input_tokens=0, cache_read_input_tokens=0
+)
+
+
+def _text(text):
+    """Text content block."""
+    return SimpleNamespace(type="text", text=text)
+
+
+def _tool_use(block_id, name, tool_input=None):
+    """tool_use content block."""
+    return SimpleNamespace(type="tool_use", id=block_id, name=name, input=tool_input or {})
+
+
+class _FakeStream:
+    """messages.stream() context manager yielding a content_block_stop per block."""
+
+    def __init__(self, blocks):
+        self.message = SimpleNamespace(
+            content=blocks,
+            stop_reason="tool_use" if any(b.type == "tool_use" for b in blocks) else "end_turn",
+            usage=_USAGE
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __iter__(self):
+        for index, block in enumerate(self.message.content):
+            yield SimpleNamespace(type="content_block_start", index=index, content_block=block)
+            yield SimpleNamespace(type="content_block_stop", index=index, content_block=block)
+
+    def get_final_message(self):
+        return self.message
+
+
+class TestMCPClaudePlayer:
+    """Test suite for Claude tool-use streaming."""
+
+    @pytest.fixture
+    def player(self):
+        """Streaming player with its own MCP server; the client is replaced per test."""
+        return MCPClaudePlayer(
+            "RED",
+            {"model_id": "claude-test", "name": "Claude"},
+            mcp_server=CatanatronMCPServer("test_claude"),
+            anthropic_api_key="test-key",
+            stream_responses=True
+        )
+
+    @staticmethod
+    def _script_streams(player, turns):
+        """Answer each messages.stream() call with the next turn's blocks; return sent params."""
+        sent = []
+        turns = iter(turns)
+
+        def stream(**params):
+            sent.append({**params, "messages": list(params["messages"])})
+            return _FakeStream(next(turns))
+
+        player.client = SimpleNamespace(messages=SimpleNamespace(stream=stream))
+        return sent
+
+    @staticmethod
+    def _record_tool_calls(server):
+        """Wrap server.handle_tool_call; return (tool name, thread name) per call."""
+        calls = []
+        handle_tool_call = server.handle_tool_call
+
+        def recording(tool_name, *args, **kwargs):
+            calls.append((tool_name, threading.current_thread().name))
+            return handle_tool_call(tool_name, *args, **kwargs)
+
+        server.handle_tool_call = recording
+        return calls
+
+    def test_stream_starts_read_only_tools_early(self, player, mock_game, mock_actions):
+        """Test read-only tool_use blocks start mid-stream and select_action never does."""
+        server = player.mcp_server
+        server.set_game_context(mock_game, "RED", mock_actions)
+        tool_calls = self._record_tool_calls(server)
+        early_results = {}
+        blocks = [
+            _tool_use("tu_state", "get_game_state"),
+            _tool_use("tu_select", "select_action", {"action_id": "end_turn"}),
+        ]
+        player.client = SimpleNamespace(
+            messages=SimpleNamespace(stream=lambda **params: _FakeStream(blocks))
+        )
+
+        message = player._stream_message(server, early_results, model="claude-test")
+
+        assert message.content == blocks
+        assert list(early_results) == ["tu_state"]
+        assert json.loads(early_results["tu_state"].result())["your_color"] == "RED"
+        assert [name for name, _ in tool_calls] == ["get_game_state"]
+        assert server.selected_action_id is None
+
+    def test_stream_early_results_reused(self, player, mock_game, mock_actions):
+        """Test tools started mid-stream feed the tool_result without running again."""
+        tool_calls = self._record_tool_calls(player.mcp_server)
+        sent = self._script_streams(player, [
+            [_text("Looking"), _tool_use("tu_state", "get_game_state"),
+             _tool_use("tu_actions", "get_valid_actions")],
+            [_tool_use("tu_select", "select_action", {"action_id": "end_turn"})],
+        ])
+
+        selected_action = player.decide(mock_game, mock_actions)
+
+        assert selected_action is mock_actions[1]
+        names = [name for name, _ in tool_calls]
+        assert names == ["get_game_state", "get_valid_actions", "select_action"]
+        # Read-only tools ran on the executor; select_action on the deciding thread
+        threads = dict(tool_calls)
+        assert threads["get_game_state"].startswith("mcp-tool")
+        assert threads["get_valid_actions"].startswith("mcp-tool")
+        assert threads["select_action"] == threading.current_thread().name
+
+        tool_results = sent[1]["messages"][-1]["content"]
+        assert [r["tool_use_id"] for r in tool_results] == ["tu_state", "tu_actions"]
+        assert json.loads(tool_results[1]["content"])["num_actions"] == 2
+
+    def test_batch_players_get_private_servers(self, monkeypatch):
+        """Test batched players never share an MCP server, and refuse a passed one."""
+        monkeypatch.setattr(
+            mcp_claude_player, "_get_batch_dispatcher", lambda api_key, client: SimpleNamespace()
+        )
+        model_config = {"model_id": "claude-test", "name": "Claude"}
+
+        first, second = (
+            MCPClaudePlayer("RED", model_config, anthropic_api_key="test-key", use_batch_api=True)
+            for _ in range(2)
+        )
+        unbatched = MCPClaudePlayer("RED", model_config, anthropic_api_key="test-key")
+
+        assert first.mcp_server is not second.mcp_server
+        assert unbatched.mcp_server not in (first.mcp_server, second.mcp_server)
+        with pytest.raises(ValueError, match="private MCP server"):
+            MCPClaudePlayer(
+                "RED", model_config, mcp_server=unbatched.mcp_server,
+                anthropic_api_key="test-key", use_batch_api=True
+            )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
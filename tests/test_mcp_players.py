@@ -4,8 +4,14 @@ Integration tests for MCP-based players.
 Tests the full decide() flow with mock LLM responses.
 """
 
+import asyncio
+import copy
+import itertools
+import json
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+import re
+import uuid
+from types import MappingProxyType, SimpleNamespace
 
 import sys
 from pathlib import Path
@@ -13,12 +19,59 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.mcp.server import CatanatronMCPServer
 from src.players.mcp_based.base_mcp_player import BaseMCPPlayer
+from src.players.mcp_based.response_cache import ResponseCache
+from tests.conftest import FakeAction
+
+
+_PROMPT_REQUIRED = re.compile(
+    r"RED|10 victory points|get_game_state|get_valid_actions|select_action|[Ss]trategy"
+)
+_PROMPT_REQUIRED_TERMS = {
+    "red", "10 victory points", "get_game_state", "get_valid_actions", "select_action", "strategy"
+}
+
+
+# Read-only and shared by every test; mock_game copies keep this same
+# proxy (see _copy_game) instead of deep-copying the dict
+_PLAYER_STATE = MappingProxyType({
+    "P0_WOOD_IN_HAND": 2,
+    "P0_BRICK_IN_HAND": 1,
+    "P0_SHEEP_IN_HAND": 3,
+    "P0_WHEAT_IN_HAND": 1,
+    "P0_ORE_IN_HAND": 0,
+    "P0_ACTUAL_VICTORY_POINTS": 4,
+    "P0_VICTORY_POINTS": 3,
+    "P0_SETTLEMENTS_AVAILABLE": 2,
+    "P0_CITIES_AVAILABLE": 3,
+    "P0_ROADS_AVAILABLE": 10,
+    "P0_KNIGHT_IN_HAND": 1,
+    "P0_YEAR_OF_PLENTY_IN_HAND": 0,
+    "P0_MONOPOLY_IN_HAND": 0,
+    "P0_ROAD_BUILDING_IN_HAND": 0,
+    "P0_VICTORY_POINT_IN_HAND": 1,
+    "P0_HAS_ROAD": False,
+    "P0_HAS_ARMY": False,
+    "P0_PLAYED_KNIGHT": 0,
+})
+
+
+_ACTION_TYPES = ("BUILD_SETTLEMENT", "BUILD_ROAD", "END_TURN")
+
+
+def _copy_game(game):
+    """Deep-copy a mock game, sharing the read-only _PLAYER_STATE proxy."""
+    return copy.deepcopy(game, {id(_PLAYER_STATE): _PLAYER_STATE})
+
+
+def _make_action(i, action_type):
+    """Build the i-th mock action (only the first two carry a value)."""
+    return FakeAction(f"ActionType.{action_type}", "RED", i * 10 if i < 2 else None)
 
 
 class MockMCPPlayer(BaseMCPPlayer):
     """Mock MCP player for testing."""
 
-    def __init__(self, color, mcp_server=None):
+    def __init__(self, color, mcp_server=None, query_state=False):
         super().__init__(
             color=color,
             model_name="MockModel",
@@ -27,18 +80,25 @@ class MockMCPPlayer(BaseMCPPlayer):
             mcp_server=mcp_server
         )
         self.query_count = 0
+        self._query_counter = itertools.count(1)
+        # Only the full-flow test needs the get_game_state round trip
+        self.query_state = query_state
+        # Parsed get_valid_actions result; every test reuses one action set
+        self._cached_actions = None
 
     def query_llm_with_mcp(self, system_prompt, mcp_server):
         """Mock LLM query that selects first action."""
-        self.query_count += 1
-
-        # Simulate LLM querying game state
-        mcp_server.handle_tool_call("get_game_state", {})
-
-        # Simulate LLM getting valid actions
-        actions_result = mcp_server.handle_tool_call("get_valid_actions", {})
-        import json
-        actions = json.loads(actions_result)
+        self.query_count = next(self._query_counter)
+
+        # Simulate LLM querying game state and valid actions in one turn
+        # (valid actions are parsed once per game)
+        calls = [("get_game_state", {})] if self.query_state else []
+        if self._cached_actions is None:
+            calls.append(("get_valid_actions", {}))
+        results = mcp_server.handle_tool_calls(calls)
+        if self._cached_actions is None:
+            self._cached_actions = json.loads(results[-1])
+        actions = self._cached_actions
 
         # Select first action
         if actions["num_actions"] > 0:
@@ -47,63 +107,71 @@ class MockMCPPlayer(BaseMCPPlayer):
 
         return ("Selected action via MCP tools", 0.001, 100)
 
+    def reset_state(self):
+        """Reset state between games, including the cached action list."""
+        super().reset_state()
+        self._cached_actions = None
+
+
+class _NoSelectPlayer(BaseMCPPlayer):
+    """MCP player whose LLM never calls select_action."""
+
+    def query_llm_with_mcp(self, system_prompt, mcp_server):
+        return ("No action selected", 0.0, 0)
+
+
+class _ErrorPlayer(BaseMCPPlayer):
+    """MCP player whose LLM query always fails."""
+
+    def query_llm_with_mcp(self, system_prompt, mcp_server):
+        raise ValueError("Test error")
+
 
 class TestMCPPlayers:
     """Test suite for MCP player integration."""
 
+    @pytest.fixture(scope="session")
+    def _mock_game_template(self):
+        """Build the mock Catanatron game once per session."""
+        state = SimpleNamespace()
+        state.color_to_index = {"RED": 0, "BLUE": 1}
+        state.player_state = _PLAYER_STATE
+        state.actions = []
+        state.development_deck = []
+        state.board = SimpleNamespace(settlements={}, cities={}, roads={})
+        return SimpleNamespace(id="test_game", state=state)
+
+    @pytest.fixture
+    def mock_game(self, _mock_game_template):
+        """Per-test copy of the template game (tests may mutate it)."""
+        return _copy_game(_mock_game_template)
+
+    @pytest.fixture(scope="session")
+    def _mock_actions_template(self):
+        """Build the mock actions once per session."""
+        return [_make_action(i, action_type) for i, action_type in enumerate(_ACTION_TYPES)]
+
     @pytest.fixture
-    def mock_game(self):
-        """Create a mock Catanatron game."""
-        game = Mock()
-        game.id = "test_game"
-        game.state = Mock()
-        game.state.color_to_index = {"RED": 0, "BLUE": 1}
-        game.state.player_state = {
-            "P0_WOOD_IN_HAND": 2,
-            "P0_BRICK_IN_HAND": 1,
-            "P0_SHEEP_IN_HAND": 3,
-            "P0_WHEAT_IN_HAND": 1,
-            "P0_ORE_IN_HAND": 0,
-            "P0_ACTUAL_VICTORY_POINTS": 4,
-            "P0_VICTORY_POINTS": 3,
-            "P0_SETTLEMENTS_AVAILABLE": 2,
-            "P0_CITIES_AVAILABLE": 3,
-            "P0_ROADS_AVAILABLE": 10,
-            "P0_KNIGHT_IN_HAND": 1,
-            "P0_YEAR_OF_PLENTY_IN_HAND": 0,
-            "P0_MONOPOLY_IN_HAND": 0,
-            "P0_ROAD_BUILDING_IN_HAND": 0,
-            "P0_VICTORY_POINT_IN_HAND": 1,
-            "P0_HAS_ROAD": False,
-            "P0_HAS_ARMY": False,
-            "P0_PLAYED_KNIGHT": 0,
-        }
-        game.state.actions = []
-        game.state.development_deck = []
-        game.state.board = Mock()
-        game.state.board.settlements = {}
-        game.state.board.cities = {}
-        game.state.board.roads = {}
-        return game
+    def mock_actions(self, _mock_actions_template):
+        """Per-test copy of the template actions."""
+        return copy.deepcopy(_mock_actions_template)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def _server_cached(cls):
+        """One server shared by the class; context is cleared around each test."""
+        return CatanatronMCPServer(f"test_{uuid.uuid4().hex}")
 
     @pytest.fixture
-    def mock_actions(self):
-        """Create mock actions."""
-        actions = []
-        for i, action_type in enumerate(["BUILD_SETTLEMENT", "BUILD_ROAD", "END_TURN"]):
-            action = Mock()
-            action.action_type = Mock()
-            action.action_type.__str__ = lambda self, at=action_type: f"ActionType.{at}"
-            action.color = "RED"
-            action.value = i * 10 if i < 2 else None
-            action.__str__ = Mock(return_value=f"{action_type} action")
-            actions.append(action)
-        return actions
-
-    def test_base_mcp_player_decide_flow(self, mock_game, mock_actions):
+    def mcp_server(self, _server_cached):
+        """Shared server with no game context (players set their own)."""
+        _server_cached.clear_context()
+        yield _server_cached
+        _server_cached.clear_context()
+
+    def test_base_mcp_player_decide_flow(self, mcp_server, mock_game, mock_actions):
         """Test full decide() flow with MCP player."""
-        mcp_server = CatanatronMCPServer("test_game")
-        player = MockMCPPlayer("RED", mcp_server=mcp_server)
+        player = MockMCPPlayer("RED", mcp_server=mcp_server, query_state=True)
 
         # Call decide
         selected_action = player.decide(mock_game, mock_actions)
@@ -120,15 +188,75 @@ class TestMCPPlayers:
         assert player.total_tokens == 100
         assert player.total_cost > 0
 
-    def test_mcp_player_fallback(self, mock_game, mock_actions):
-        """Test fallback when LLM doesn't select action."""
-        class NoSelectPlayer(BaseMCPPlayer):
-            def query_llm_with_mcp(self, system_prompt, mcp_server):
-                # Don't call select_action
-                return ("No action selected", 0.0, 0)
+    def test_base_mcp_player_adecide_flow(self, mcp_server, mock_game, mock_actions):
+        """Test async adecide() runs the same flow as decide()."""
+        player = MockMCPPlayer("RED", mcp_server=mcp_server)
+
+        selected_action = asyncio.run(player.adecide(mock_game, mock_actions))
+
+        assert selected_action in mock_actions
+        assert player.query_count == 1
+        assert player.move_count == 1
+        assert player.total_tokens == 100
+
+    def test_single_action_skips_llm(self, mcp_server, mock_game, mock_actions):
+        """Test a forced move is played without querying the LLM."""
+        player = MockMCPPlayer("RED", mcp_server=mcp_server)
+
+        selected_action = player.decide(mock_game, mock_actions[:1])
 
-        mcp_server = CatanatronMCPServer("test_game")
-        player = NoSelectPlayer(
+        assert selected_action is mock_actions[0]
+        assert player.query_count == 0
+        assert player.move_count == 1
+        assert player.get_stats()["auto_moves"] == 1
+
+    def test_response_cache_reused_across_players(self, mock_game, mock_actions, tmp_path):
+        """Test an identical decision is answered from the response cache."""
+        cache = ResponseCache(path=str(tmp_path / "responses.sqlite"))
+        tile = SimpleNamespace(resource="WOOD", number=6)
+        mock_game.state.board.map = SimpleNamespace(
+            land_tiles={(0, 0, 0): tile}, port_nodes={None: {0, 1}, "WOOD": {4, 5}}
+        )
+
+        def cached_player(temperature):
+            player = MockMCPPlayer("RED", mcp_server=CatanatronMCPServer("test_game"))
+            player.response_cache = cache
+            player.temperature = temperature
+            return player
+
+        first = cached_player(0)
+        first.decide(mock_game, mock_actions)
+
+        second = cached_player(0)
+        selected_action = second.decide(mock_game, mock_actions)
+
+        assert selected_action is mock_actions[0]
+        assert first.query_count == 1
+        assert second.query_count == 0
+        assert second.get_stats()["cache_hits"] == 1
+
+        # The same legal set in another order still hits, on the same action
+        reordered = cached_player(0)
+        selected_action = reordered.decide(mock_game, mock_actions[::-1])
+        assert selected_action is mock_actions[0]
+        assert reordered.query_count == 0
+
+        # Moving a port changes the map fingerprint, so the decision is re-queried
+        mock_game.state.board.map.port_nodes = {None: {0, 1}, "WOOD": {6, 7}}
+        moved_ports = cached_player(0)
+        moved_ports.decide(mock_game, mock_actions)
+        assert moved_ports.query_count == 1
+
+        # Sampling players neither read nor write the cache
+        sampled = cached_player(0.7)
+        sampled.decide(mock_game, mock_actions)
+        assert sampled.query_count == 1
+        assert sampled.get_stats()["cache_hits"] == 0
+        cache.close()
+
+    def test_mcp_player_fallback(self, mcp_server, mock_game, mock_actions):
+        """Test fallback when LLM doesn't select action."""
+        player = _NoSelectPlayer(
             color="RED",
             model_name="NoSelect",
             mcp_server=mcp_server
@@ -140,9 +268,8 @@ class TestMCPPlayers:
         assert selected_action is not None
         assert selected_action in mock_actions
 
-    def test_mcp_player_multiple_decisions(self, mock_game, mock_actions):
+    def test_mcp_player_multiple_decisions(self, mcp_server, mock_game, mock_actions):
         """Test player handling multiple decisions."""
-        mcp_server = CatanatronMCPServer("test_game")
         player = MockMCPPlayer("RED", mcp_server=mcp_server)
 
         # First decision
@@ -155,9 +282,8 @@ class TestMCPPlayers:
         assert action2 in mock_actions
         assert player.move_count == 2
 
-    def test_mcp_player_stats(self, mock_game, mock_actions):
+    def test_mcp_player_stats(self, mcp_server, mock_game, mock_actions):
         """Test player statistics tracking."""
-        mcp_server = CatanatronMCPServer("test_game")
         player = MockMCPPlayer("RED", mcp_server=mcp_server)
 
         # Make a few decisions
@@ -172,9 +298,8 @@ class TestMCPPlayers:
         assert stats["total_tokens"] == 300
         assert stats["mode"] == "mcp"
 
-    def test_mcp_player_reset(self, mock_game, mock_actions):
+    def test_mcp_player_reset(self, mcp_server, mock_game, mock_actions):
         """Test player state reset."""
-        mcp_server = CatanatronMCPServer("test_game")
         player = MockMCPPlayer("RED", mcp_server=mcp_server)
 
         # Make some decisions
@@ -191,29 +316,31 @@ class TestMCPPlayers:
         assert player.total_cost == 0.0
         assert len(player.recent_moves) == 0
 
-    def test_system_prompt_generation(self, mock_game):
+    def test_system_prompt_generation(self, mcp_server, mock_game):
         """Test system prompt includes necessary information."""
-        mcp_server = CatanatronMCPServer("test_game")
         player = MockMCPPlayer("RED", mcp_server=mcp_server)
 
         prompt = player._build_system_prompt(mock_game)
 
-        # Check key elements
-        assert "RED" in prompt
-        assert "10 victory points" in prompt
-        assert "get_game_state" in prompt
-        assert "get_valid_actions" in prompt
-        assert "select_action" in prompt
-        assert "Strategy" in prompt or "strategy" in prompt
+        # Check key elements in one pass over the prompt
+        found = {match.lower() for match in _PROMPT_REQUIRED.findall(prompt)}
+        assert found == _PROMPT_REQUIRED_TERMS, f"missing {_PROMPT_REQUIRED_TERMS - found}"
 
-    def test_mcp_player_error_handling(self, mock_game, mock_actions):
-        """Test error handling in decide()."""
-        class ErrorPlayer(BaseMCPPlayer):
-            def query_llm_with_mcp(self, system_prompt, mcp_server):
-                raise ValueError("Test error")
+    def test_system_prompt_static_across_moves(self, mcp_server, mock_game, mock_actions):
+        """Test recent moves go to the user message, not the system prompt."""
+        player = MockMCPPlayer("RED", mcp_server=mcp_server)
 
-        mcp_server = CatanatronMCPServer("test_game")
-        player = ErrorPlayer(
+        prompt_before = player._build_system_prompt(mock_game)
+        player.decide(mock_game, mock_actions)
+        prompt_after = player._build_system_prompt(mock_game)
+
+        assert prompt_before == prompt_after
+        assert "recent moves" not in prompt_after
+        assert "Your recent moves" in player._build_user_message()
+
+    def test_mcp_player_error_handling(self, mcp_server, mock_game, mock_actions):
+        """Test error handling in decide()."""
+        player = _ErrorPlayer(
             color="RED",
             model_name="Error",
             mcp_server=mcp_server
@@ -225,6 +352,19 @@ class TestMCPPlayers:
         assert selected_action is not None
         assert selected_action in mock_actions
 
+    def test_mcp_server_cached_per_color(self):
+        """Test players without an explicit server share one per color."""
+        red1 = MockMCPPlayer("RED")
+        red2 = MockMCPPlayer("RED")
+        blue = MockMCPPlayer("BLUE")
+
+        assert red1.mcp_server is red2.mcp_server
+        assert red1.mcp_server is not blue.mcp_server
+
+        stats = BaseMCPPlayer.get_cache_stats()
+        assert stats["server_hits"] >= 1
+        assert stats["servers_cached"] >= 2
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,75 +4,130 @@ Unit tests for CatanatronMCPServer.
 Tests tool handlers, context management, and action selection.
 """
 
+import asyncio
+import copy
 import pytest
-from unittest.mock import Mock, MagicMock
+from types import MappingProxyType, SimpleNamespace
 import json
+import uuid
 
 import sys
 from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from mcp.server import CatanatronMCPServer
+from mcp.server import CatanatronMCPServer, _dumps_result
+from tests.conftest import FakeAction
+
+
+# Read-only and shared by every test; mock_game copies keep this same
+# proxy (see _copy_game), tests that mutate it use mutable_player_state
+_PLAYER_STATE = MappingProxyType({
+    "P0_WOOD_IN_HAND": 2,
+    "P0_BRICK_IN_HAND": 1,
+    "P0_SHEEP_IN_HAND": 3,
+    "P0_WHEAT_IN_HAND": 1,
+    "P0_ORE_IN_HAND": 0,
+    "P0_ACTUAL_VICTORY_POINTS": 4,
+    "P0_VICTORY_POINTS": 3,
+    "P0_SETTLEMENTS_AVAILABLE": 2,
+    "P0_CITIES_AVAILABLE": 3,
+    "P0_ROADS_AVAILABLE": 10,
+    "P0_KNIGHT_IN_HAND": 1,
+    "P0_YEAR_OF_PLENTY_IN_HAND": 0,
+    "P0_MONOPOLY_IN_HAND": 0,
+    "P0_ROAD_BUILDING_IN_HAND": 0,
+    "P0_VICTORY_POINT_IN_HAND": 1,
+    "P0_HAS_ROAD": False,
+    "P0_HAS_ARMY": False,
+    "P0_PLAYED_KNIGHT": 2,
+    "P0_LONGEST_ROAD_LENGTH": 4,
+    "P1_VICTORY_POINTS": 5,
+    "P1_WOOD_IN_HAND": 1,
+    "P1_BRICK_IN_HAND": 2,
+    "P1_SHEEP_IN_HAND": 0,
+    "P1_WHEAT_IN_HAND": 1,
+    "P1_ORE_IN_HAND": 1,
+})
+
+
+_ACTION_TYPES = ("BUILD_SETTLEMENT", "BUILD_ROAD", "END_TURN")
+
+
+def _copy_game(game):
+    """Deep-copy a mock game, sharing the read-only _PLAYER_STATE proxy."""
+    return copy.deepcopy(game, {id(_PLAYER_STATE): _PLAYER_STATE})
+
+
+def _make_action(i, action_type):
+    """Build the i-th mock action (only the first two carry a value)."""
+    return FakeAction(f"ActionType.{action_type}", "RED", i * 10 if i < 2 else None)
+
+
+def _select_action(server, index=0):
+    """Select the index-th valid action through the tools; return (action_id, result)."""
+    actions_data = server.handle_tool_call_dict("get_valid_actions", {})
+    action_id = actions_data["actions"][index]["action_id"]
+    result = server.handle_tool_call_dict("select_action", {"action_id": action_id})
+    return action_id, result
+
+
+def _assert_shape(d, **expected):
+    """Assert d has every expected key; check the value unless it is ``...``."""
+    for key, value in expected.items():
+        assert key in d, f"missing {key} in {list(d)}"
+        if value is not ...:
+            assert d[key] == value, f"{key}: {d[key]!r} != {value!r}"
 
 
 class TestCatanatronMCPServer:
     """Test suite for MCP server."""
 
+    @pytest.fixture(scope="session")
+    def _mock_game_template(self):
+        """Build the mock Catanatron game once per session."""
+        state = SimpleNamespace()
+        state.color_to_index = {"RED": 0, "BLUE": 1, "WHITE": 2, "ORANGE": 3}
+        state.player_state = _PLAYER_STATE
+        state.actions = [object()] * 10
+        state.development_deck = [None] * 15
+        state.board = SimpleNamespace(settlements={}, cities={}, roads={})
+        return SimpleNamespace(id="test_game", state=state)
+
+    @pytest.fixture
+    def mock_game(self, _mock_game_template):
+        """Per-test copy of the template game (tests may mutate it)."""
+        return _copy_game(_mock_game_template)
+
+    @pytest.fixture
+    def mutable_player_state(self, mock_game):
+        """Give this test's game a writable copy of the shared player state."""
+        mock_game.state.player_state = dict(_PLAYER_STATE)
+        return mock_game.state.player_state
+
+    @pytest.fixture(scope="session")
+    def _mock_actions_template(self):
+        """Build the mock actions once per session."""
+        return [_make_action(i, action_type) for i, action_type in enumerate(_ACTION_TYPES)]
+
     @pytest.fixture
-    def mock_game(self):
-        """Create a mock Catanatron game."""
-        game = Mock()
-        game.id = "test_game"
-        game.state = Mock()
-        game.state.color_to_index = {"RED": 0, "BLUE": 1, "WHITE": 2, "ORANGE": 3}
-        game.state.player_state = {
-            "P0_WOOD_IN_HAND": 2,
-            "P0_BRICK_IN_HAND": 1,
-            "P0_SHEEP_IN_HAND": 3,
-            "P0_WHEAT_IN_HAND": 1,
-            "P0_ORE_IN_HAND": 0,
-            "P0_ACTUAL_VICTORY_POINTS": 4,
-            "P0_VICTORY_POINTS": 3,
-            "P0_SETTLEMENTS_AVAILABLE": 2,
-            "P0_CITIES_AVAILABLE": 3,
-            "P0_ROADS_AVAILABLE": 10,
-            "P0_KNIGHT_IN_HAND": 1,
-            "P0_YEAR_OF_PLENTY_IN_HAND": 0,
-            "P0_MONOPOLY_IN_HAND": 0,
-            "P0_ROAD_BUILDING_IN_HAND": 0,
-            "P0_VICTORY_POINT_IN_HAND": 1,
-            "P0_HAS_ROAD": False,
-            "P0_HAS_ARMY": False,
-            "P0_PLAYED_KNIGHT": 2,
-            "P0_LONGEST_ROAD_LENGTH": 4,
-            "P1_VICTORY_POINTS": 5,
-            "P1_WOOD_IN_HAND": 1,
-            "P1_BRICK_IN_HAND": 2,
-            "P1_SHEEP_IN_HAND": 0,
-            "P1_WHEAT_IN_HAND": 1,
-            "P1_ORE_IN_HAND": 1,
-        }
-        game.state.actions = [Mock() for _ in range(10)]
-        game.state.development_deck = [Mock() for _ in range(15)]
-        game.state.board = Mock()
-        game.state.board.settlements = {}
-        game.state.board.cities = {}
-        game.state.board.roads = {}
-        return game
+    def mock_actions(self, _mock_actions_template):
+        """Per-test copy of the template actions."""
+        return copy.deepcopy(_mock_actions_template)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def _server_cached(cls):
+        """One server shared by the class; context is reset around each test."""
+        return CatanatronMCPServer(f"test_{uuid.uuid4().hex}")
 
     @pytest.fixture
-    def mock_actions(self):
-        """Create mock actions."""
-        actions = []
-        for i, action_type in enumerate(["BUILD_SETTLEMENT", "BUILD_ROAD", "END_TURN"]):
-            action = Mock()
-            action.action_type = Mock()
-            action.action_type.__str__ = lambda self, at=action_type: f"ActionType.{at}"
-            action.color = "RED"
-            action.value = i * 10 if i < 2 else None
-            action.__str__ = Mock(return_value=f"{action_type} action")
-            actions.append(action)
-        return actions
+    def server(self, _server_cached, mock_game, mock_actions):
+        """Shared server with RED's context set on this test's game and actions."""
+        _server_cached.clear_context()
+        _server_cached.set_game_context(mock_game, "RED", mock_actions)
+        yield _server_cached
+        _server_cached.clear_context()
 
     def test_initialization(self):
         """Test server initialization."""
@@ -82,11 +137,8 @@ class TestCatanatronMCPServer:
         assert server.game_wrapper is None
         assert server.selected_action_id is None
 
-    def test_set_game_context(self, mock_game, mock_actions):
+    def test_set_game_context(self, server):
         """Test setting game context."""
-        server = CatanatronMCPServer()
-        server.set_game_context(mock_game, "RED", mock_actions)
-
         assert server.game_wrapper is not None
         assert server.game_wrapper.player_color == "RED"
         assert server.selected_action_id is None
@@ -105,155 +157,182 @@ class TestCatanatronMCPServer:
 
         # Check tool structure
         for tool in tools:
-            assert "name" in tool
-            assert "description" in tool
-            assert "input_schema" in tool
+            _assert_shape(tool, name=..., description=..., input_schema=...)
+
+    def test_provider_tools_cached(self):
+        """Test provider-format tool lists are built once per server."""
+        server = CatanatronMCPServer()
+
+        assert server.get_tools() is server.get_tools()
+        assert server.get_anthropic_tools() is server.get_anthropic_tools()
+        assert server.get_openai_tools() is server.get_openai_tools()
+
+        openai_names = [tool["function"]["name"] for tool in server.get_openai_tools()]
+        anthropic_names = [tool["name"] for tool in server.get_anthropic_tools()]
+        assert openai_names == anthropic_names == [tool["name"] for tool in server.get_tools()]
 
     def test_handle_tool_call_without_context(self):
         """Test tool call without game context."""
         server = CatanatronMCPServer()
 
-        result = server.handle_tool_call("get_game_state", {})
-        result_dict = json.loads(result)
+        result_dict = json.loads(server.handle_tool_call("get_game_state", {}))
 
-        assert "error" in result_dict
+        _assert_shape(result_dict, error=...)
         assert "context" in result_dict["error"].lower()
+        assert server.handle_tool_call_dict("get_game_state", {}) == result_dict
 
-    def test_get_game_state_tool(self, mock_game, mock_actions):
+    def test_get_game_state_tool(self, server):
         """Test get_game_state tool handler."""
-        server = CatanatronMCPServer()
-        server.set_game_context(mock_game, "RED", mock_actions)
-
-        result = server.handle_tool_call("get_game_state", {})
-        state = json.loads(result)
+        state = server.handle_tool_call_dict("get_game_state", {})
 
         # Verify structure
-        assert "your_color" in state
-        assert "your_state" in state
-        assert "opponents" in state
-        assert state["your_color"] == "RED"
+        _assert_shape(state, your_color="RED", your_state=..., opponents=...)
 
         # Verify player state
         assert state["your_state"]["resources"]["wood"] == 2
         assert state["your_state"]["victory_points"] == 4
 
-    def test_get_game_state_with_board(self, mock_game, mock_actions):
-        """Test get_game_state with board inclusion."""
-        server = CatanatronMCPServer()
+    def test_get_valid_actions_toon_format(self, server):
+        """Test get_valid_actions can return TOON instead of JSON."""
+        result = server.handle_tool_call("get_valid_actions", {}, result_format="toon")
+        lines = result.splitlines()
+
+        assert lines[0] == "num_actions: 3"
+        assert lines[1].startswith("actions[3]{action_id|")
+        assert len(lines) == 5
+
+        # select_action results stay JSON
+        action_id = lines[2].strip().split("|")[0]
+        selected = json.loads(
+            server.handle_tool_call("select_action", {"action_id": action_id}, result_format="toon")
+        )
+        assert selected["success"] is True
+
+    def test_ahandle_tool_call_concurrent(self, server):
+        """Test async tool calls can be gathered within one LLM turn."""
+        async def run_tools():
+            return await asyncio.gather(
+                server.ahandle_tool_call("get_game_state", {}),
+                server.ahandle_tool_call("get_valid_actions", {})
+            )
+
+        state_result, actions_result = asyncio.run(run_tools())
+
+        assert json.loads(state_result)["your_color"] == "RED"
+        assert json.loads(actions_result)["num_actions"] == 3
+
+    def test_tool_results_cached_per_context(
+        self, mutable_player_state, server, mock_game, mock_actions
+    ):
+        """Test repeated read-only tool calls reuse the cached result."""
+        first = server.handle_tool_call("get_game_state", {})
+        mutable_player_state["P0_WOOD_IN_HAND"] = 9
+        assert server.handle_tool_call("get_game_state", {}) == first
+
+        # New context invalidates the cache
         server.set_game_context(mock_game, "RED", mock_actions)
+        state = server.handle_tool_call_dict("get_game_state", {})
+        assert state["your_state"]["resources"]["wood"] == 9
 
+    def test_get_game_state_with_board(self, server):
+        """Test get_game_state with board inclusion."""
         # Without board
-        result_no_board = server.handle_tool_call("get_game_state", {"include_board": False})
-        state_no_board = json.loads(result_no_board)
+        state_no_board = server.handle_tool_call_dict("get_game_state", {"include_board": False})
         assert "board" not in state_no_board
 
         # With board
-        result_with_board = server.handle_tool_call("get_game_state", {"include_board": True})
-        state_with_board = json.loads(result_with_board)
+        state_with_board = server.handle_tool_call_dict("get_game_state", {"include_board": True})
         assert "board" in state_with_board
 
-    def test_get_valid_actions_tool(self, mock_game, mock_actions):
+    def test_get_valid_actions_tool(self, server):
         """Test get_valid_actions tool handler."""
-        server = CatanatronMCPServer()
-        server.set_game_context(mock_game, "RED", mock_actions)
-
-        result = server.handle_tool_call("get_valid_actions", {})
-        actions_data = json.loads(result)
+        actions_data = server.handle_tool_call_dict("get_valid_actions", {})
 
-        assert "num_actions" in actions_data
-        assert "actions" in actions_data
-        assert actions_data["num_actions"] == 3
+        _assert_shape(actions_data, num_actions=3, actions=...)
 
         # Verify action structure
-        first_action = actions_data["actions"][0]
-        assert "action_id" in first_action
-        assert "description" in first_action
-        assert "action_type" in first_action
+        _assert_shape(actions_data["actions"][0], action_id=..., description=..., action_type=...)
 
-    def test_select_action_tool_success(self, mock_game, mock_actions):
-        """Test successful action selection."""
-        server = CatanatronMCPServer()
-        server.set_game_context(mock_game, "RED", mock_actions)
+    def test_handle_tool_calls_batch(self, server):
+        """Test a batch of tool calls matches the individual calls, in order."""
+        calls = [("get_game_state", {}), ("get_valid_actions", {}), ("unknown_tool", {})]
+
+        results = server.handle_tool_calls(calls)
+
+        assert results == [server.handle_tool_call(name, args) for name, args in calls]
+
+        server.clear_context()
+        errors = [json.loads(r) for r in server.handle_tool_calls(calls[:2])]
+        assert all("context" in e["error"].lower() for e in errors)
+
+    def test_handle_tool_call_dict_matches_json(self, server):
+        """Test the in-process dict results equal the parsed wire results."""
+        for tool_name in ("get_game_state", "get_valid_actions", "unknown_tool"):
+            assert server.handle_tool_call_dict(tool_name, {}) == json.loads(
+                server.handle_tool_call(tool_name, {})
+            )
+
+        # Dict results are fresh, so mutating one leaves the cached JSON intact
+        server.handle_tool_call_dict("get_valid_actions", {})["actions"].clear()
+        assert json.loads(server.handle_tool_call("get_valid_actions", {}))["num_actions"] == 3
+
+    def test_tool_results_compact_json(self, server):
+        """Test results are compact JSON whichever encoder is installed."""
+        result = server.handle_tool_call("get_valid_actions", {})
+
+        assert '", "' not in result and '": "' not in result
+        assert json.loads(result)["num_actions"] == 3
 
-        # Get valid action IDs first
-        actions_result = server.handle_tool_call("get_valid_actions", {})
-        actions_data = json.loads(actions_result)
-        first_action_id = actions_data["actions"][0]["action_id"]
+        # Non-string keys and unknown values are stringified like json.dumps(default=str)
+        assert json.loads(_dumps_result({1: Path("x")})) == {"1": "x"}
 
-        # Select the action
-        result = server.handle_tool_call("select_action", {"action_id": first_action_id})
-        selection = json.loads(result)
+    @pytest.mark.parametrize("action_idx", [0, 1, 2])
+    def test_select_action_tool_success(self, server, mock_actions, action_idx):
+        """Test successful selection of each valid action."""
+        action_id, selection = _select_action(server, action_idx)
 
-        assert selection["success"] is True
-        assert selection["action_id"] == first_action_id
-        assert "message" in selection
+        _assert_shape(selection, success=True, action_id=action_id, message=...)
 
         # Verify server state
-        assert server.selected_action_id == first_action_id
+        assert server.selected_action_id == action_id
+        assert server.get_selected_action() is mock_actions[action_idx]
 
-    def test_select_action_missing_id(self, mock_game, mock_actions):
+    def test_select_action_missing_id(self, server):
         """Test select_action without action_id."""
-        server = CatanatronMCPServer()
-        server.set_game_context(mock_game, "RED", mock_actions)
+        error = server.handle_tool_call_dict("select_action", {})
 
-        result = server.handle_tool_call("select_action", {})
-        error = json.loads(result)
-
-        assert "error" in error
+        _assert_shape(error, error=...)
         assert "action_id" in error["error"]
 
-    def test_select_action_invalid_id(self, mock_game, mock_actions):
+    def test_select_action_invalid_id(self, server):
         """Test select_action with invalid action_id."""
-        server = CatanatronMCPServer()
-        server.set_game_context(mock_game, "RED", mock_actions)
-
-        result = server.handle_tool_call("select_action", {"action_id": "invalid_action"})
-        error = json.loads(result)
+        error = server.handle_tool_call_dict("select_action", {"action_id": "invalid_action"})
 
-        assert "error" in error
-        assert "valid_action_ids" in error
+        _assert_shape(error, error=..., valid_action_ids=...)
 
-    def test_get_selected_action(self, mock_game, mock_actions):
+    def test_get_selected_action(self, server, mock_actions):
         """Test retrieving selected action."""
-        server = CatanatronMCPServer()
-        server.set_game_context(mock_game, "RED", mock_actions)
-
         # Initially no selection
         assert server.get_selected_action() is None
 
         # Select an action
-        actions_result = server.handle_tool_call("get_valid_actions", {})
-        actions_data = json.loads(actions_result)
-        first_action_id = actions_data["actions"][0]["action_id"]
-
-        server.handle_tool_call("select_action", {"action_id": first_action_id})
+        _select_action(server)
 
         # Now should return the action
         selected_action = server.get_selected_action()
         assert selected_action is not None
         assert selected_action == mock_actions[0]
 
-    def test_unknown_tool(self, mock_game, mock_actions):
+    def test_unknown_tool(self, server):
         """Test calling unknown tool."""
-        server = CatanatronMCPServer()
-        server.set_game_context(mock_game, "RED", mock_actions)
+        error = server.handle_tool_call_dict("unknown_tool", {})
 
-        result = server.handle_tool_call("unknown_tool", {})
-        error = json.loads(result)
+        _assert_shape(error, error=..., available_tools=...)
 
-        assert "error" in error
-        assert "available_tools" in error
-
-    def test_clear_context(self, mock_game, mock_actions):
+    def test_clear_context(self, server):
         """Test clearing game context."""
-        server = CatanatronMCPServer()
-        server.set_game_context(mock_game, "RED", mock_actions)
-
         # Select an action
-        actions_result = server.handle_tool_call("get_valid_actions", {})
-        actions_data = json.loads(actions_result)
-        first_action_id = actions_data["actions"][0]["action_id"]
-        server.handle_tool_call("select_action", {"action_id": first_action_id})
+        _select_action(server)
 
         # Verify context is set
         assert server.game_wrapper is not None
@@ -266,31 +345,68 @@ class TestCatanatronMCPServer:
         assert server.game_wrapper is None
         assert server.selected_action_id is None
 
-    def test_multiple_decisions(self, mock_game, mock_actions):
-        """Test server handling multiple decisions."""
-        server = CatanatronMCPServer()
-
-        # First decision
-        server.set_game_context(mock_game, "RED", mock_actions)
-        result1 = server.handle_tool_call("get_valid_actions", {})
-        actions1 = json.loads(result1)
-        server.handle_tool_call("select_action", {"action_id": actions1["actions"][0]["action_id"]})
+    def test_multiple_decisions(self, server, mock_game, mock_actions):
+        """Test one server reused across decisions via clear_context()."""
+        # First decision (RED's context is set by the fixture)
+        _select_action(server, 0)
         selected1 = server.get_selected_action()
 
-        # Second decision (context reset)
+        # Second decision on the same server
+        server.clear_context()
         server.set_game_context(mock_game, "BLUE", mock_actions)
-        result2 = server.handle_tool_call("get_valid_actions", {})
-        actions2 = json.loads(result2)
 
         # Previous selection should be cleared
         assert server.selected_action_id is None
 
         # New selection
-        server.handle_tool_call("select_action", {"action_id": actions2["actions"][1]["action_id"]})
+        _select_action(server, 1)
         selected2 = server.get_selected_action()
 
         assert selected1 != selected2
 
+    def test_context_reuse_idempotent(self, server, mock_game, mock_actions):
+        """Test repeated set/clear cycles leave no state behind on the server."""
+        server.handle_tool_call("get_valid_actions", {})
+        attributes = set(vars(server))
+
+        for _ in range(100):
+            server.clear_context()
+            server.set_game_context(mock_game, "RED", mock_actions)
+            _select_action(server)
+
+        assert set(vars(server)) == attributes
+        assert len(server.action_mapper.id_to_action) == len(mock_actions)
+        assert len(server._result_cache) <= 1
+
+        server.clear_context()
+        assert server.game_wrapper is None
+        assert server.selected_action_id is None
+        assert not server._result_cache
+
+    @pytest.mark.perf
+    def test_perf_set_game_context(self, benchmark, _server_cached, mock_game, mock_actions):
+        """Benchmark switching the shared server to a new decision's context."""
+        server = _server_cached
+
+        def switch_context():
+            server.clear_context()
+            server.set_game_context(mock_game, "RED", mock_actions)
+
+        benchmark(switch_context)
+        assert server.action_mapper.get_all_action_ids()
+        server.clear_context()
+
+    @pytest.mark.perf
+    def test_perf_get_valid_actions(self, benchmark, server, mock_game, mock_actions):
+        """Benchmark an uncached get_valid_actions call (context reset every round)."""
+        result = benchmark.pedantic(
+            server.handle_tool_call,
+            args=("get_valid_actions", {}),
+            setup=lambda: server.set_game_context(mock_game, "RED", mock_actions),
+            rounds=200
+        )
+        assert json.loads(result)["num_actions"] == 3
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,113 @@
+"""
+Tests for the queued move logger.
+
+Tests log_move() writes are deferred, ordered, and flushed before
+session-level calls.
+"""
+
+import gc
+import pytest
+import threading
+import weakref
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.move_log_queue import QueuedMoveLogger
+
+
+class RecordingLogger:
+    """Minimal GameResultLogger stand-in that records calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.output_dir = "logs"
+
+    def log_move(self, session_id, player, move_data, turn_number):
+        self.calls.append(("move", turn_number))
+
+    def end_session(self, session_id):
+        self.calls.append(("end", len(self.calls)))
+
+
+class TestQueuedMoveLogger:
+    """Test suite for QueuedMoveLogger."""
+
+    def test_moves_written_in_order_before_end_session(self):
+        """Test queued moves are flushed before forwarded calls."""
+        inner = RecordingLogger()
+        logger = QueuedMoveLogger(inner)
+
+        for turn in range(50):
+            logger.log_move(session_id="s", player="RED", move_data={}, turn_number=turn)
+        logger.end_session("s")
+
+        assert inner.calls == [("move", t) for t in range(50)] + [("end", 50)]
+        logger.close()
+
+    def test_forwards_attributes(self):
+        """Test non-callable attributes come from the wrapped logger."""
+        logger = QueuedMoveLogger(RecordingLogger())
+
+        assert logger.output_dir == "logs"
+        logger.close()
+
+    def test_write_errors_do_not_stop_worker(self):
+        """Test a failing write is logged and later moves still land."""
+        inner = RecordingLogger()
+        logger = QueuedMoveLogger(inner)
+
+        logger.log_move(bad_kwarg=True)
+        logger.log_move(session_id="s", player="RED", move_data={}, turn_number=1)
+        logger.flush()
+
+        assert inner.calls == [("move", 1)]
+        logger.close()
+
+    def test_log_after_close_writes_directly(self):
+        """Test moves logged after close() are written synchronously."""
+        inner = RecordingLogger()
+        logger = QueuedMoveLogger(inner)
+        logger.close()
+
+        logger.log_move(session_id="s", player="RED", move_data={}, turn_number=2)
+
+        assert inner.calls == [("move", 2)]
+
+    def test_closed_logger_not_pinned_by_atexit(self):
+        """Test close() drops the atexit hook so the logger can be collected."""
+        logger = QueuedMoveLogger(RecordingLogger())
+        logger.close()
+        ref = weakref.ref(logger)
+
+        del logger
+        gc.collect()
+
+        assert ref() is None
+
+    def test_close_races_with_log_move(self):
+        """Test moves logged while close() runs are all written and flush() returns."""
+        for _ in range(20):
+            inner = RecordingLogger()
+            logger = QueuedMoveLogger(inner)
+            writers = [
+                threading.Thread(target=lambda t=t: logger.log_move(
+                    session_id="s", player="RED", move_data={}, turn_number=t
+                ))
+                for t in range(20)
+            ]
+            for writer in writers[:10]:
+                writer.start()
+            logger.close()
+            for writer in writers[10:]:
+                writer.start()
+            for writer in writers:
+                writer.join()
+
+            logger.flush()
+            assert sorted(turn for _, turn in inner.calls) == list(range(20))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
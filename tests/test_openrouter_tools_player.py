@@ -0,0 +1,238 @@
+"""
+Tests for OpenRouterToolsPlayer.
+
+Drives the tool-calling loop with canned OpenRouter responses (no network).
+"""
+
+import asyncio
+import json
+import pytest
+import threading
+from types import SimpleNamespace
+
+import httpx
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.mcp.server import CatanatronMCPServer
+from src.players.mcp_based import openrouter_tools_player
+from src.players.mcp_based.openrouter_tools_player import (
+    OpenRouterToolsPlayer, _get_openrouter_client, _run_sync, shutdown_sync_loop
+)
+
+
+def _tool_call(tool_call_id, name, arguments="{}"):
+    """OpenAI-format tool call as found in an assistant message."""
+    return {
+        "id": tool_call_id,
+        "type": "function",
+        "function": {"name": name, "arguments": arguments}
+    }
+
+
+def _completion(tool_calls, content=None):
+    """Non-streaming completion response with the given tool calls."""
+    return {
+        "choices": [{
+            "message": {"role": "assistant", "content": content, "tool_calls": tool_calls},
+            "finish_reason": "tool_calls"
+        }],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 10}
+    }
+
+
+def _tool_delta(index, tool_call_id=None, name=None, arguments=None):
+    """Streaming chunk carrying one tool call delta."""
+    call = {"index": index, "function": {"name": name, "arguments": arguments}}
+    if tool_call_id:
+        call["id"] = tool_call_id
+    return {"choices": [{"delta": {"tool_calls": [call]}}]}
+
+
+def _sse_body(chunks):
+    """Server-sent event stream for chunks, with keep-alives and [DONE]."""
+    lines = [": OPENROUTER PROCESSING", ""]
+    for chunk in chunks:
+        lines += [f"data: {json.dumps(chunk)}", ""]
+    lines += ["data: [DONE]", ""]
+    return "\n".join(lines).encode("utf-8")
+
+
+# Second stream of a decision: END_TURN is selected
+_SELECT_STREAM = [
+    _tool_delta(0, "call_s", "select_action", '{"action_id": "end_turn"}'),
+    {"choices": [{"delta": {}, "finish_reason": "tool_calls"}]},
+]
+
+
+def _mock_client(streams):
+    """AsyncClient answering each request with the next canned SSE stream."""
+    streams = iter(streams)
+
+    def handler(request):
+        return httpx.Response(
+            200, content=_sse_body(next(streams)), headers={"content-type": "text/event-stream"}
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestOpenRouterToolsPlayer:
+    """Test suite for the OpenRouter tool-calling loop."""
+
+    @pytest.fixture
+    def player(self):
+        """Player with JSON tool results and its own MCP server."""
+        return OpenRouterToolsPlayer(
+            "RED",
+            {"model_id": "openai/gpt-4o", "name": "GPT", "tool_result_format": "json"},
+            mcp_server=CatanatronMCPServer("test_openrouter"),
+            api_key="test-key"
+        )
+
+    @pytest.fixture
+    def streaming_player(self, player):
+        """The player with streaming enabled."""
+        player.stream_responses = True
+        return player
+
+    @staticmethod
+    def _record_async_tool_calls(server):
+        """Wrap server.ahandle_tool_call; return the list of tool names it runs."""
+        calls = []
+        ahandle_tool_call = server.ahandle_tool_call
+
+        async def recording(tool_name, tool_input, result_format="json"):
+            calls.append(tool_name)
+            return await ahandle_tool_call(tool_name, tool_input, result_format)
+
+        server.ahandle_tool_call = recording
+        return calls
+
+    @staticmethod
+    def _script_responses(player, responses):
+        """Replace the HTTP request with canned responses; return the sent message lists."""
+        sent = []
+        responses = iter(responses)
+
+        async def fake_request(messages, tools, mcp_server=None, early_results=None):
+            sent.append(list(messages))
+            return next(responses)
+
+        player._make_request_with_retry = fake_request
+        return sent
+
+    def test_tool_results_matched_by_position(self, player, mock_game, mock_actions):
+        """Test read-only results keep their order when tool call ids are empty or repeated."""
+        sent = self._script_responses(player, [
+            _completion([
+                _tool_call("", "get_game_state"),
+                _tool_call("", "get_valid_actions"),
+            ]),
+            _completion([
+                _tool_call("dup", "select_action", '{"action_id": "end_turn"}'),
+            ]),
+        ])
+
+        selected_action = player.decide(mock_game, mock_actions)
+
+        tool_messages = [m for m in sent[1] if m["role"] == "tool"]
+        assert json.loads(tool_messages[0]["content"])["your_color"] == "RED"
+        assert json.loads(tool_messages[1]["content"])["num_actions"] == 2
+        assert selected_action is mock_actions[1]
+
+    def test_sync_callers_share_one_loop_and_client(self):
+        """Test sync callers on many threads share one loop, closed on shutdown."""
+        async def loop_and_client():
+            return asyncio.get_running_loop(), _get_openrouter_client("test-key")
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(_run_sync(loop_and_client())))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(results)) == 1
+        loop, client = results[0]
+        shutdown_sync_loop()
+
+        assert client.is_closed
+        assert loop.is_closed()
+
+    def test_stream_reassembles_tool_call_deltas(self, streaming_player, mock_game, mock_actions):
+        """Test split tool call deltas are joined and read-only calls start early."""
+        server = streaming_player.mcp_server
+        server.set_game_context(mock_game, "RED", mock_actions)
+        async_calls = self._record_async_tool_calls(server)
+        chunks = [
+            {"choices": [{"delta": {"content": "Checking "}}]},
+            _tool_delta(0, "call_a", "get_game", ""),
+            _tool_delta(0, None, "_state", '{"include_'),
+            _tool_delta(0, None, None, 'board": true}'),
+            _tool_delta(1, "call_b", "select_action", '{"action_id": "end_turn"}'),
+            {"choices": [{"delta": {"content": "the board"}, "finish_reason": "tool_calls"}]},
+            {"choices": [], "usage": {"prompt_tokens": 50, "completion_tokens": 5}},
+        ]
+
+        async def stream():
+            async with _mock_client([chunks]) as client:
+                early_results = {}
+                response = await streaming_player._stream_request(
+                    client, {"stream": True}, server, early_results
+                )
+                return response, early_results, await early_results[0]
+
+        response, early_results, early_state = asyncio.run(stream())
+
+        message = response["choices"][0]["message"]
+        assert message["content"] == "Checking the board"
+        assert [call["id"] for call in message["tool_calls"]] == ["call_a", "call_b"]
+        assert message["tool_calls"][0]["function"] == {
+            "name": "get_game_state", "arguments": '{"include_board": true}'
+        }
+        assert response["choices"][0]["finish_reason"] == "tool_calls"
+        assert response["usage"] == {"prompt_tokens": 50, "completion_tokens": 5}
+
+        # Only the read-only call was dispatched early, with its full arguments
+        assert list(early_results) == [0]
+        assert async_calls == ["get_game_state"]
+        assert "board" in json.loads(early_state)
+        assert server.selected_action_id is None
+
+    def test_stream_early_results_reused(
+        self, streaming_player, mock_game, mock_actions, monkeypatch
+    ):
+        """Test tools started mid-stream are not run again, and select_action never early."""
+        server = streaming_player.mcp_server
+        async_calls = self._record_async_tool_calls(server)
+        sync_calls = []
+        handle_tool_call = server.handle_tool_call
+        server.handle_tool_call = lambda tool_name, *args, **kwargs: (
+            sync_calls.append(tool_name) or handle_tool_call(tool_name, *args, **kwargs)
+        )
+        client = _mock_client([
+            [
+                _tool_delta(0, "call_a", "get_game_state", "{}"),
+                _tool_delta(1, "call_b", "get_valid_actions", "{}"),
+                {"choices": [{"delta": {}, "finish_reason": "tool_calls"}]},
+            ],
+            _SELECT_STREAM,
+        ])
+        monkeypatch.setattr(openrouter_tools_player, "_get_openrouter_client", lambda api_key: client)
+
+        selected_action = streaming_player.decide(mock_game, mock_actions)
+
+        # Each read-only tool ran once (early), select_action only synchronously
+        assert async_calls == ["get_game_state", "get_valid_actions"]
+        assert sync_calls.count("select_action") == 1
+        assert selected_action is mock_actions[1]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,168 @@
+"""
+Tests for the Catan prompt builder.
+
+Tests the compact prompt formats produced by CatanPromptBuilder.
+"""
+
+import json
+import pytest
+from collections import deque
+from unittest.mock import Mock
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import prompt_builder
+from src.prompt_builder import CatanPromptBuilder
+
+
+class TestPromptBuilder:
+    """Test suite for prompt formats."""
+
+    @pytest.fixture
+    def game(self):
+        """Create a mock Catanatron game at turn 7."""
+        game = Mock()
+        game.state = Mock(num_turns=7)
+        return game
+
+    @pytest.fixture
+    def player_state(self):
+        """Create an extracted player state."""
+        return {
+            "color": "RED",
+            "resources": {"wood": 2, "brick": 1, "sheep": 0, "wheat": 0, "ore": 3},
+            "victory_points": 5,
+            "settlements": 2,
+            "cities": 1,
+            "roads": 4,
+            "dev_cards": {"KNIGHT": 2},
+            "opponents": [{"color": "BLUE", "victory_points": 4, "resource_count": 6}],
+        }
+
+    def test_toon_layout(self, game, player_state):
+        """Test the TOON prompt layout."""
+        builder = CatanPromptBuilder(prompt_format="toon")
+
+        prompt = builder.build_action_prompt(game, player_state, ["ROLL", "END_TURN"], ["ROLL"])
+
+        assert prompt == (
+            "SETTLERS OF CATAN - Choose your action\n\n"
+            "Turn: 7 | You: RED\n\n"
+            "Resources{wood, brick, sheep, wheat, ore}:\n2, 1, 0, 0, 3\n\n"
+            "Buildings{settlements, cities, roads}:\n2, 1, 4\n\n"
+            "VP: 5\n"
+            "Dev Cards[2]: KNIGHT:2\n\n"
+            "Opponents[1]{color, vp, cards}:\nBLUE, 4, 6\n\n"
+            "Actions[2]:\n1. ROLL\n2. END_TURN\n\n"
+            "Recent moves: ROLL\n\n"
+            'Respond with JSON only: {"action": <action number>, "reason": "<at most 20 words>"}'
+        )
+
+    @pytest.mark.parametrize("recent_moves,vp,expected", [
+        (None, 5, "Choose your action carefully to maximize your chances of winning."),
+        ([], 9, "You're close to winning! Focus on reaching 10 victory points."),
+        (["A", "B", "C", "D"], 5, "Recent moves: B, C, D"),
+        (deque(["A", "B", "C", "D", "E"], maxlen=5), 5, "Recent moves: C, D, E"),
+        (["A"], 1, "Recent moves: A Early game - focus on expansion and resource generation."),
+    ])
+    def test_build_context(self, recent_moves, vp, expected):
+        """Test recent moves and victory-point hints are combined."""
+        builder = CatanPromptBuilder()
+
+        assert builder._build_context(recent_moves, {"victory_points": vp}) == expected
+
+    @pytest.mark.parametrize("game_state,turn", [
+        (None, 0),
+        (Mock(spec=["num_turns"], num_turns=4), 4),
+    ])
+    def test_toon_turn_lookup(self, game_state, turn):
+        """Test the turn comes from a bare state, or defaults to 0."""
+        builder = CatanPromptBuilder(prompt_format="toon")
+
+        prompt = builder.build_action_prompt(game_state, {}, ["ROLL"])
+
+        assert f"Turn: {turn} |" in prompt
+
+    def test_toon_missing_fields_default_to_zero(self, game):
+        """Test absent resources and buildings are shown as zeros."""
+        builder = CatanPromptBuilder(prompt_format="toon")
+
+        prompt = builder.build_action_prompt(game, {"resources": {"ore": 1}}, ["ROLL"])
+
+        assert "\n0, 0, 0, 0, 1\n" in prompt
+        assert "Buildings{settlements, cities, roads}:\n0, 0, 0\n" in prompt
+        assert "Opponents[0]{color, vp, cards}:\n\nActions[1]:\n1. ROLL\n\n" in prompt
+
+    def test_format_dispatch(self, game, player_state):
+        """Test per-call overrides and later default changes pick the right format."""
+        builder = CatanPromptBuilder(prompt_format="toon")
+
+        assert builder.build_action_prompt(game, player_state, ["ROLL"]).startswith("SETTLERS")
+        minified = builder.build_action_prompt(game, player_state, ["ROLL"], prompt_format="json-minified")
+        assert minified.startswith('{"game"')
+
+        builder.prompt_format = "json-minified"
+        assert builder.build_action_prompt(game, player_state, ["ROLL"]) == minified
+
+    def test_trade_prompt(self, player_state):
+        """Test trade options are numbered with give/receive summaries."""
+        builder = CatanPromptBuilder()
+        trades = [{"give": {"wood": 4}, "receive": {"ore": 1}}, {"give": {}, "receive": {}}]
+
+        prompt = builder.build_trade_prompt(player_state, trades)
+
+        assert "Your current resources: 2 wood, 1 brick, 3 ore\n" in prompt
+        assert "\n1. Give: 4 wood → Receive: 1 ore\n2. Give: none → Receive: none\n\n" in prompt
+
+    def test_json_minified_round_trips(self, game, player_state):
+        """Test the minified state parses back to the same data."""
+        builder = CatanPromptBuilder(prompt_format="json-minified")
+
+        prompt = builder.build_action_prompt(game, player_state, ["ROLL", "END_TURN"])
+        minified = prompt.split("\n", 1)[0]
+
+        assert '", "' not in minified and '": ' not in minified
+        data = json.loads(minified)
+        assert data["state"]["your_resources"] == player_state["resources"]
+        assert data["state"]["opponents"] == player_state["opponents"]
+        assert data["actions"] == ["1. ROLL", "2. END_TURN"]
+
+    def test_dumps_compact_matches_stdlib(self):
+        """Test the compact encoder agrees with json.dumps."""
+        data = {"a": [1, 2, {"b": None}], "c": "é"}
+
+        assert json.loads(prompt_builder._dumps_compact(data)) == data
+
+    def test_action_to_string_cached_and_unhashable(self):
+        """Test hashable actions are memoized and unhashable ones still format."""
+        builder = CatanPromptBuilder()
+        prompt_builder._action_to_string_cached.cache_clear()
+
+        assert builder._format_actions(["END_TURN", "END_TURN"]) == ["END_TURN", "END_TURN"]
+        assert prompt_builder._action_to_string_cached.cache_info().hits == 1
+        assert builder._action_to_string(["ROLL"]) == "['ROLL']"
+
+    def test_action_to_string_fallback(self):
+        """Test actions whose __str__ raises AttributeError get a basic description."""
+        class BrokenAction:
+            action_type = "ROLL"
+            color = "RED"
+
+            def __str__(self):
+                raise AttributeError("'str' object has no attribute 'value'")
+
+        assert CatanPromptBuilder()._action_to_string(BrokenAction()) == "ROLL for RED"
+
+    def test_action_strings_interned(self):
+        """Test equal actions map to one shared string object."""
+        builder = CatanPromptBuilder()
+
+        first, second = builder._format_actions([("BUILD_ROAD", 1), ("BUILD_ROAD", 1)])
+
+        assert first is second is sys.intern("('BUILD_ROAD', 1)")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
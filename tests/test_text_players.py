@@ -0,0 +1,236 @@
+"""
+Tests for text-based LLM players.
+
+Tests the decide() flow of BaseLLMPlayer with mock LLM responses.
+"""
+
+import asyncio
+import pytest
+from concurrent.futures import Future
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.players.text_based.base_player import BaseLLMPlayer, cached_prompt_tokens
+from src.players.text_based.claude_player import ClaudePlayer
+
+
+class MockLLMPlayer(BaseLLMPlayer):
+    """Mock text player that always answers with a fixed response."""
+
+    def __init__(self, color, response="2. Build a road", **kwargs):
+        super().__init__(color=color, model_name="MockModel", **kwargs)
+        self.response = response
+        self.query_count = 0
+
+    def query_llm(self, prompt):
+        """Mock LLM query."""
+        self.query_count += 1
+        return (self.response, 0.001, 100)
+
+
+class TestTextPlayers:
+    """Test suite for text player decisions."""
+
+    @pytest.fixture
+    def mock_game(self):
+        """Create a mock Catanatron game."""
+        game = Mock()
+        game.state = Mock()
+        game.state.num_turns = 3
+        game.state.color_to_index = {"RED": 0, "BLUE": 1}
+        game.state.player_state = {
+            "P0_WOOD_IN_HAND": 2,
+            "P0_BRICK_IN_HAND": 1,
+            "P0_ACTUAL_VICTORY_POINTS": 3,
+            "P0_KNIGHT_IN_HAND": 1,
+            "P1_ACTUAL_VICTORY_POINTS": 2,
+            "P1_ORE_IN_HAND": 4,
+        }
+        return game
+
+    @pytest.fixture
+    def mock_actions(self):
+        """Create mock actions."""
+        return ["BUILD_SETTLEMENT 1", "BUILD_ROAD (1, 2)", "END_TURN"]
+
+    def test_decide_parses_action_number(self, mock_game, mock_actions):
+        """Test the numbered action in the response is selected."""
+        player = MockLLMPlayer("RED")
+
+        selected_action = player.decide(mock_game, mock_actions)
+
+        assert selected_action == mock_actions[1]
+        assert player.query_count == 1
+        assert player.move_count == 1
+        assert player.total_tokens == 100
+
+    @pytest.mark.parametrize("response,expected", [
+        ('{"action": 3, "reason": "Ends turn 1 step early"}', 2),
+        ('```json\n{"action": "2", "reason": "road"}\n```', 1),
+        ('{"action": 9} ... Action: 1', 0),
+        ("I have 2 wood, so **Action: 3**", 2),
+        ("After 12 turns...\n2. Build a road", 1),
+        ("Option 12 is gone; take 3", 2),
+        ("Let's go with END_TURN", 2),
+    ])
+    def test_parse_response(self, mock_actions, response, expected):
+        """Test response parsing priorities."""
+        player = MockLLMPlayer("RED")
+
+        assert player._parse_response(response, mock_actions) == mock_actions[expected]
+
+    def test_parse_response_prefers_longest_description(self):
+        """Test the most specific action description wins."""
+        player = MockLLMPlayer("RED")
+        actions = ["END", "END_TURN"]
+
+        assert player._parse_response("I'll END_TURN now", actions) == "END_TURN"
+
+    def test_extract_player_state(self, mock_game):
+        """Test player and opponent fields are read from player_state."""
+        player = MockLLMPlayer("RED")
+
+        state = player._extract_player_state(mock_game)
+
+        assert state["resources"] == {"wood": 2, "brick": 1, "sheep": 0, "wheat": 0, "ore": 0}
+        assert state["victory_points"] == 3
+        assert state["settlements"] == 0
+        assert state["dev_cards"] == {"KNIGHT": 1}
+        assert state["opponents"] == [
+            {"color": "BLUE", "victory_points": 2, "resource_count": 4}
+        ]
+
+    def test_single_action_skips_llm(self, mock_game, mock_actions):
+        """Test a forced move is played without querying the LLM."""
+        player = MockLLMPlayer("RED")
+
+        selected_action = player.decide(mock_game, mock_actions[2:])
+
+        assert selected_action == mock_actions[2]
+        assert player.query_count == 0
+        assert player.move_count == 1
+        assert player.get_stats()["auto_moves"] == 1
+        assert list(player.recent_moves) == [mock_actions[2]]
+
+    def test_adecide_concurrent_players(self, mock_game, mock_actions):
+        """Test several players can decide concurrently."""
+        players = [MockLLMPlayer("RED", response=f"{i + 1}") for i in range(3)]
+
+        async def run():
+            return await asyncio.gather(
+                *[player.adecide(mock_game, mock_actions) for player in players]
+            )
+
+        selected = asyncio.run(run())
+
+        assert selected == mock_actions
+        assert all(player.move_count == 1 for player in players)
+
+    def test_prompt_cache_only_at_temperature_zero(self, mock_game, mock_actions):
+        """Test repeated prompts skip the LLM only for deterministic players."""
+        sampled = MockLLMPlayer("RED")
+        sampled.temperature = 0.7
+        deterministic = MockLLMPlayer("RED")
+        deterministic.temperature = 0
+        deterministic.prompt_builder = Mock(wraps=deterministic.prompt_builder)
+
+        for player in (sampled, deterministic):
+            player.decide(mock_game, mock_actions)
+            player.recent_moves.clear()
+            selected_action = player.decide(mock_game, mock_actions)
+            assert selected_action == mock_actions[1]
+
+        assert sampled.query_count == 2
+        assert deterministic.query_count == 1
+        assert deterministic.prompt_builder.build_action_prompt.call_count == 1
+        assert deterministic.get_stats()["cache_hits"] == 1
+        assert deterministic.total_tokens == 100
+
+    def test_cached_tokens_tracked(self, mock_game, mock_actions):
+        """Test cached prompt tokens reported by query_llm() are tracked."""
+        player = MockLLMPlayer("RED")
+        player.query_llm = Mock(return_value=("2", 0.001, 100, 60))
+
+        player.decide(mock_game, mock_actions)
+
+        stats = player.get_stats()
+        assert stats["cached_tokens"] == 60
+        assert stats["cached_token_share"] == 0.6
+
+    def test_cached_prompt_tokens_usage_formats(self):
+        """Test cached tokens are read from Anthropic and OpenAI-style usage."""
+        anthropic_message = Mock(usage=Mock(cache_read_input_tokens=40))
+        openai_response = {"usage": {"prompt_tokens_details": {"cached_tokens": 25}}}
+
+        assert cached_prompt_tokens(anthropic_message) == 40
+        assert cached_prompt_tokens(openai_response) == 25
+        assert cached_prompt_tokens(object()) == 0
+
+    def test_retry_then_fallback(self, mock_game, mock_actions):
+        """Test failing queries are retried, then a random action is used."""
+        player = MockLLMPlayer("RED", max_retries=2, retry_delay=0.0)
+        player.query_llm = Mock(side_effect=RuntimeError("503"))
+
+        selected_action = player.decide(mock_game, mock_actions)
+
+        assert selected_action in mock_actions
+        assert player.query_llm.call_count == 2
+        assert player.error_count == 2
+
+    def test_backoff_delay_exponential_with_cap(self):
+        """Test retry delays double per attempt, with jitter, up to the cap."""
+        player = MockLLMPlayer("RED", retry_delay=1.0)
+
+        for attempt, full_delay in enumerate([1.0, 2.0, 4.0, 8.0, 8.0]):
+            delay = player._backoff_delay(attempt)
+            assert full_delay / 2 <= delay <= full_delay
+
+    def test_claude_batch_requires_anthropic_model_id(self):
+        """Test batching refuses to fall back to the OpenRouter model id."""
+        with pytest.raises(ValueError, match="anthropic_model_id"):
+            ClaudePlayer(
+                "RED", client=Mock(), model_config={"model_id": "anthropic/claude-x"},
+                batch_dispatcher=Mock()
+            )
+
+    def test_claude_batch_query(self):
+        """Test batched queries use the native model id and half-price cost."""
+        message = SimpleNamespace(
+            content=[SimpleNamespace(type="text", text="2")],
+            usage=SimpleNamespace(input_tokens=1000, output_tokens=100, cache_read_input_tokens=40)
+        )
+        submitted = []
+
+        def submit(params):
+            submitted.append(params)
+            future = Future()
+            future.set_result(message)
+            return future
+
+        player = ClaudePlayer(
+            "RED",
+            client=Mock(),
+            model_config={
+                "model_id": "anthropic/claude-x",
+                "anthropic_model_id": "claude-x",
+                "input_cost": 0.003,
+                "output_cost": 0.015,
+            },
+            batch_dispatcher=SimpleNamespace(submit=submit)
+        )
+
+        text, cost, tokens, cached = player.query_llm("prompt")
+
+        assert submitted[0]["model"] == "claude-x"
+        assert submitted[0]["messages"] == [{"role": "user", "content": "prompt"}]
+        assert (text, tokens, cached) == ("2", 1100, 40)
+        assert cost == pytest.approx((1000 * 0.003 + 100 * 0.015) / 1000 * 0.5)
+        player.client.query.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,78 @@
+"""
+Unit tests for the TOON encoder.
+
+Tests tabular, record and fallback encodings of tool results.
+"""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from mcp import toon
+
+
+class TestToonEncoder:
+    """Test suite for TOON encoding."""
+
+    def test_scalar_fields(self):
+        """Test scalar values encode as key: value lines."""
+        result = toon.encode({"num_actions": 3, "your_color": "RED", "has_army": False})
+
+        assert result.splitlines() == [
+            "num_actions: 3",
+            "your_color: RED",
+            "has_army: false",
+        ]
+
+    def test_flat_record(self):
+        """Test flat dicts encode as a header plus one row."""
+        result = toon.encode({"resources": {"wood": 1, "brick": 0, "ore": 2}})
+
+        assert result == "resources{wood|brick|ore}: 1|0|2"
+
+    def test_list_of_records_is_tabular(self):
+        """Test lists of dicts emit the header once and one row per item."""
+        actions = [
+            {"action_id": "build_road_1", "details": {"value": 1}},
+            {"action_id": "end_turn", "details": {}},
+        ]
+        lines = toon.encode({"actions": actions}).splitlines()
+
+        assert lines[0] == "actions[2]{action_id|details.value}:"
+        assert lines[1] == "  build_road_1|1"
+        # Missing columns encode as empty cells
+        assert lines[2] == "  end_turn|"
+
+    def test_scalar_list_and_empty_list(self):
+        """Test lists of scalars are inlined and empty lists keep a length guard."""
+        result = toon.encode({"cards": ["knight", "monopoly"], "roads": []})
+
+        assert result.splitlines() == ["cards[2]: knight|monopoly", "roads[0]:"]
+
+    def test_nested_dict_is_indented(self):
+        """Test non-flat dicts nest with indentation."""
+        result = toon.encode({"your_state": {"victory_points": 4, "resources": {"wood": 2}}})
+
+        assert result.splitlines() == [
+            "your_state:",
+            "  victory_points: 4",
+            "  resources{wood}: 2",
+        ]
+
+    def test_delimiter_in_value_is_quoted(self):
+        """Test values containing the delimiter are JSON-quoted."""
+        result = toon.encode({"description": "a|b"})
+
+        assert result == 'description: "a|b"'
+
+    def test_irregular_list_falls_back_to_json(self):
+        """Test lists that aren't tabular stay JSON."""
+        result = toon.encode({"mixed": [{"a": [1, 2]}, 3]})
+
+        assert result == 'mixed: [{"a":[1,2]},3]'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,48 @@
+"""
+Tests for visualization data preparation.
+"""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analysis import head_to_head_matrix
+from src.visualizations import games_to_frames
+
+
+class TestGamesToFrames:
+    """Test suite for games_to_frames."""
+
+    @pytest.fixture
+    def games(self):
+        """One decided game and one without a winner."""
+        players = ["claude:RED", "gpt:BLUE"]
+        final_scores = {"claude:RED": {"vp": 10}, "gpt:BLUE": {"vp": 7}}
+        return [
+            {"session_id": "g1", "winner": "claude:RED", "players": players,
+             "final_scores": final_scores, "moves": []},
+            {"session_id": "g2", "winner": None, "players": players,
+             "final_scores": final_scores, "moves": []},
+        ]
+
+    def test_missing_winner_stays_none(self, games):
+        """Test a game with no winner round-trips through the frame as None."""
+        games_df, _ = games_to_frames(games)
+
+        records = games_df.to_dict("records")
+
+        assert [r["winner"] for r in records] == ["claude:RED", None]
+
+    def test_head_to_head_skips_game_without_winner(self, games):
+        """Test the per-game records feed head_to_head_matrix without crashing."""
+        games_df, _ = games_to_frames(games)
+
+        matrix = head_to_head_matrix(games_df.to_dict("records"))
+
+        assert matrix.shape == (2, 2)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])